@@ -1,54 +1,49 @@
 """FastAPI application and routes."""
 
+import asyncio
+import hashlib
+import json
 import logging
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
 
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 
-from ..config import ConfigManager
+from ..config import get_config_manager
 from ..core.ai_inference import MultiProviderInferenceService
 from ..core.bookmark_manager import BookmarkManager
 from ..core.content_analyzer import ContentAnalyzer
 from ..core.ingestion_service import IngestionService
 from ..core.recall_service import RecallService
 from ..core.storage_manager import StorageManager
-from ..models.config import AppConfig, EnvSettings
+from .middleware import ExtensionAuthMiddleware, FastCORSMiddleware
+from .state import state as app_state
+from .static_files import CachedStaticFiles
 
 logger = logging.getLogger(__name__)
 
-# Global state (will be initialized in lifespan)
-storage_manager: StorageManager = None
-bookmark_manager: BookmarkManager = None
-content_analyzer: ContentAnalyzer = None
-config_manager: ConfigManager = None
-runtime_config: AppConfig = None
-runtime_env_settings: EnvSettings = None
-ingestion_service: IngestionService = None
-recall_service: RecallService = None
+
+async def _close_clients(*services) -> None:
+    """Close the services' HTTP clients, ignoring individual failures."""
+    await asyncio.gather(*(service.aclose() for service in services), return_exceptions=True)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    global storage_manager, bookmark_manager, content_analyzer
-    global config_manager, runtime_config, runtime_env_settings, ingestion_service, recall_service
-
     # Startup
     logger.info("Starting YoshiBookmark API...")
 
     # Load configuration
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     try:
         app_config = config_manager.load_app_config()
         env_settings = config_manager.load_env_settings()
-        runtime_config = app_config
-        runtime_env_settings = env_settings
     except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
+        logger.error("Failed to load configuration: %s", e)
         raise
 
     # Seed provider key arrays from env settings for compatibility.
@@ -61,16 +56,47 @@ async def lifespan(app: FastAPI):
     if env_settings.google_api_key and not app_config.gemini_api_keys:
         app_config.gemini_api_keys = [env_settings.google_api_key]
 
-    # Initialize storage manager
+    # Initialize storage manager. Loading bookmark files is the slow part of
+    # startup, so it runs concurrently with the client pre-warm below.
     storage_manager = StorageManager()
-    await storage_manager.initialize(app_config.storage_locations)
-
-    # Initialize bookmark manager
-    bookmark_manager = BookmarkManager(storage_manager)
+    storage_task = asyncio.create_task(
+        storage_manager.initialize(app_config.storage_locations)
+    )
 
     # Initialize content analyzer
     content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
     inference_service = MultiProviderInferenceService(app_config)
+    recall_service = RecallService(
+        config=app_config,
+        storage_manager=storage_manager,
+        env_settings=env_settings,
+    )
+
+    # Pre-warm HTTP clients so the first capture/recall request does not pay
+    # client construction (SSL context, CA bundle, SDK import) on its own latency,
+    # and load small static assets into memory.
+    prewarm_task = asyncio.gather(
+        content_analyzer.prewarm(),
+        inference_service.prewarm(),
+        recall_service.prewarm(),
+        asyncio.to_thread(static_files.preload),
+        return_exceptions=True,
+    )
+
+    try:
+        await storage_task
+    except BaseException:
+        # Let the pre-warm settle, then release its clients before startup fails.
+        await prewarm_task
+        await _close_clients(content_analyzer, inference_service, recall_service)
+        raise
+    for result in await prewarm_task:
+        if isinstance(result, Exception):
+            logger.warning("Startup pre-warm failed: %s", result)
+
+    # Initialize bookmark manager
+    bookmark_manager = BookmarkManager(storage_manager)
+
     ingestion_service = IngestionService(
         config=app_config,
         bookmark_manager=bookmark_manager,
@@ -78,20 +104,26 @@ async def lifespan(app: FastAPI):
         content_analyzer=content_analyzer,
         inference_service=inference_service,
     )
-    recall_service = RecallService(
-        config=app_config,
-        storage_manager=storage_manager,
-        env_settings=env_settings,
-    )
+
+    # Publish services for the routers.
+    app_state.config_manager = config_manager
+    app_state.runtime_config = app_config
+    app_state.runtime_env_settings = env_settings
+    app_state.storage_manager = storage_manager
+    app_state.bookmark_manager = bookmark_manager
+    app_state.content_analyzer = content_analyzer
+    app_state.ingestion_service = ingestion_service
+    app_state.recall_service = recall_service
 
     logger.info(
-        f"Initialized with {len(storage_manager.storage_locations)} storage location(s)"
+        "Initialized with %s storage location(s)", len(storage_manager.storage_locations)
     )
 
     yield
 
     # Shutdown
     logger.info("Shutting down YoshiBookmark API...")
+    await _close_clients(content_analyzer, inference_service, recall_service)
 
 
 # Create FastAPI app
@@ -102,17 +134,35 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS middleware
+
+def ingest_auth_settings() -> Tuple[bool, Optional[bytes]]:
+    """Return (auth required, expected token bytes) for ingestion endpoints."""
+    runtime_config = app_state.runtime_config
+    if runtime_config and not runtime_config.ingest_require_auth:
+        return False, None
+    return True, app_state.extension_token_bytes
+
+
+# CORS origins from config.yaml
 cors_origins: list[str] = []
 try:
-    boot_cfg = ConfigManager().load_app_config()
+    boot_cfg = get_config_manager().load_app_config()
     cors_origins.extend(boot_cfg.extension_allowed_origins)
 except Exception:
     # Keep startup robust when config is not available in test/import contexts.
     pass
 
+# Middleware stack. Starlette makes the last-added middleware the outermost one,
+# so registrations below run inner -> outer. Resulting request flow:
+#
+#   FastCORSMiddleware -> ExtensionAuthMiddleware -> routes
+#
+# CORS stays outermost so preflight requests (including disallowed origins) are
+# answered before the auth check, route matching, or body validation run, and
+# so auth errors still carry CORS headers. Register new middleware before CORS.
+app.add_middleware(ExtensionAuthMiddleware, settings_getter=ingest_auth_settings)
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=cors_origins,
     allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
     allow_credentials=True,
@@ -121,7 +171,8 @@ app.add_middleware(
 )
 
 static_dir = Path(__file__).resolve().parent.parent / "web" / "static"
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+static_files = CachedStaticFiles(directory=static_dir)
+app.mount("/static", static_files, name="static")
 
 # Import and include routers
 from .bookmarks import router as bookmarks_router
@@ -135,19 +186,40 @@ app.include_router(ingest_router, prefix="/api/v1", tags=["ingest"])
 app.include_router(recall_router, prefix="/api/v1", tags=["recall"])
 
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
+# The root payload never changes, so it is encoded once at import.
+_ROOT_BODY = json.dumps(
+    {
         "name": "YoshiBookmark API",
         "version": "0.1.0",
         "docs": "/docs",
         "health": "/api/v1/health",
         "app": "/app",
     }
+).encode("utf-8")
+
+
+@app.get("/")
+async def root():
+    """Root endpoint."""
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def _index_document() -> Tuple[bytes, str]:
+    """Read the web app shell once and derive its ETag."""
+    body = (static_dir / "index.html").read_bytes()
+    return body, '"%s"' % hashlib.sha256(body).hexdigest()[:32]
 
 
 @app.get("/app")
-async def web_app():
+async def web_app(request: Request):
     """Serve web application shell."""
-    return FileResponse(static_dir / "index.html")
+    body, etag = _index_document()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
@@ -1,30 +1,35 @@
 """Bookmark CRUD endpoints."""
 
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, List, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field, HttpUrl, ValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, ValidationError
 
 from ..core.bookmark_manager import BookmarkAlreadyDeletedError, BookmarkNotFoundError
 from ..core.storage_manager import StorageError
 from ..models.bookmark import Bookmark
+from .state import state
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_BOOKMARK_ADAPTER = TypeAdapter(Bookmark)
+# Bookmarks encoded per streamed chunk; keeps chunk overhead low without
+# buffering the whole result.
+_NDJSON_BATCH_SIZE = 100
+
 
 def _resolve_storage_name(
     requested_storage: Optional[str],
     for_create: bool = False,
 ) -> Optional[str]:
     """Resolve effective storage based on runtime mode and request."""
-    from . import runtime_config, storage_manager
-
-    current_storage = storage_manager.get_current_storage_name()
+    current_storage = state.storage_manager.get_current_storage_name()
 
-    if runtime_config and runtime_config.storage_mode == "onedrive_only":
+    if state.runtime_config and state.runtime_config.storage_mode == "onedrive_only":
         if current_storage is None:
             raise HTTPException(status_code=500, detail="Primary OneDrive storage is not available")
 
@@ -79,6 +84,18 @@ class ErrorResponse(BaseModel):
     details: Optional[dict] = None
 
 
+class BookmarkListResponse(BaseModel):
+    """Bookmark list payload.
+
+    Declared as the response model so FastAPI serializes it straight to JSON
+    bytes with pydantic-core instead of walking it with jsonable_encoder.
+    """
+
+    bookmarks: List[Bookmark]
+    total: int
+    storage: str
+
+
 # Endpoints
 @router.post("/bookmarks", response_model=Bookmark, status_code=201)
 async def create_bookmark(request: CreateBookmarkRequest):
@@ -87,9 +104,6 @@ async def create_bookmark(request: CreateBookmarkRequest):
     Automatically fetches webpage content and suggests title/keywords if not provided.
     """
     try:
-        # Import managers dynamically
-        from . import bookmark_manager, content_analyzer, storage_manager
-
         # Determine storage location
         storage_location = _resolve_storage_name(
             request.storage_location,
@@ -104,7 +118,7 @@ async def create_bookmark(request: CreateBookmarkRequest):
 
         if not title or not keywords:
             # Analyze URL
-            analysis = await content_analyzer.analyze_url(str(request.url))
+            analysis = await state.content_analyzer.analyze_url(str(request.url))
 
             if not title:
                 title = analysis["title"]
@@ -113,7 +127,7 @@ async def create_bookmark(request: CreateBookmarkRequest):
                 keywords = analysis["keywords"]
 
         # Create bookmark
-        bookmark = await bookmark_manager.create_bookmark(
+        bookmark = await state.bookmark_manager.create_bookmark(
             url=str(request.url),
             title=title,
             storage_location=storage_location,
@@ -132,27 +146,33 @@ async def create_bookmark(request: CreateBookmarkRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create bookmark: {e}")
+        logger.error("Failed to create bookmark: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
 
 
-@router.get("/bookmarks", response_model=dict)
+@router.get("/bookmarks", response_model=BookmarkListResponse)
 async def list_bookmarks(
     storage: Optional[str] = Query(None, description="Storage location name"),
     include_deleted: bool = Query(False, description="Include soft-deleted bookmarks"),
     folder: Optional[str] = Query(None, description="Filter by folder path"),
+    stream: Optional[Literal["ndjson"]] = Query(
+        None, description="Stream one bookmark per line instead of a single JSON object"
+    ),
 ):
     """List bookmarks with optional filters."""
     try:
-        from . import bookmark_manager
-
         resolved_storage = _resolve_storage_name(storage)
-        bookmarks = bookmark_manager.list_bookmarks(
+        bookmarks = state.bookmark_manager.list_bookmarks(
             storage_name=resolved_storage,
             include_deleted=include_deleted,
             folder_path=folder,
         )
 
+        if stream == "ndjson":
+            return StreamingResponse(
+                _ndjson_lines(bookmarks), media_type="application/x-ndjson"
+            )
+
         return {
             "bookmarks": bookmarks,
             "total": len(bookmarks),
@@ -162,10 +182,17 @@ async def list_bookmarks(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list bookmarks: {e}")
+        logger.error("Failed to list bookmarks: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
 
 
+async def _ndjson_lines(bookmarks: List[Bookmark]) -> AsyncIterator[bytes]:
+    """Encode bookmarks as newline-delimited JSON in small batches."""
+    for start in range(0, len(bookmarks), _NDJSON_BATCH_SIZE):
+        batch = bookmarks[start:start + _NDJSON_BATCH_SIZE]
+        yield b"".join(_BOOKMARK_ADAPTER.dump_json(bookmark) + b"\n" for bookmark in batch)
+
+
 @router.get("/bookmarks/{bookmark_id}", response_model=Bookmark)
 async def get_bookmark(
     bookmark_id: str,
@@ -173,10 +200,8 @@ async def get_bookmark(
 ):
     """Get a specific bookmark by ID."""
     try:
-        from . import bookmark_manager
-
         resolved_storage = _resolve_storage_name(storage)
-        bookmark = await bookmark_manager.get_bookmark(bookmark_id, resolved_storage)
+        bookmark = await state.bookmark_manager.get_bookmark(bookmark_id, resolved_storage)
         return bookmark
 
     except BookmarkNotFoundError as e:
@@ -184,7 +209,7 @@ async def get_bookmark(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get bookmark {bookmark_id}: {e}")
+        logger.error("Failed to get bookmark %s: %s", bookmark_id, e)
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
 
 
@@ -196,10 +221,8 @@ async def update_bookmark(
 ):
     """Update a bookmark."""
     try:
-        from . import bookmark_manager
-
         resolved_storage = _resolve_storage_name(storage)
-        bookmark = await bookmark_manager.update_bookmark(
+        bookmark = await state.bookmark_manager.update_bookmark(
             bookmark_id=bookmark_id,
             storage_name=resolved_storage,
             title=request.title,
@@ -219,7 +242,7 @@ async def update_bookmark(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update bookmark {bookmark_id}: {e}")
+        logger.error("Failed to update bookmark %s: %s", bookmark_id, e)
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
 
 
@@ -231,22 +254,20 @@ async def delete_bookmark(
 ):
     """Delete a bookmark (soft delete by default, hard delete if hard=true)."""
     try:
-        from . import bookmark_manager
-
         resolved_storage = _resolve_storage_name(storage)
 
         if hard:
             # Get bookmark first to return it
-            bookmark = await bookmark_manager.get_bookmark(bookmark_id, resolved_storage)
+            bookmark = await state.bookmark_manager.get_bookmark(bookmark_id, resolved_storage)
 
             # Hard delete
-            await bookmark_manager.hard_delete_bookmark(bookmark_id, resolved_storage)
+            await state.bookmark_manager.hard_delete_bookmark(bookmark_id, resolved_storage)
 
             # Return the bookmark that was deleted
             return bookmark
         else:
             # Soft delete
-            bookmark = await bookmark_manager.delete_bookmark(bookmark_id, resolved_storage)
+            bookmark = await state.bookmark_manager.delete_bookmark(bookmark_id, resolved_storage)
             return bookmark
 
     except BookmarkNotFoundError as e:
@@ -259,7 +280,7 @@ async def delete_bookmark(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete bookmark {bookmark_id}: {e}")
+        logger.error("Failed to delete bookmark %s: %s", bookmark_id, e)
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
 
 
@@ -270,10 +291,8 @@ async def restore_bookmark(
 ):
     """Restore a soft-deleted bookmark."""
     try:
-        from . import bookmark_manager
-
         resolved_storage = _resolve_storage_name(storage)
-        bookmark = await bookmark_manager.restore_bookmark(bookmark_id, resolved_storage)
+        bookmark = await state.bookmark_manager.restore_bookmark(bookmark_id, resolved_storage)
         return bookmark
 
     except BookmarkNotFoundError as e:
@@ -284,7 +303,7 @@ async def restore_bookmark(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to restore bookmark {bookmark_id}: {e}")
+        logger.error("Failed to restore bookmark %s: %s", bookmark_id, e)
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
 
 
@@ -295,10 +314,8 @@ async def track_bookmark_access(
 ):
     """Track bookmark access (updates last_accessed timestamp)."""
     try:
-        from . import bookmark_manager
-
         resolved_storage = _resolve_storage_name(storage)
-        bookmark = await bookmark_manager.track_access(bookmark_id, resolved_storage)
+        bookmark = await state.bookmark_manager.track_access(bookmark_id, resolved_storage)
         return bookmark
 
     except BookmarkNotFoundError as e:
@@ -306,5 +323,5 @@ async def track_bookmark_access(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to track access for {bookmark_id}: {e}")
+        logger.error("Failed to track access for %s: %s", bookmark_id, e)
         raise HTTPException(status_code=500, detail=f"Internal error: {e}")
@@ -3,177 +3,133 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Header, HTTPException
-from pydantic import BaseModel, Field, HttpUrl
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+
+from ..models.ingest import IngestCommitRequest, IngestPreviewRequest, IngestQuickSaveRequest
+from .state import state
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-class IngestPreviewRequest(BaseModel):
-    """Request payload for ingestion preview."""
+class ProviderStatus(BaseModel):
+    """Configuration status of one inference provider."""
+
+    provider_id: str
+    enabled: bool
+    model: str
+    has_endpoint: bool
+    key_count: int
 
-    url: HttpUrl
-    page_title: Optional[str] = None
-    page_excerpt: Optional[str] = None
-    selected_text: Optional[str] = None
-    user_note: Optional[str] = None
-    storage_location: Optional[str] = None
-    tags: Optional[List[str]] = None
-    folder_path: Optional[str] = None
-    source_app: Optional[str] = None
-    source_project: Optional[str] = None
 
+class ProviderStatusResponse(BaseModel):
+    """Response payload for provider chain status."""
 
-class IngestCommitRequest(BaseModel):
-    """Commit payload from a previously generated preview."""
+    providers: List[ProviderStatus]
 
-    preview_id: str
-    title: Optional[str] = None
-    description: Optional[str] = None
-    keywords: Optional[List[str]] = Field(None, max_length=4)
-    tags: Optional[List[str]] = None
-    folder_path: Optional[str] = None
 
+@dataclass(slots=True)
+class RequestContext:
+    """Storage routing snapshot taken once per ingest request."""
 
-class IngestQuickSaveRequest(BaseModel):
-    """Quick-save request payload."""
+    storage: str
+    mode: str
 
-    url: HttpUrl
-    page_title: Optional[str] = None
-    page_excerpt: Optional[str] = None
-    selected_text: Optional[str] = None
-    user_note: Optional[str] = None
-    storage_location: Optional[str] = None
-    source_app: Optional[str] = None
-    source_project: Optional[str] = None
+    def resolve_storage(self, requested_storage: Optional[str]) -> str:
+        """Return the storage to write to, enforcing OneDrive-only mode."""
+        if self.mode == "onedrive_only":
+            if requested_storage and requested_storage != self.storage:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        f"OneDrive-only mode is active. Use primary storage '{self.storage}' "
+                        "or omit storage parameter."
+                    ),
+                )
+            return self.storage
 
+        return requested_storage or self.storage
 
-def _resolve_storage_name(requested_storage: Optional[str]) -> str:
-    from . import runtime_config, storage_manager
 
-    current_storage = storage_manager.get_current_storage_name()
+async def get_request_context() -> RequestContext:
+    """Resolve current storage and storage mode for an ingest request."""
+    current_storage = state.storage_manager.get_current_storage_name()
     if current_storage is None:
         raise HTTPException(status_code=500, detail="No writable storage configured")
 
-    if runtime_config and runtime_config.storage_mode == "onedrive_only":
-        if requested_storage and requested_storage != current_storage:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    f"OneDrive-only mode is active. Use primary storage '{current_storage}' "
-                    "or omit storage parameter."
-                ),
-            )
-        return current_storage
-
-    return requested_storage or current_storage
-
-
-def _require_extension_auth(
-    authorization: Optional[str],
-    x_extension_token: Optional[str],
-) -> None:
-    from . import runtime_config, runtime_env_settings
-
-    if runtime_config and not runtime_config.ingest_require_auth:
-        return
-
-    expected = runtime_env_settings.extension_api_token if runtime_env_settings else None
-    if not expected:
-        raise HTTPException(status_code=503, detail="Ingestion auth token is not configured")
-
-    presented = x_extension_token
-    if not presented and authorization and authorization.lower().startswith("bearer "):
-        presented = authorization[7:]
-
-    if not presented or presented != expected:
-        raise HTTPException(status_code=401, detail="Invalid ingestion token")
+    runtime_config = state.runtime_config
+    mode = runtime_config.storage_mode if runtime_config else "multi"
+    return RequestContext(storage=current_storage, mode=mode)
 
 
 @router.post("/ingest/preview", response_model=dict)
 async def ingest_preview(
     request: IngestPreviewRequest,
-    authorization: Optional[str] = Header(default=None),
-    x_extension_token: Optional[str] = Header(default=None),
+    ctx: Annotated[RequestContext, Depends(get_request_context)],
 ):
     """Create metadata suggestions from capture context without persisting bookmark."""
     try:
-        from . import ingestion_service
-
-        _require_extension_auth(authorization, x_extension_token)
-        storage = _resolve_storage_name(request.storage_location)
-        preview = await ingestion_service.create_preview(
-            payload=request.model_dump(mode="json"),
+        storage = ctx.resolve_storage(request.storage_location)
+        preview = await state.ingestion_service.create_preview(
+            payload=request,
             storage_location=storage,
         )
         return preview
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create ingest preview: {e}")
+        logger.error("Failed to create ingest preview: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create preview: {e}")
 
 
 @router.post("/ingest/commit", response_model=dict)
-async def ingest_commit(
-    request: IngestCommitRequest,
-    authorization: Optional[str] = Header(default=None),
-    x_extension_token: Optional[str] = Header(default=None),
-):
+async def ingest_commit(request: IngestCommitRequest):
     """Commit a previously generated preview into bookmark storage."""
     try:
-        from . import ingestion_service
-
-        _require_extension_auth(authorization, x_extension_token)
-        bookmark = await ingestion_service.commit_preview(
+        bookmark = await state.ingestion_service.commit_preview(
             preview_id=request.preview_id,
-            final_data=request.model_dump(mode="json"),
+            final_data=request,
         )
         return {"bookmark": bookmark, "status": "committed"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to commit ingest preview: {e}")
+        logger.error("Failed to commit ingest preview: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to commit preview: {e}")
 
 
 @router.post("/ingest/quick-save", response_model=dict)
 async def ingest_quick_save(
     request: IngestQuickSaveRequest,
-    authorization: Optional[str] = Header(default=None),
-    x_extension_token: Optional[str] = Header(default=None),
+    ctx: Annotated[RequestContext, Depends(get_request_context)],
 ):
     """Save a bookmark immediately from capture context."""
     try:
-        from . import ingestion_service
-
-        _require_extension_auth(authorization, x_extension_token)
-        storage = _resolve_storage_name(request.storage_location)
-        bookmark = await ingestion_service.quick_save(
-            payload=request.model_dump(mode="json"),
+        storage = ctx.resolve_storage(request.storage_location)
+        bookmark = await state.ingestion_service.quick_save(
+            payload=request,
             storage_location=storage,
         )
         return {"bookmark": bookmark, "status": "saved"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to quick-save ingest capture: {e}")
+        logger.error("Failed to quick-save ingest capture: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to quick-save: {e}")
 
 
-@router.get("/ingest/providers/status", response_model=dict)
+@router.get("/ingest/providers/status", response_model=ProviderStatusResponse)
 async def ingest_provider_status():
     """Get ingestion provider chain status."""
     try:
-        from . import ingestion_service
-
-        return {"providers": ingestion_service.get_provider_status()}
+        return {"providers": state.ingestion_service.get_provider_status()}
     except Exception as e:
-        logger.error(f"Failed to fetch ingest provider status: {e}")
+        logger.error("Failed to fetch ingest provider status: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch provider status: {e}")
 
 
@@ -181,11 +137,9 @@ async def ingest_provider_status():
 async def ingest_preview_diagnostics(preview_id: str):
     """Get provider trace for a preview id."""
     try:
-        from . import ingestion_service
-
-        return {"preview_id": preview_id, "provider_trace": ingestion_service.get_preview_trace(preview_id)}
+        return {"preview_id": preview_id, "provider_trace": state.ingestion_service.get_preview_trace(preview_id)}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to fetch preview diagnostics: {e}")
+        logger.error("Failed to fetch preview diagnostics: %s", e)
         raise HTTPException(status_code=404, detail=f"Diagnostics unavailable: {e}")
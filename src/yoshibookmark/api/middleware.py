@@ -0,0 +1,147 @@
+"""Pure ASGI middleware for the API application."""
+
+import hmac
+import json
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Returns (auth required, expected token as UTF-8 bytes) from the live runtime settings.
+AuthSettingsGetter = Callable[[], Tuple[bool, Optional[bytes]]]
+
+INGEST_WRITE_PATHS = frozenset(
+    {
+        "/api/v1/ingest/preview",
+        "/api/v1/ingest/commit",
+        "/api/v1/ingest/quick-save",
+    }
+)
+
+
+class _PrebuiltJSONError:
+    """FastAPI-style ``{"detail": ...}`` error with its body and headers encoded once."""
+
+    __slots__ = ("status_code", "headers", "body")
+
+    def __init__(self, status_code: int, detail: str):
+        self.status_code = status_code
+        self.body = json.dumps({"detail": detail}).encode("utf-8")
+        self.headers = (
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self.body)).encode("ascii")),
+        )
+
+    async def send(self, send: Send) -> None:
+        # Outer middleware (e.g. CORS) appends to the headers list in place, so
+        # each response gets fresh message dicts around the shared bytes.
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": list(self.headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+# Rejections are answered from prebuilt bytes; misconfigured extensions can
+# retry at a high rate and should not cost an encode per attempt.
+_UNAUTHORIZED = _PrebuiltJSONError(401, "Invalid ingestion token")
+_TOKEN_NOT_CONFIGURED = _PrebuiltJSONError(503, "Ingestion auth token is not configured")
+
+
+class ExtensionAuthMiddleware:
+    """Enforce the extension token on ingestion write endpoints.
+
+    Implemented as pure ASGI so the token is read straight from the raw scope
+    headers, without building Starlette Request/Response objects per request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings_getter: AuthSettingsGetter,
+        protected_paths: Iterable[str] = INGEST_WRITE_PATHS,
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            settings_getter: Callable returning (auth required, expected token bytes)
+            protected_paths: Exact request paths that require the token on POST
+        """
+        self.app = app
+        self.settings_getter = settings_getter
+        self.protected_paths = frozenset(protected_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in self.protected_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        require_auth, expected = self.settings_getter()
+        if not require_auth:
+            await self.app(scope, receive, send)
+            return
+
+        if not expected:
+            await _TOKEN_NOT_CONFIGURED.send(send)
+            return
+
+        presented = _presented_token(scope["headers"])
+        if presented is None or not hmac.compare_digest(presented, expected):
+            await _UNAUTHORIZED.send(send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with set-based origin lookup.
+
+    Configured origins are held in a frozenset and checked before the
+    localhost regex, so the common extension origin is an O(1) hit.
+    """
+
+    def __init__(
+        self, app: ASGIApp, allow_origins: Iterable[str] = (), **kwargs: Any
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            allow_origins: Exact origins to allow
+            **kwargs: Remaining CORSMiddleware options
+        """
+        origins = frozenset(allow_origins)
+        super().__init__(app, allow_origins=origins, **kwargs)
+        self.allow_origins = origins
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self.allow_origins:
+            return True
+        return self.allow_origin_regex is not None and bool(
+            self.allow_origin_regex.fullmatch(origin)
+        )
+
+
+def _presented_token(headers: List[Tuple[bytes, bytes]]) -> Optional[bytes]:
+    """Extract the token from X-Extension-Token or a Bearer Authorization header."""
+    extension_token = None
+    authorization = None
+    for name, value in headers:
+        if name == b"x-extension-token":
+            extension_token = value
+        elif name == b"authorization":
+            authorization = value
+
+    if extension_token:
+        return extension_token
+    if authorization and authorization[:7].lower() == b"bearer ":
+        return authorization[7:]
+    return None
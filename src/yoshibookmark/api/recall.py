@@ -1,10 +1,13 @@
 """Recall endpoints for natural-language retrieval."""
 
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from ..models.bookmark import Bookmark
+from .state import state
+
 router = APIRouter()
 
 
@@ -16,14 +19,41 @@ class RecallQueryRequest(BaseModel):
     scope: Literal["all", "current"] = "all"
 
 
-@router.post("/recall/query", response_model=dict)
+class RecallScoreBreakdown(BaseModel):
+    """Per-signal scores behind a recall result."""
+
+    keyword: float
+    semantic: float
+
+
+class RecallResult(BaseModel):
+    """Single ranked recall hit."""
+
+    bookmark: Bookmark
+    score: float
+    score_breakdown: RecallScoreBreakdown
+    snippet: str
+    highlights: List[str]
+
+
+class RecallQueryResponse(BaseModel):
+    """Response payload for recall query."""
+
+    query: str
+    mode: Literal["hybrid", "keyword_only"]
+    semantic_available: bool
+    fallback_reason: Optional[str] = None
+    results: List[RecallResult]
+    total_returned: int
+    searched_storage_names: List[str]
+
+
+@router.post("/recall/query", response_model=RecallQueryResponse)
 async def recall_query(request: RecallQueryRequest):
     """Recall bookmarks from natural-language query."""
     try:
-        from . import recall_service, storage_manager
-
-        current_storage = storage_manager.get_current_storage_name()
-        return await recall_service.query(
+        current_storage = state.storage_manager.get_current_storage_name()
+        return await state.recall_service.query(
             query_text=request.query,
             limit=request.limit,
             scope=request.scope,
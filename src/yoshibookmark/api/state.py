@@ -0,0 +1,47 @@
+"""Shared runtime state for API routers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..config import ConfigManager
+    from ..core.bookmark_manager import BookmarkManager
+    from ..core.content_analyzer import ContentAnalyzer
+    from ..core.ingestion_service import IngestionService
+    from ..core.recall_service import RecallService
+    from ..core.storage_manager import StorageManager
+    from ..models.config import AppConfig, EnvSettings
+
+
+class AppState:
+    """Service instances wired up by the application lifespan.
+
+    Routers import the module-level ``state`` once and read attributes at
+    request time, so handlers always see the live instances.
+    """
+
+    def __init__(self) -> None:
+        self.storage_manager: Optional[StorageManager] = None
+        self.bookmark_manager: Optional[BookmarkManager] = None
+        self.content_analyzer: Optional[ContentAnalyzer] = None
+        self.config_manager: Optional[ConfigManager] = None
+        self.runtime_config: Optional[AppConfig] = None
+        self.runtime_env_settings = None
+        self.ingestion_service: Optional[IngestionService] = None
+        self.recall_service: Optional[RecallService] = None
+
+    @property
+    def runtime_env_settings(self) -> Optional[EnvSettings]:
+        """Environment settings loaded from .env."""
+        return self._runtime_env_settings
+
+    @runtime_env_settings.setter
+    def runtime_env_settings(self, value: Optional[EnvSettings]) -> None:
+        self._runtime_env_settings = value
+        # Encode the ingestion token once so auth checks compare raw header bytes.
+        token = value.extension_api_token if value else None
+        self.extension_token_bytes: Optional[bytes] = token.encode("utf-8") if token else None
+
+
+state = AppState()
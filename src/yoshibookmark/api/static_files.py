@@ -0,0 +1,92 @@
+"""Static asset serving with an in-memory cache for small files."""
+
+import logging
+import os
+import stat
+from typing import Dict, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CACHED_FILE_SIZE = 256 * 1024
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that serves preloaded small assets from memory.
+
+    preload() reads every regular file up to ``max_cached_file_size`` bytes
+    once, together with the headers FileResponse would send (content type,
+    ETag, Last-Modified). Cached paths are then answered without a stat or
+    open; anything else falls through to StaticFiles. Assets are shipped with
+    the package and do not change while the server runs.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_cached_file_size: int = DEFAULT_MAX_CACHED_FILE_SIZE,
+        **kwargs,
+    ):
+        """Initialize static file app.
+
+        Args:
+            *args: Positional StaticFiles arguments
+            max_cached_file_size: Largest file size (bytes) kept in memory
+            **kwargs: Keyword StaticFiles arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.max_cached_file_size = max_cached_file_size
+        self._cache: Dict[str, Tuple[bytes, Dict[str, str]]] = {}
+
+    def preload(self) -> int:
+        """Read small static files into memory (blocking; run in a thread).
+
+        Returns:
+            Number of cached files
+        """
+        cache: Dict[str, Tuple[bytes, Dict[str, str]]] = {}
+        for directory in self.all_directories:
+            for root, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    full_path = os.path.join(root, filename)
+                    # Symlinks are left to lookup_path(), which applies the
+                    # follow_symlink policy per request.
+                    if not self.follow_symlink and os.path.islink(full_path):
+                        continue
+                    try:
+                        stat_result = os.stat(full_path)
+                        if (
+                            not stat.S_ISREG(stat_result.st_mode)
+                            or stat_result.st_size > self.max_cached_file_size
+                        ):
+                            continue
+                        with open(full_path, "rb") as f:
+                            body = f.read()
+                    except OSError as e:
+                        logger.warning("Skipping static file %s: %s", full_path, e)
+                        continue
+
+                    headers = dict(FileResponse(full_path, stat_result=stat_result).headers)
+                    key = os.path.normpath(os.path.relpath(full_path, directory))
+                    # Earlier directories take precedence, matching lookup_path().
+                    cache.setdefault(key, (body, headers))
+
+        self._cache = cache
+        return len(cache)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        cached = self._cache.get(path)
+        if cached is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        body, headers = cached
+        response_headers = Headers(headers)
+        if self.is_not_modified(response_headers, Headers(scope=scope)):
+            return NotModifiedResponse(response_headers)
+        if scope["method"] == "HEAD":
+            return Response(headers=headers)
+        return Response(content=body, headers=headers)
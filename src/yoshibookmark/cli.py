@@ -1,13 +1,14 @@
 """Command-line interface for YoshiBookmark."""
 
+import importlib.util
+import os
+import re
 import sys
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 import click
-import httpx
-import uvicorn
 
 
 @click.group()
@@ -97,10 +98,7 @@ def init(
             storage_name = "default"
             provider = "filesystem"
 
-        default_storage_dir.mkdir(parents=True, exist_ok=True)
-        (default_storage_dir / "bookmarks").mkdir(parents=True, exist_ok=True)
-        (default_storage_dir / "favicons").mkdir(parents=True, exist_ok=True)
-        (default_storage_dir / "screenshots").mkdir(parents=True, exist_ok=True)
+        _create_storage_dirs(default_storage_dir)
 
         # Create default config
         default_config = AppConfig(
@@ -176,11 +174,17 @@ def serve(host: str, port: int, reload: bool, config_dir: Optional[Path]):
 
     Starts the FastAPI server with the specified host and port.
     """
-    from .config import ConfigManager, ConfigError
+    from .config import ConfigError, get_config_manager
 
     try:
-        # Verify configuration exists
-        cm = ConfigManager(config_dir)
+        # Set config directory environment variable if custom
+        if config_dir:
+            os.environ["YOSHIBOOKMARK_CONFIG_DIR"] = str(config_dir)
+
+        # Verify configuration exists. uvicorn imports the app in this process
+        # (unless --reload), and the app uses the same shared ConfigManager, so
+        # its startup reuses the configs parsed here.
+        cm = get_config_manager()
 
         if not cm.config_file.exists():
             click.echo("Error: Configuration not found", err=True)
@@ -200,11 +204,6 @@ def serve(host: str, port: int, reload: bool, config_dir: Optional[Path]):
             click.echo(f"Configuration error: {e}", err=True)
             sys.exit(1)
 
-        # Set config directory environment variable if custom
-        if config_dir:
-            import os
-            os.environ["YOSHIBOOKMARK_CONFIG_DIR"] = str(config_dir)
-
         click.echo("=" * 60)
         click.echo("Starting YoshiBookmark API server...")
         click.echo("=" * 60)
@@ -215,12 +214,22 @@ def serve(host: str, port: int, reload: bool, config_dir: Optional[Path]):
         click.echo("\nPress Ctrl+C to stop the server\n")
 
         # Start server
+        # Imported here so other commands (and --help) skip uvicorn's import cost.
+        import uvicorn
+
+        # Runs a single worker: the API keeps its bookmark index in process
+        # memory, so all handlers are async and blocking file I/O is pushed to
+        # threads.
+        loop, http = _server_backends()
+        click.echo(f"Event loop: {loop}, HTTP parser: {http}")
         uvicorn.run(
             "yoshibookmark.api:app",
             host=host,
             port=port,
             reload=reload,
             log_level="info",
+            loop=loop,
+            http=http,
         )
 
     except KeyboardInterrupt:
@@ -280,8 +289,7 @@ def migrate_to_onedrive(
         source_root = source_path
         target_root = onedrive_path
 
-        for dirname in ("bookmarks", "favicons", "screenshots"):
-            (target_root / dirname).mkdir(parents=True, exist_ok=True)
+        _create_storage_dirs(target_root)
 
         copied = 0
         skipped = 0
@@ -289,31 +297,39 @@ def migrate_to_onedrive(
 
         def copy_tree(src_dir: Path, dst_dir: Path) -> None:
             nonlocal copied, skipped, conflicts
-            if not src_dir.exists():
+            if not src_dir.is_dir():
                 return
 
-            for source_file in src_dir.rglob("*"):
-                if source_file.is_dir():
-                    continue
+            dst_root = str(dst_dir)
+            dest_index = {
+                rel_path: st.st_size for rel_path, _, st in _iter_files(dst_root)
+            }
+            # dst_dir itself was created by _create_storage_dirs().
+            created_dirs = {dst_root}
 
-                relative = source_file.relative_to(src_dir)
-                destination = dst_dir / relative
-                destination.parent.mkdir(parents=True, exist_ok=True)
+            for rel_path, source_path, source_stat in _iter_files(str(src_dir)):
+                destination = os.path.join(dst_root, rel_path)
+                destination_size = dest_index.get(rel_path)
 
-                if destination.exists():
-                    if source_file.read_bytes() == destination.read_bytes():
+                if destination_size is not None:
+                    if destination_size == source_stat.st_size and _same_content(
+                        source_path, destination
+                    ):
                         skipped += 1
                         continue
                     if not force:
                         conflicts += 1
                         continue
 
-                shutil.copy2(source_file, destination)
+                parent = os.path.dirname(destination)
+                if parent not in created_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    created_dirs.add(parent)
+                _copy_file(source_path, destination)
                 copied += 1
 
-        copy_tree(source_root / "bookmarks", target_root / "bookmarks")
-        copy_tree(source_root / "favicons", target_root / "favicons")
-        copy_tree(source_root / "screenshots", target_root / "screenshots")
+        for dirname in _STORAGE_SUBDIRS:
+            copy_tree(source_root / dirname, target_root / dirname)
 
         app_config = app_config.model_copy(
             update={
@@ -352,24 +368,128 @@ def migrate_to_onedrive(
         sys.exit(1)
 
 
+def _server_backends() -> Tuple[str, str]:
+    """Pick uvicorn's event loop and HTTP parser.
+
+    uvicorn[standard] installs uvloop (not on Windows) and httptools; use them
+    when importable and fall back to asyncio/h11 otherwise.
+    """
+    loop = "asyncio"
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        loop = "uvloop"
+    http = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+    return loop, http
+
+
+_STORAGE_SUBDIRS = ("bookmarks", "favicons", "screenshots")
+
+
+def _create_storage_dirs(root: Path) -> None:
+    """Create a storage root and its subdirectories.
+
+    makedirs on each leaf creates the root on the first call, so the root
+    needs no separate mkdir.
+    """
+    for dirname in _STORAGE_SUBDIRS:
+        os.makedirs(os.path.join(root, dirname), exist_ok=True)
+
+
+def _iter_files(root: str) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """Yield (relative path, path, stat) for every file below root using scandir."""
+    prefix_len = len(root) + 1
+    stack = [root]
+    while stack:
+        try:
+            scanner = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with scanner:
+            for entry in scanner:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif not entry.is_dir():
+                    yield entry.path[prefix_len:], entry.path, entry.stat()
+
+
+_COMPARE_CHUNK_SIZE = 64 * 1024
+
+
+def _same_content(first: str, second: str) -> bool:
+    """Compare two equal-sized files chunk by chunk without loading them whole."""
+    buf_a = bytearray(_COMPARE_CHUNK_SIZE)
+    buf_b = bytearray(_COMPARE_CHUNK_SIZE)
+    view_a = memoryview(buf_a)
+    view_b = memoryview(buf_b)
+    with open(first, "rb", buffering=0) as fa, open(second, "rb", buffering=0) as fb:
+        while True:
+            n = fa.readinto(buf_a)
+            if not n:
+                return True
+            # Unbuffered reads may return short; fill the peer chunk to match.
+            m = 0
+            while m < n:
+                read = fb.readinto(view_b[m:n])
+                if not read:
+                    return False
+                m += read
+            if view_a[:n] != view_b[:n]:
+                return False
+
+
+# Linux ioctl that makes dst share src's extents (Btrfs, XFS, ...).
+_FICLONE = 0x40049409
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy a file with metadata, cloning it on copy-on-write filesystems.
+
+    shutil.copy2 already copies in the kernel via sendfile on Linux; a FICLONE
+    reflink avoids copying data at all where the filesystem supports it.
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+_EXTENSION_ORIGIN_PREFIXES = ("chrome-extension://", "edge-extension://")
+
+_PLACEHOLDER_SECRET_RE = re.compile(
+    r"your-|replace-with|<random|example|changeme|todo", re.IGNORECASE
+)
+
+
+def _probe_health(health_url: str) -> int:
+    """Return the HTTP status of the server health endpoint.
+
+    A single local request: stdlib urllib avoids httpx's import and
+    client/SSL-context setup.
+    """
+    import urllib.error
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(health_url, timeout=3.0) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
 def _is_placeholder_secret(value: Optional[str]) -> bool:
     """Detect placeholder/empty secret values that should be replaced."""
     if value is None:
         return True
 
-    normalized = value.strip().lower()
-    if not normalized:
-        return True
-
-    markers = (
-        "your-",
-        "replace-with",
-        "<random",
-        "example",
-        "changeme",
-        "todo",
-    )
-    return any(marker in normalized for marker in markers)
+    normalized = value.strip()
+    return not normalized or _PLACEHOLDER_SECRET_RE.search(normalized) is not None
 
 
 @cli.command()
@@ -400,6 +520,18 @@ def doctor(config_dir: Optional[Path], api_url: Optional[str]):
         if fix:
             click.echo(f"      Fix: {fix}")
 
+    # The server probe is network-bound; start it now so it overlaps the local
+    # file checks below instead of adding its round trip at the end.
+    health_url = None
+    health_probe = None
+    if api_url:
+        from concurrent.futures import ThreadPoolExecutor
+
+        health_url = f"{api_url.rstrip('/')}/api/v1/health"
+        probe_executor = ThreadPoolExecutor(max_workers=1)
+        health_probe = probe_executor.submit(_probe_health, health_url)
+        probe_executor.shutdown(wait=False)
+
     click.echo("=" * 60)
     click.echo("YoshiBookmark doctor")
     click.echo("=" * 60)
@@ -484,15 +616,13 @@ def doctor(config_dir: Optional[Path], api_url: Optional[str]):
                 "Add your chrome-extension://<id> or edge-extension://<id> origin to config.yaml",
             )
         else:
-            placeholder_origins = [
-                origin for origin in allowed_origins if "<" in origin or ">" in origin
-            ]
-            malformed_origins = [
-                origin
-                for origin in allowed_origins
-                if not origin.startswith("chrome-extension://")
-                and not origin.startswith("edge-extension://")
-            ]
+            placeholder_origins = []
+            malformed_origins = []
+            for origin in allowed_origins:
+                if "<" in origin or ">" in origin:
+                    placeholder_origins.append(origin)
+                elif not origin.startswith(_EXTENSION_ORIGIN_PREFIXES):
+                    malformed_origins.append(origin)
             if placeholder_origins:
                 failures += 1
                 report(
@@ -510,17 +640,16 @@ def doctor(config_dir: Optional[Path], api_url: Optional[str]):
             else:
                 report("PASS", "Extension origins look valid")
 
-    if api_url:
-        health_url = f"{api_url.rstrip('/')}/api/v1/health"
+    if health_probe is not None:
         try:
-            response = httpx.get(health_url, timeout=3.0)
-            if response.status_code == 200:
+            status_code = health_probe.result()
+            if status_code == 200:
                 report("PASS", f"Server is reachable: {health_url}")
             else:
                 failures += 1
                 report(
                     "FAIL",
-                    f"Server health check returned HTTP {response.status_code}: {health_url}",
+                    f"Server health check returned HTTP {status_code}: {health_url}",
                     "Start server: yoshibookmark serve --port 8000",
                 )
         except Exception as e:
@@ -1,15 +1,26 @@
 """Configuration management."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import yaml
-from dotenv import load_dotenv
 
 from .models.config import AppConfig, EnvSettings
 from .models.storage import StorageLocation
 
+# Prefer the libyaml C bindings; fall back to the pure-Python safe loader.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+# (st_mtime_ns, st_size) of a config file when it was parsed.
+FileKey = Tuple[int, int]
+
 
 class ConfigError(Exception):
     """Configuration-related error."""
@@ -17,6 +28,45 @@ class ConfigError(Exception):
     pass
 
 
+def _file_key(path: Path) -> Optional[FileKey]:
+    """Return the cache key for a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _write_text_atomic(path: Path, text: str, private: bool = False) -> None:
+    """Write a file in one go via a temp file and os.replace().
+
+    Readers (and a crash mid-write) see either the old or the new content,
+    never a truncated file.
+
+    Args:
+        path: Destination file
+        text: Full file content
+        private: Restrict permissions to the owner (0o600) before publishing
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600 if private else 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            if private and os.name != 'nt':  # Not Windows
+                os.fchmod(f.fileno(), 0o600)
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    """Return ~/.yoshibookmark, resolving the home directory once per process."""
+    return Path.home() / '.yoshibookmark'
+
+
 class ConfigManager:
     """Manages application configuration from .env and config.yaml."""
 
@@ -31,12 +81,22 @@ class ConfigManager:
             if env_config_dir:
                 config_dir = Path(env_config_dir)
             else:
-                config_dir = Path.home() / '.yoshibookmark'
+                config_dir = _default_config_dir()
 
         self.config_dir = config_dir
         self.config_file = config_dir / 'config.yaml'
         self.env_file = config_dir / '.env'
 
+        # Parsed results keyed on the file's (mtime, size) from a single stat,
+        # so repeat loads skip the read/parse and external edits are picked up.
+        self._app_config_cache: Optional[Tuple[FileKey, AppConfig]] = None
+        self._env_settings_cache: Optional[Tuple[FileKey, EnvSettings]] = None
+
+    def clear_cache(self) -> None:
+        """Drop cached settings so the next load re-reads the files."""
+        self._app_config_cache = None
+        self._env_settings_cache = None
+
     def load_env_settings(self) -> EnvSettings:
         """Load environment settings from .env file.
 
@@ -46,44 +106,60 @@ class ConfigManager:
         Raises:
             ConfigError: If .env file is missing or invalid
         """
-        if not self.env_file.exists():
+        key = _file_key(self.env_file)
+        if key is None:
             raise ConfigError(
                 f".env file not found at {self.env_file}. "
                 f"Run 'yoshibookmark init' to create configuration."
             )
 
-        # Load .env file
-        load_dotenv(self.env_file)
+        if self._env_settings_cache is not None and self._env_settings_cache[0] == key:
+            return self._env_settings_cache[1]
 
+        # Read the file directly rather than via load_dotenv(), which would
+        # copy every entry into os.environ (and into child processes).
+        # Process environment variables still take precedence over the file.
+        # _env_file is a pydantic-settings init option, not a model field,
+        # so it is invisible to mypy without the pydantic plugin.
         try:
-            return EnvSettings()
+            settings = EnvSettings(_env_file=self.env_file)  # type: ignore[call-arg]
         except Exception as e:
             raise ConfigError(f"Invalid .env file: {e}") from e
+        self._env_settings_cache = (key, settings)
+        return settings
 
     def load_app_config(self) -> AppConfig:
         """Load application configuration from config.yaml.
 
+        The parsed config is cached until the file changes; each call returns
+        a deep copy, so callers may modify it without affecting later loads.
+
         Returns:
             AppConfig instance
 
         Raises:
             ConfigError: If config file is missing or invalid
         """
-        if not self.config_file.exists():
+        key = _file_key(self.config_file)
+        if key is None:
             raise ConfigError(
                 f"Config file not found at {self.config_file}. "
                 f"Run 'yoshibookmark init' to create configuration."
             )
+        if self._app_config_cache is not None and self._app_config_cache[0] == key:
+            return self._app_config_cache[1].model_copy(deep=True)
 
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
 
             if data is None:
                 data = {}
 
             config = AppConfig(**data)
-            return self._normalize_storage_config(config)
+            normalized = self._normalize_storage_config(config)
+            self._app_config_cache = (key, normalized)
+            return normalized.model_copy(deep=True)
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in config file: {e}") from e
         except Exception as e:
@@ -107,9 +183,14 @@ class ConfigManager:
             # Convert to dict, handling Pydantic models
             data = normalized.model_dump(mode='json')
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            _write_text_atomic(
+                self.config_file,
+                yaml.dump(
+                    data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+                ),
+            )
 
+            self._app_config_cache = None
         except Exception as e:
             raise ConfigError(f"Failed to save config: {e}") from e
 
@@ -165,12 +246,11 @@ OPENAI_API_KEY={api_key}
 EXTENSION_API_TOKEN=replace-with-random-local-token
 """
 
-            with open(self.env_file, 'w', encoding='utf-8') as f:
-                f.write(env_content)
+            # Restrictive permissions (Unix-like systems) are applied to the
+            # temp file, so the secrets are never readable by others.
+            _write_text_atomic(self.env_file, env_content, private=True)
 
-            # Set restrictive permissions on Unix-like systems
-            if os.name != 'nt':  # Not Windows
-                os.chmod(self.env_file, 0o600)
+            self._env_settings_cache = None
 
         except Exception as e:
             raise ConfigError(f"Failed to create .env file: {e}") from e
@@ -184,15 +264,12 @@ EXTENSION_API_TOKEN=replace-with-random-local-token
         Returns:
             Current StorageLocation or None if no storage configured
         """
-        for storage in config.storage_locations:
-            if storage.is_current:
-                return storage
-
+        locations = config.storage_locations
         # If none marked as current, return first one
-        if config.storage_locations:
-            return config.storage_locations[0]
-
-        return None
+        return next(
+            (storage for storage in locations if storage.is_current),
+            locations[0] if locations else None,
+        )
 
     def get_primary_storage(self, config: AppConfig) -> Optional[StorageLocation]:
         """Get the storage location used for writes in current mode."""
@@ -222,8 +299,34 @@ EXTENSION_API_TOKEN=replace-with-random-local-token
         if not os.access(path, os.W_OK):
             raise ConfigError(f"Storage path is not writable: {storage.path}")
 
+    def _is_normalized(self, config: AppConfig) -> bool:
+        """Check whether _normalize_storage_config() would leave config unchanged."""
+        if config.storage_mode == "onedrive_only":
+            if (
+                config.primary_storage_provider != "onedrive_local"
+                or not config.primary_storage_path
+                or len(config.storage_locations) != 1
+            ):
+                return False
+            storage = config.storage_locations[0]
+            return (
+                storage.path == config.primary_storage_path
+                and storage.is_current
+                and storage.is_default
+            )
+
+        # Without a primary path, normalization fills it from the current storage,
+        # which exists whenever any storage is configured.
+        return bool(config.primary_storage_path) or not config.storage_locations
+
     def _normalize_storage_config(self, config: AppConfig) -> AppConfig:
-        """Normalize storage fields for backward compatibility and one-drive modes."""
+        """Normalize storage fields for backward compatibility and one-drive modes.
+
+        Already-normalized configs are returned as-is, without a model_copy.
+        """
+        if self._is_normalized(config):
+            return config
+
         current = self.get_current_storage(config)
 
         primary_path = config.primary_storage_path
@@ -241,13 +344,21 @@ EXTENSION_API_TOKEN=replace-with-random-local-token
                     "storage_mode=onedrive_only requires primary_storage_path or a configured storage location"
                 )
 
-            primary_name = current.name if current else "onedrive"
-            normalized_storage = StorageLocation(
-                name=primary_name,
-                path=primary_path,
-                is_current=True,
-                is_default=True,
-            )
+            if (
+                current is not None
+                and len(config.storage_locations) == 1
+                and current.path == primary_path
+                and current.is_current
+                and current.is_default
+            ):
+                normalized_storage = current
+            else:
+                normalized_storage = StorageLocation(
+                    name=current.name if current else "onedrive",
+                    path=primary_path,
+                    is_current=True,
+                    is_default=True,
+                )
             return config.model_copy(
                 update={
                     "storage_locations": [normalized_storage],
@@ -256,3 +367,21 @@ EXTENSION_API_TOKEN=replace-with-random-local-token
             )
 
         return config.model_copy(update={"primary_storage_path": primary_path})
+
+
+_INSTANCE: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Return the process-wide ConfigManager for the default config directory.
+
+    Shared by import-time wiring (CORS origins) and the API lifespan so both see
+    the same parsed configuration and config.yaml is read once per process.
+
+    Returns:
+        ConfigManager instance
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = ConfigManager()
+    return _INSTANCE
@@ -2,20 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
 from ..models.config import AppConfig
 
+# orjson (optional "speedups" extra) encodes/decodes provider payloads several
+# times faster than the stdlib. Its JSONDecodeError subclasses
+# json.JSONDecodeError, so error handling is the same either way.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson not installed
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or text."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 logger = logging.getLogger(__name__)
 
 
 TRANSIENT_FAILURES = {"timeout", "network", "ratelimit", "server_error"}
 
+# After this many consecutive transient failures, a provider key is skipped
+# for the cooldown instead of costing a full timeout on every capture.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN_SECONDS = 30.0
+
+# Provider calls are slow and bursty; keep idle TLS connections around long
+# enough to be reused by the next capture and across API-key rotation.
+PROVIDER_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0
+)
+
+# Error statuses with a dedicated failure type; other 5xx are "server_error"
+# and remaining 4xx are "invalid_request".
+HTTP_STATUS_FAILURE_TYPES = {401: "authentication", 403: "authentication", 429: "ratelimit"}
+
+# Startup pre-connects must not hold up the server when a provider is unreachable.
+PREWARM_TIMEOUT_SECONDS = 3.0
+
 
 @dataclass
 class ProviderAttemptDiagnostics:
@@ -27,6 +74,28 @@ class ProviderAttemptDiagnostics:
     message: Optional[str] = None
 
 
+@dataclass(slots=True)
+class StructuredMetadata:
+    """Suggestion fields parsed from a provider's JSON reply.
+
+    Values are kept as the provider returned them; callers normalize.
+    """
+
+    title: Optional[str] = None
+    keywords: Optional[List[str]] = None
+    tags: Optional[List[str]] = None
+    summary: Optional[str] = None
+    confidence: Optional[float] = None
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "StructuredMetadata":
+        """Build metadata from a parsed JSON object, ignoring unknown keys."""
+        if not isinstance(payload, dict):
+            raise ValueError("Provider reply is not a JSON object")
+        get = payload.get
+        return cls(get("title"), get("keywords"), get("tags"), get("summary"), get("confidence"))
+
+
 class AIProviderError(Exception):
     """Provider-specific error with failover semantics."""
 
@@ -46,6 +115,62 @@ class MultiProviderInferenceService:
 
     def __init__(self, config: AppConfig):
         self.config = config
+        self._client: Optional[httpx.AsyncClient] = None
+        # prompt digest -> (expires_at monotonic, parsed metadata, provider_id, model)
+        self._response_cache: OrderedDict[
+            bytes, Tuple[float, StructuredMetadata, str, str]
+        ] = OrderedDict()
+        # (provider_id, api_key) -> (consecutive transient failures, open until)
+        self._breakers: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        # The provider chain only depends on config, which is fixed for the
+        # service's lifetime; resolve it once instead of on every capture.
+        self._provider_order = config.ordered_providers
+        self._provider_configs = {
+            provider_id: cfg
+            for provider_id in self._provider_order
+            if (cfg := self._build_provider_config(provider_id)) is not None
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared provider HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.config.agent_timeout_seconds, limits=PROVIDER_POOL_LIMITS
+            )
+        return self._client
+
+    async def prewarm(self) -> None:
+        """Create the pooled provider client before the first ingest request.
+
+        When agent_prewarm_connections is set, also opens a connection to each
+        usable provider endpoint with a cheap HEAD request, so the first
+        capture does not pay the TCP/TLS handshake. Failures are ignored.
+        """
+        client = self._get_client()
+        if not self.config.agent_prewarm_connections:
+            return
+
+        endpoints = {
+            cfg["endpoint"].replace("{model}", cfg["model"])
+            for provider_id in self._ordered_providers()
+            if (cfg := self._provider_config(provider_id)) is not None
+            and cfg["enabled"]
+            and cfg["endpoint"]
+            and cfg["api_keys"]
+        }
+        results = await asyncio.gather(
+            *(client.head(endpoint, timeout=PREWARM_TIMEOUT_SECONDS) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+        for endpoint, result in zip(endpoints, results, strict=True):
+            if isinstance(result, Exception):
+                logger.debug("Provider pre-connect to %s failed: %s", endpoint, result)
+
+    async def aclose(self) -> None:
+        """Close the shared provider client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def generate_structured_metadata(
         self,
@@ -54,8 +179,13 @@ class MultiProviderInferenceService:
         page_excerpt: str,
         selected_text: str,
         user_note: str,
-    ) -> tuple[Optional[dict], List[ProviderAttemptDiagnostics]]:
+    ) -> tuple[Optional[StructuredMetadata], List[ProviderAttemptDiagnostics]]:
         prompt = self._build_prompt(url, page_title, page_excerpt, selected_text, user_note)
+        cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         attempts: List[ProviderAttemptDiagnostics] = []
 
         for provider_id in self._ordered_providers():
@@ -71,10 +201,11 @@ class MultiProviderInferenceService:
                     continue
 
                 text = await self._generate_text(provider_id, prompt)
-                parsed = self._parse_json_payload(text)
+                parsed = StructuredMetadata.from_payload(self._parse_json_payload(text))
                 attempts.append(
                     ProviderAttemptDiagnostics(provider_id, provider_cfg["model"], True, True)
                 )
+                self._store_response(cache_key, parsed, provider_id, provider_cfg["model"])
                 return parsed, attempts
             except AIProviderError as e:
                 attempts.append(
@@ -109,6 +240,58 @@ class MultiProviderInferenceService:
 
         return None, attempts
 
+    async def generate_structured_metadata_batch(
+        self, captures: Sequence[Dict[str, str]]
+    ) -> list[
+        tuple[Optional[StructuredMetadata], List[ProviderAttemptDiagnostics]] | BaseException
+    ]:
+        """Generate metadata for many captures with bounded concurrency.
+
+        Each capture is a dict of generate_structured_metadata() keyword
+        arguments. Calls are network-bound, so up to agent_max_concurrency run
+        at once over the shared connection pool. Results are returned in input
+        order; a capture that raised yields its exception instead.
+        """
+        semaphore = asyncio.Semaphore(self.config.agent_max_concurrency)
+
+        async def generate_one(capture: Dict[str, str]):
+            async with semaphore:
+                return await self.generate_structured_metadata(**capture)
+
+        return await asyncio.gather(
+            *(generate_one(capture) for capture in captures), return_exceptions=True
+        )
+
+    def _cached_response(
+        self, key: bytes
+    ) -> Optional[tuple[StructuredMetadata, List[ProviderAttemptDiagnostics]]]:
+        """Return a fresh cached suggestion for an identical prompt, if any."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, parsed, provider_id, model = entry
+        if expires_at <= time.monotonic():
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        attempt = ProviderAttemptDiagnostics(
+            provider_id, model, False, True, None, "Served from response cache"
+        )
+        return replace(parsed), [attempt]
+
+    def _store_response(
+        self, key: bytes, parsed: StructuredMetadata, provider_id: str, model: str
+    ) -> None:
+        """Remember a parsed suggestion, evicting the least recently used entries."""
+        max_size = self.config.agent_response_cache_size
+        if max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.config.agent_response_cache_ttl_seconds
+        self._response_cache[key] = (expires_at, replace(parsed), provider_id, model)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > max_size:
+            self._response_cache.popitem(last=False)
+
     def get_provider_status(self) -> list[dict]:
         """Return provider configuration status for diagnostics endpoints."""
         result: List[dict] = []
@@ -127,20 +310,13 @@ class MultiProviderInferenceService:
             )
         return result
 
-    def _ordered_providers(self) -> list[str]:
-        default_order = ["openai", "azureopenai", "anthropic", "gemini"]
-        configured = [p.strip().lower() for p in self.config.agent_providers if p.strip()]
-        if not configured:
-            configured = default_order
-        seen = set()
-        ordered: list[str] = []
-        for provider in configured + default_order:
-            if provider not in seen:
-                seen.add(provider)
-                ordered.append(provider)
-        return ordered
+    def _ordered_providers(self) -> tuple[str, ...]:
+        return self._provider_order
 
     def _provider_config(self, provider_id: str) -> Optional[dict]:
+        return self._provider_configs.get(provider_id)
+
+    def _build_provider_config(self, provider_id: str) -> Optional[dict]:
         if provider_id == "openai":
             return {
                 "enabled": self.config.openai_enabled,
@@ -186,100 +362,197 @@ class MultiProviderInferenceService:
         if not api_keys:
             raise AIProviderError(provider_id, "configuration", "API key is not configured")
 
-        timeout = self.config.agent_timeout_seconds
+        # The body only depends on provider, model and prompt: encode it once
+        # and reuse the bytes for every key in the rotation.
+        body = self._request_body(provider_id, model, prompt)
+        client = self._get_client()
+        if self.config.agent_race_keys and len(api_keys) > 1:
+            return await self._first_success(
+                provider_id,
+                [
+                    self._attempt_key(client, provider_id, endpoint, model, api_key, body)
+                    for api_key in api_keys
+                ],
+            )
 
         last_error: Optional[AIProviderError] = None
         for api_key in api_keys:
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    if provider_id in {"openai", "azureopenai"}:
-                        headers = {"Content-Type": "application/json"}
-                        if provider_id == "openai":
-                            headers["Authorization"] = f"Bearer {api_key}"
-                        else:
-                            headers["api-key"] = api_key
-                        body = {
-                            "model": model,
-                            "messages": [
-                                {"role": "system", "content": "You output compact JSON only."},
-                                {"role": "user", "content": prompt},
-                            ],
-                        }
-                        response = await client.post(endpoint, headers=headers, json=body)
-                        self._raise_for_status(provider_id, response)
-                        data = response.json()
-                        return data["choices"][0]["message"]["content"]
-
-                    if provider_id == "anthropic":
-                        headers = {
-                            "x-api-key": api_key,
-                            "anthropic-version": "2023-06-01",
-                            "content-type": "application/json",
-                        }
-                        body = {
-                            "model": model,
-                            "max_tokens": 300,
-                            "messages": [{"role": "user", "content": prompt}],
-                            "temperature": 0.2,
-                        }
-                        response = await client.post(endpoint, headers=headers, json=body)
-                        self._raise_for_status(provider_id, response)
-                        data = response.json()
-                        chunks = data.get("content", [])
-                        text_values = [
-                            chunk.get("text", "") for chunk in chunks if chunk.get("type") == "text"
-                        ]
-                        return "\n".join(text_values).strip()
-
-                    if provider_id == "gemini":
-                        endpoint_url = endpoint.replace("{model}", model)
-                        headers = {"Content-Type": "application/json"}
-                        body = {
-                            "contents": [{"parts": [{"text": prompt}]}],
-                            "generationConfig": {"temperature": 0.2},
-                        }
-                        response = await client.post(
-                            f"{endpoint_url}?key={api_key}",
-                            headers=headers,
-                            json=body,
-                        )
-                        self._raise_for_status(provider_id, response)
-                        data = response.json()
-                        return data["candidates"][0]["content"]["parts"][0]["text"]
-
-                    raise AIProviderError(provider_id, "configuration", "Unsupported provider")
+                return await self._attempt_key(client, provider_id, endpoint, model, api_key, body)
             except AIProviderError as e:
                 last_error = e
-                if not e.is_transient:
+                if self._stops_rotation(e):
                     raise
-                continue
-            except httpx.TimeoutException:
-                last_error = AIProviderError(provider_id, "timeout", "Request timed out")
-                continue
-            except httpx.NetworkError as e:
-                last_error = AIProviderError(provider_id, "network", f"Network error: {e}")
-                continue
-            except Exception as e:
-                last_error = AIProviderError(provider_id, "unknown", str(e))
-                continue
 
         raise last_error or AIProviderError(provider_id, "unknown", "Provider request failed")
 
+    async def _first_success(self, provider_id: str, attempts: List[Any]) -> str:
+        """Run all key attempts concurrently and return the first success.
+
+        Remaining attempts are cancelled as soon as one key succeeds or fails
+        with an error that should stop rotation (e.g. authentication).
+        """
+        pending = {asyncio.ensure_future(attempt) for attempt in attempts}
+        last_error: Optional[AIProviderError] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    last_error = error
+                    if self._stops_rotation(error):
+                        raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        raise last_error or AIProviderError(provider_id, "unknown", "Provider request failed")
+
+    @staticmethod
+    def _stops_rotation(error: AIProviderError) -> bool:
+        # Unexpected errors ("unknown") still move on to the next key.
+        return not error.is_transient and error.failure_type != "unknown"
+
+    async def _attempt_key(
+        self,
+        client: httpx.AsyncClient,
+        provider_id: str,
+        endpoint: str,
+        model: str,
+        api_key: str,
+        body: bytes,
+    ) -> str:
+        """Send one request with one API key, normalizing errors to AIProviderError."""
+        breaker_key = (provider_id, api_key)
+        if self._circuit_is_open(breaker_key):
+            raise AIProviderError(
+                provider_id, "server_error", "Skipped: circuit open after repeated failures"
+            )
+        try:
+            text = await self._request_text(client, provider_id, endpoint, model, api_key, body)
+        except AIProviderError as e:
+            if e.is_transient:
+                self._record_transient_failure(breaker_key)
+            raise
+        except httpx.TimeoutException as e:
+            self._record_transient_failure(breaker_key)
+            raise AIProviderError(provider_id, "timeout", "Request timed out") from e
+        except httpx.NetworkError as e:
+            self._record_transient_failure(breaker_key)
+            raise AIProviderError(provider_id, "network", f"Network error: {e}") from e
+        except Exception as e:
+            raise AIProviderError(provider_id, "unknown", str(e)) from e
+        self._breakers.pop(breaker_key, None)
+        return text
+
+    def _circuit_is_open(self, key: Tuple[str, str]) -> bool:
+        state = self._breakers.get(key)
+        return state is not None and state[1] > time.monotonic()
+
+    def _record_transient_failure(self, key: Tuple[str, str]) -> None:
+        """Count a transient failure; open the circuit once the threshold is hit."""
+        failures = self._breakers.get(key, (0, 0.0))[0] + 1
+        if failures >= CIRCUIT_FAILURE_THRESHOLD:
+            # Half-open after the cooldown: one more failure re-opens it.
+            self._breakers[key] = (
+                CIRCUIT_FAILURE_THRESHOLD - 1,
+                time.monotonic() + CIRCUIT_COOLDOWN_SECONDS,
+            )
+        else:
+            self._breakers[key] = (failures, 0.0)
+
+    def _request_body(self, provider_id: str, model: str, prompt: str) -> bytes:
+        """Serialize a provider request body (independent of the API key)."""
+        if provider_id in {"openai", "azureopenai"}:
+            body: Dict[str, Any] = {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": "You output compact JSON only."},
+                    {"role": "user", "content": prompt},
+                ],
+            }
+        elif provider_id == "anthropic":
+            body = {
+                "model": model,
+                "max_tokens": 300,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.2,
+            }
+        elif provider_id == "gemini":
+            body = {
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {"temperature": 0.2},
+            }
+        else:
+            raise AIProviderError(provider_id, "configuration", "Unsupported provider")
+        return _json_dumps(body)
+
+    async def _request_text(
+        self,
+        client: httpx.AsyncClient,
+        provider_id: str,
+        endpoint: str,
+        model: str,
+        api_key: str,
+        body: bytes,
+    ) -> str:
+        if provider_id in {"openai", "azureopenai"}:
+            headers = {"Content-Type": "application/json"}
+            if provider_id == "openai":
+                headers["Authorization"] = f"Bearer {api_key}"
+            else:
+                headers["api-key"] = api_key
+            response = await client.post(endpoint, headers=headers, content=body)
+            self._raise_for_status(provider_id, response)
+            data = _json_loads(response.content)
+            return data["choices"][0]["message"]["content"]
+
+        if provider_id == "anthropic":
+            headers = {
+                "x-api-key": api_key,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            }
+            response = await client.post(endpoint, headers=headers, content=body)
+            self._raise_for_status(provider_id, response)
+            data = _json_loads(response.content)
+            chunks = data.get("content", [])
+            text_values = [
+                chunk.get("text", "") for chunk in chunks if chunk.get("type") == "text"
+            ]
+            return "\n".join(text_values).strip()
+
+        if provider_id == "gemini":
+            endpoint_url = endpoint.replace("{model}", model)
+            headers = {"Content-Type": "application/json"}
+            response = await client.post(
+                f"{endpoint_url}?key={api_key}",
+                headers=headers,
+                content=body,
+            )
+            self._raise_for_status(provider_id, response)
+            data = _json_loads(response.content)
+            return data["candidates"][0]["content"]["parts"][0]["text"]
+
+        raise AIProviderError(provider_id, "configuration", "Unsupported provider")
+
     def _raise_for_status(self, provider_id: str, response: httpx.Response) -> None:
         if response.status_code < 400:
             return
-        message = response.text[:500]
-        if response.status_code in {401, 403}:
-            raise AIProviderError(provider_id, "authentication", message)
-        if response.status_code == 429:
-            raise AIProviderError(provider_id, "ratelimit", message)
-        if response.status_code >= 500:
-            raise AIProviderError(provider_id, "server_error", message)
-        raise AIProviderError(provider_id, "invalid_request", message)
+        failure_type = HTTP_STATUS_FAILURE_TYPES.get(response.status_code) or (
+            "server_error" if response.status_code >= 500 else "invalid_request"
+        )
+        raise AIProviderError(provider_id, failure_type, response.text[:500])
 
     def _build_prompt(
         self, url: str, page_title: str, page_excerpt: str, selected_text: str, user_note: str
     ) -> str:
+        # A single f-string compiles to one BUILD_STRING over all the pieces,
+        # which measured faster than an equivalent "".join of a parts tuple.
         return (
             "Given page capture context, output strict JSON with keys: "
             "title (string), keywords (array up to 4), tags (array up to 6), "
@@ -297,7 +570,7 @@ class MultiProviderInferenceService:
         if "```" in candidate:
             candidate = candidate.replace("```json", "").replace("```", "").strip()
         try:
-            return json.loads(candidate)
+            return _json_loads(candidate)
         except json.JSONDecodeError:
             extracted = self._extract_first_json_object(candidate)
             if extracted is not None:
@@ -306,14 +579,16 @@ class MultiProviderInferenceService:
 
     def _extract_first_json_object(self, text: str) -> Optional[dict]:
         """Extract first valid JSON object from mixed model output."""
+        # Only an object can satisfy the dict check, so jump between '{' with
+        # str.find (C speed) and decode in place instead of slicing the text.
         decoder = json.JSONDecoder()
-        for idx, char in enumerate(text):
-            if char not in "{[":
-                continue
+        idx = text.find("{")
+        while idx != -1:
             try:
-                parsed, _ = decoder.raw_decode(text[idx:])
+                parsed, _ = decoder.raw_decode(text, idx)
             except json.JSONDecodeError:
-                continue
+                parsed = None
             if isinstance(parsed, dict):
                 return parsed
+            idx = text.find("{", idx + 1)
         return None
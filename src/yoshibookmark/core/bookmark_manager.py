@@ -1,15 +1,33 @@
 """Bookmark manager for CRUD operations."""
 
+import asyncio
 import logging
+import os
 from datetime import datetime, timezone
-from typing import List, Optional
-from uuid import uuid4
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
 
 from ..models.bookmark import Bookmark
 from .storage_manager import StorageError, StorageManager
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+
+def _now() -> datetime:
+    """Return the current UTC time."""
+    return datetime.now(_UTC)
+
+
+def _new_ids(count: int) -> List[str]:
+    """Return count random (version 4) UUID strings from a single urandom call."""
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(UUID(bytes=random_bytes[offset : offset + 16], version=4))
+        for offset in range(0, 16 * count, 16)
+    ]
+
 
 class BookmarkNotFoundError(Exception):
     """Bookmark not found error."""
@@ -71,17 +89,62 @@ class BookmarkManager:
             description=description,
             tags=tags or [],
             folder_path=folder_path,
-            created_at=datetime.now(timezone.utc),
+            created_at=_now(),
             storage_location=storage_location,
         )
 
         # Save to storage
         await self.storage.save_bookmark(bookmark, storage_location)
 
-        logger.info(f"Created bookmark {bookmark.id}: {bookmark.title}")
+        logger.info("Created bookmark %s: %s", bookmark.id, bookmark.title)
 
         return bookmark
 
+    async def create_bookmarks_bulk(
+        self, items: Sequence[Dict[str, Any]], storage_location: str
+    ) -> List[Bookmark]:
+        """Create many bookmarks in one storage location.
+
+        All bookmarks share one created_at timestamp and one draw of random
+        bytes for their IDs, and are validated before anything is written;
+        the file writes then run concurrently.
+
+        Args:
+            items: create_bookmark() keyword arguments (url, title, keywords,
+                description, tags, folder_path) for each bookmark
+            storage_location: Storage location name
+
+        Returns:
+            Created Bookmark instances, in input order
+
+        Raises:
+            ValidationError: If any bookmark data is invalid (nothing is saved)
+            StorageError: If a storage operation fails
+        """
+        created_at = _now()
+        bookmarks = [
+            Bookmark(
+                id=bookmark_id,
+                url=item["url"],
+                title=item["title"],
+                keywords=item.get("keywords") or [],
+                description=item.get("description"),
+                tags=item.get("tags") or [],
+                folder_path=item.get("folder_path"),
+                created_at=created_at,
+                storage_location=storage_location,
+            )
+            for bookmark_id, item in zip(_new_ids(len(items)), items, strict=True)
+        ]
+
+        await asyncio.gather(
+            *(self.storage.save_bookmark(bookmark, storage_location) for bookmark in bookmarks)
+        )
+
+        logger.info("Created %d bookmarks in %s", len(bookmarks), storage_location)
+
+        return bookmarks
+
     async def get_bookmark(self, bookmark_id: str, storage_name: Optional[str] = None) -> Bookmark:
         """Get bookmark by ID.
 
@@ -136,7 +199,7 @@ class BookmarkManager:
         # Get existing bookmark
         bookmark = await self.get_bookmark(bookmark_id, storage_name)
 
-        # Update fields (Pydantic will validate on model_copy)
+        # Update fields
         update_data = {}
         if title is not None:
             update_data["title"] = title
@@ -152,15 +215,12 @@ class BookmarkManager:
             update_data["folder_path"] = folder_path
 
         # Set last modified timestamp
-        update_data["last_modified"] = datetime.now(timezone.utc)
+        update_data["last_modified"] = _now()
 
-        # Create updated bookmark
-        updated_bookmark = bookmark.model_copy(update=update_data)
+        # Apply and save
+        updated_bookmark = await self._patch(bookmark, update_data)
 
-        # Save to storage
-        await self.storage.save_bookmark(updated_bookmark, updated_bookmark.storage_location)
-
-        logger.info(f"Updated bookmark {bookmark_id}")
+        logger.info("Updated bookmark %s", bookmark_id)
 
         return updated_bookmark
 
@@ -186,17 +246,15 @@ class BookmarkManager:
             raise BookmarkAlreadyDeletedError(f"Bookmark {bookmark_id} is already deleted")
 
         # Mark as deleted
-        deleted_bookmark = bookmark.model_copy(
-            update={
+        deleted_bookmark = await self._patch(
+            bookmark,
+            {
                 "deleted": True,
-                "deleted_at": datetime.now(timezone.utc),
-            }
+                "deleted_at": _now(),
+            },
         )
 
-        # Save to storage
-        await self.storage.save_bookmark(deleted_bookmark, deleted_bookmark.storage_location)
-
-        logger.info(f"Soft deleted bookmark {bookmark_id}")
+        logger.info("Soft deleted bookmark %s", bookmark_id)
 
         return deleted_bookmark
 
@@ -222,17 +280,15 @@ class BookmarkManager:
             raise ValueError(f"Bookmark {bookmark_id} is not deleted")
 
         # Restore bookmark
-        restored_bookmark = bookmark.model_copy(
-            update={
+        restored_bookmark = await self._patch(
+            bookmark,
+            {
                 "deleted": False,
                 "deleted_at": None,
-            }
+            },
         )
 
-        # Save to storage
-        await self.storage.save_bookmark(restored_bookmark, restored_bookmark.storage_location)
-
-        logger.info(f"Restored bookmark {bookmark_id}")
+        logger.info("Restored bookmark %s", bookmark_id)
 
         return restored_bookmark
 
@@ -263,7 +319,7 @@ class BookmarkManager:
         # Permanently delete file
         await self.storage.delete_bookmark_file(bookmark_id, bookmark.storage_location)
 
-        logger.warning(f"Hard deleted bookmark {bookmark_id} permanently")
+        logger.warning("Hard deleted bookmark %s permanently", bookmark_id)
 
     async def track_access(self, bookmark_id: str, storage_name: Optional[str] = None) -> Bookmark:
         """Update last accessed timestamp for a bookmark.
@@ -283,19 +339,26 @@ class BookmarkManager:
         bookmark = await self.get_bookmark(bookmark_id, storage_name)
 
         # Update last accessed
-        accessed_bookmark = bookmark.model_copy(
-            update={
-                "last_accessed": datetime.now(timezone.utc),
-            }
-        )
-
-        # Save to storage
-        await self.storage.save_bookmark(accessed_bookmark, accessed_bookmark.storage_location)
+        accessed_bookmark = await self._patch(bookmark, {"last_accessed": _now()})
 
-        logger.debug(f"Tracked access for bookmark {bookmark_id}")
+        logger.debug("Tracked access for bookmark %s", bookmark_id)
 
         return accessed_bookmark
 
+    async def _patch(self, bookmark: Bookmark, fields: Dict[str, Any]) -> Bookmark:
+        """Save field updates to a bookmark in its own storage location.
+
+        StorageManager.patch_bookmark() applies them to the latest indexed
+        version under the file lock (as a copy, so a failed save leaves the
+        index unchanged).
+        """
+        updated = await self.storage.patch_bookmark(
+            bookmark.id, bookmark.storage_location, fields
+        )
+        if updated is None:
+            raise BookmarkNotFoundError(f"Bookmark not found: {bookmark.id}")
+        return updated
+
     def list_bookmarks(
         self,
         storage_name: Optional[str] = None,
@@ -3,11 +3,11 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..utils.url_utils import (
     URLValidationError,
@@ -18,6 +18,30 @@ from ..utils.url_utils import (
 
 logger = logging.getLogger(__name__)
 
+# lxml (optional "speedups" extra) parses pages several times faster than the
+# pure-Python html.parser. With lxml the title is read with compiled XPath
+# directly, skipping BeautifulSoup entirely; without it, BeautifulSoup's
+# html.parser is used. XPaths are checked in the same priority order as
+# _extract_title: <title>, og:title, then the first <h1>.
+_TITLE_XPATHS: Optional[Tuple[Any, ...]] = None
+try:
+    from lxml import etree as _etree
+    from lxml import html as _lxml_html
+
+    _TITLE_XPATHS = (
+        _etree.XPath("string((//title)[1])"),
+        _etree.XPath("string((//meta[@property='og:title'])[1]/@content)"),
+        _etree.XPath("string((//h1)[1])"),
+    )
+    _UTF8_HTML_PARSER = _lxml_html.HTMLParser(encoding="utf-8")
+except ImportError:  # pragma: no cover - lxml not installed
+    pass
+
+_FETCH_CHUNK_SIZE = 64 * 1024
+
+# _extract_title only looks at these tags; skip building the rest of the tree.
+_TITLE_TAGS = SoupStrainer(["title", "meta", "h1"])
+
 
 class ContentAnalysisError(Exception):
     """Content analysis error."""
@@ -49,6 +73,27 @@ class ContentAnalyzer:
         self.timeout = timeout
         self.max_response_size = 10 * 1024 * 1024  # 10MB
         self.max_favicon_size = 1024 * 1024  # 1MB
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def prewarm(self) -> None:
+        """Create the pooled HTTP client before the first request needs it."""
+        self._get_client()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def analyze_url(self, url: str) -> Dict[str, any]:
         """Fetch URL and analyze content for title and keywords.
@@ -70,7 +115,7 @@ class ContentAnalyzer:
         try:
             validate_url_scheme(url)
         except URLValidationError as e:
-            logger.error(f"Invalid URL scheme for {url}: {e}")
+            logger.error("Invalid URL scheme for %s: %s", url, e)
             return {
                 "title": extract_domain_name(url),
                 "keywords": self.extract_keywords_from_url(url),
@@ -81,27 +126,28 @@ class ContentAnalyzer:
         try:
             html_content = await self.fetch_url(url)
         except (TimeoutError, NetworkError, ContentAnalysisError) as e:
-            logger.warning(f"Failed to fetch {url}: {e}")
+            logger.warning("Failed to fetch %s: %s", url, e)
             return {
                 "title": extract_domain_name(url),
                 "keywords": self.extract_keywords_from_url(url),
                 "error": str(e),
             }
 
-        # Parse HTML
+        # Parse HTML and extract title
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if _TITLE_XPATHS is not None:
+                title = self._extract_title_xpath(html_content, url)
+            else:
+                soup = BeautifulSoup(html_content, "html.parser", parse_only=_TITLE_TAGS)
+                title = self._extract_title(soup, url)
         except Exception as e:
-            logger.warning(f"Failed to parse HTML from {url}: {e}")
+            logger.warning("Failed to parse HTML from %s: %s", url, e)
             return {
                 "title": extract_domain_name(url),
                 "keywords": self.extract_keywords_from_url(url),
                 "error": f"HTML parsing failed: {e}",
             }
 
-        # Extract title
-        title = self._extract_title(soup, url)
-
         # Extract keywords from URL
         url_keywords = self.extract_keywords_from_url(url)
 
@@ -126,9 +172,10 @@ class ContentAnalyzer:
             ContentAnalysisError: If response is invalid
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url)
-
+            # Stream the body so an oversized page is rejected from its
+            # Content-Length, or as soon as the cap is crossed, instead of
+            # after buffering all of it.
+            async with self._get_client().stream("GET", url) as response:
                 # Check HTTP status
                 if response.status_code == 404:
                     raise ContentAnalysisError(f"Page not found (404): {url}")
@@ -142,16 +189,26 @@ class ContentAnalyzer:
                 # Check content type
                 content_type = response.headers.get("content-type", "").lower()
                 if "text/html" not in content_type and "text/plain" not in content_type:
-                    logger.warning(f"Non-HTML content-type for {url}: {content_type}")
+                    logger.warning("Non-HTML content-type for %s: %s", url, content_type)
 
                 # Check response size
-                content_length = len(response.content)
-                if content_length > self.max_response_size:
+                declared_length = response.headers.get("content-length", "")
+                if declared_length.isdigit() and int(declared_length) > self.max_response_size:
                     raise ContentAnalysisError(
-                        f"Response too large: {content_length} bytes (max {self.max_response_size})"
+                        f"Response too large: {declared_length} bytes "
+                        f"(max {self.max_response_size})"
                     )
 
-                return response.text
+                body = bytearray()
+                async for chunk in response.aiter_bytes(_FETCH_CHUNK_SIZE):
+                    body += chunk
+                    if len(body) > self.max_response_size:
+                        raise ContentAnalysisError(
+                            f"Response too large: over {self.max_response_size} bytes "
+                            f"(max {self.max_response_size})"
+                        )
+
+                return body.decode(response.encoding or "utf-8", errors="replace")
 
         except httpx.TimeoutException as e:
             raise TimeoutError(f"Request timed out after {self.timeout}s: {url}") from e
@@ -195,6 +252,30 @@ class ContentAnalyzer:
         # Fallback to domain name
         return extract_domain_name(url)
 
+    def _extract_title_xpath(self, html_content: str, url: str) -> str:
+        """Extract title with lxml XPath or use domain name as fallback.
+
+        Args:
+            html_content: Decoded HTML
+            url: Original URL (for fallback)
+
+        Returns:
+            Page title or domain name
+        """
+        if html_content.strip():
+            # Parse UTF-8 bytes with an explicit encoding: lxml rejects str
+            # input that carries an XML encoding declaration.
+            root = _lxml_html.document_fromstring(
+                html_content.encode("utf-8"), parser=_UTF8_HTML_PARSER
+            )
+            for xpath in _TITLE_XPATHS or ():
+                title = str(xpath(root)).strip()
+                if title:
+                    return title
+
+        # Fallback to domain name
+        return extract_domain_name(url)
+
     def extract_keywords_from_url(self, url: str) -> List[str]:
         """Extract keywords from URL path segments.
 
@@ -267,35 +348,64 @@ class ContentAnalyzer:
             f"{parsed.scheme}://{domain}/apple-touch-icon.png",
         ]
 
-        for favicon_url in favicon_urls:
-            try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    response = await client.get(favicon_url)
-
-                    if response.status_code != 200:
-                        continue
-
-                    # Check size
-                    if len(response.content) > self.max_favicon_size:
-                        logger.warning(
-                            f"Favicon too large: {len(response.content)} bytes (max {self.max_favicon_size})"
-                        )
-                        continue
+        # Request every candidate at once so a slow or timed-out favicon.ico
+        # does not delay the others, but keep the original preference order.
+        client = self._get_client()
+        tasks = [
+            asyncio.create_task(self._fetch_favicon(client, favicon_url))
+            for favicon_url in favicon_urls
+        ]
+        try:
+            for task in tasks:
+                content = await task
+                if content is None:
+                    continue
+
+                # Save favicon
+                favicon_filename = f"{domain}.ico"
+                favicon_path = storage_path / "favicons" / favicon_filename
+                try:
+                    await asyncio.to_thread(_write_file, favicon_path, content)
+                except Exception as e:
+                    logger.debug("Failed to save favicon for %s: %s", domain, e)
+                    continue
+
+                logger.info("Downloaded favicon for %s", domain)
+
+                return f"favicons/{favicon_filename}"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.info("No favicon found for %s", domain)
+        return None
 
-                    # Save favicon
-                    favicon_filename = f"{domain}.ico"
-                    favicon_path = storage_path / "favicons" / favicon_filename
-                    favicon_path.parent.mkdir(parents=True, exist_ok=True)
+    async def _fetch_favicon(
+        self, client: httpx.AsyncClient, favicon_url: str
+    ) -> Optional[bytes]:
+        """Fetch one favicon candidate, returning its bytes if usable."""
+        try:
+            response = await client.get(favicon_url, timeout=5.0, follow_redirects=False)
+        except Exception as e:
+            logger.debug("Failed to download favicon from %s: %s", favicon_url, e)
+            return None
 
-                    await asyncio.to_thread(favicon_path.write_bytes, response.content)
+        if response.status_code != 200:
+            return None
 
-                    logger.info(f"Downloaded favicon for {domain}")
+        # Check size
+        if len(response.content) > self.max_favicon_size:
+            logger.warning(
+                "Favicon too large: %s bytes (max %s)",
+                len(response.content),
+                self.max_favicon_size,
+            )
+            return None
 
-                    return f"favicons/{favicon_filename}"
+        return response.content
 
-            except Exception as e:
-                logger.debug(f"Failed to download favicon from {favicon_url}: {e}")
-                continue
 
-        logger.info(f"No favicon found for {domain}")
-        return None
+def _write_file(path: Path, data: bytes) -> None:
+    """Create parent directories and write bytes (runs in a worker thread)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from ..models.bookmark import Bookmark
 from ..models.config import AppConfig
-from .ai_inference import MultiProviderInferenceService, ProviderAttemptDiagnostics
+from ..models.ingest import IngestCapture, IngestCommitRequest
+from .ai_inference import (
+    MultiProviderInferenceService,
+    ProviderAttemptDiagnostics,
+    StructuredMetadata,
+)
 from .bookmark_manager import BookmarkManager
 from .content_analyzer import ContentAnalyzer
 from .storage_manager import StorageManager
@@ -23,9 +29,10 @@ class PreviewRecord:
     preview_id: str
     created_at: datetime
     expires_at: datetime
-    payload: Dict[str, Any]
+    payload: IngestCapture
     suggestion: Dict[str, Any]
     provider_trace: List[ProviderAttemptDiagnostics]
+    serialized_trace: List[Dict[str, Any]]
 
 
 class IngestionError(Exception):
@@ -50,17 +57,19 @@ class IngestionService:
         self.storage_manager = storage_manager
         self.content_analyzer = content_analyzer
         self.inference_service = inference_service
-        self.previews: Dict[str, PreviewRecord] = {}
+        # Insertion order is expiry order since the TTL is fixed, so cleanup
+        # only has to look at the front.
+        self.previews: OrderedDict[str, PreviewRecord] = OrderedDict()
 
-    async def create_preview(self, payload: Dict[str, Any], storage_location: str) -> Dict[str, Any]:
+    async def create_preview(self, payload: IngestCapture, storage_location: str) -> Dict[str, Any]:
         """Generate ingest suggestions and return preview handle."""
         self._cleanup_expired_previews()
 
-        url = payload["url"]
-        page_title = payload.get("page_title") or ""
-        selected_text = payload.get("selected_text") or ""
-        page_excerpt = payload.get("page_excerpt") or ""
-        user_note = payload.get("user_note") or ""
+        url = str(payload.url)
+        page_title = payload.page_title or ""
+        selected_text = payload.selected_text or ""
+        page_excerpt = payload.page_excerpt or ""
+        user_note = payload.user_note or ""
 
         analysis = await self.content_analyzer.analyze_url(url)
         ai_suggestion, provider_trace = await self.inference_service.generate_structured_metadata(
@@ -71,24 +80,27 @@ class IngestionService:
             user_note=user_note,
         )
 
+        metadata = ai_suggestion or StructuredMetadata()
         base_keywords = analysis.get("keywords", [])
-        inferred_keywords = (ai_suggestion or {}).get("keywords") or []
+        inferred_keywords = metadata.keywords or []
         merged_keywords = self._merge_keywords(inferred_keywords, base_keywords)
 
         suggested_title = (
-            (ai_suggestion or {}).get("title")
+            metadata.title
             or page_title
             or analysis.get("title")
             or url
         )
-        suggested_tags = self._normalize_list((ai_suggestion or {}).get("tags"), 6)
-        summary = (ai_suggestion or {}).get("summary") or user_note
-        confidence = float((ai_suggestion or {}).get("confidence") or 0.5)
+        suggested_tags = self._normalize_list(metadata.tags, 6)
+        summary = metadata.summary or user_note
+        confidence = float(metadata.confidence or 0.5)
         dedupe_candidates = self._find_dedupe_candidates(url, limit=5)
 
         preview_id = str(uuid4())
         now = datetime.now(timezone.utc)
         ttl = timedelta(seconds=self.config.ingest_preview_ttl_seconds)
+        # Serialized once; the preview response and trace lookups share it.
+        serialized_trace = [asdict(attempt) for attempt in provider_trace]
         suggestion = {
             "suggested_title": suggested_title,
             "suggested_keywords": merged_keywords,
@@ -106,17 +118,22 @@ class IngestionService:
             payload=payload,
             suggestion=suggestion,
             provider_trace=provider_trace,
+            serialized_trace=serialized_trace,
         )
+        while len(self.previews) > self.config.ingest_preview_max_entries:
+            self.previews.popitem(last=False)
 
         return {
             "preview_id": preview_id,
             "created_at": now,
             "expires_at": now + ttl,
             **suggestion,
-            "provider_trace": [vars(a) for a in provider_trace],
+            "provider_trace": serialized_trace,
         }
 
-    async def commit_preview(self, preview_id: str, final_data: Dict[str, Any]) -> Bookmark:
+    async def commit_preview(
+        self, preview_id: str, final_data: Optional[IngestCommitRequest] = None
+    ) -> Bookmark:
         """Persist bookmark based on preview and user edits."""
         self._cleanup_expired_previews()
         record = self.previews.get(preview_id)
@@ -127,17 +144,21 @@ class IngestionService:
         payload = record.payload
         storage_location = suggestion["storage_location"]
 
-        title = final_data.get("title") or suggestion["suggested_title"]
-        description = final_data.get("description") or suggestion["summary"] or payload.get("user_note")
+        title = (final_data and final_data.title) or suggestion["suggested_title"]
+        description = (
+            (final_data and final_data.description) or suggestion["summary"] or payload.user_note
+        )
         keywords = self._merge_keywords(
-            final_data.get("keywords") or [],
+            (final_data and final_data.keywords) or [],
             suggestion["suggested_keywords"],
         )
-        tags = self._normalize_list(final_data.get("tags") or suggestion["suggested_tags"], 10)
-        folder_path = final_data.get("folder_path")
+        tags = self._normalize_list(
+            (final_data and final_data.tags) or suggestion["suggested_tags"], 10
+        )
+        folder_path = final_data.folder_path if final_data else None
 
         bookmark = await self.bookmark_manager.create_bookmark(
-            url=payload["url"],
+            url=str(payload.url),
             title=title,
             storage_location=storage_location,
             keywords=keywords,
@@ -149,10 +170,10 @@ class IngestionService:
         self.previews.pop(preview_id, None)
         return bookmark
 
-    async def quick_save(self, payload: Dict[str, Any], storage_location: str) -> Bookmark:
+    async def quick_save(self, payload: IngestCapture, storage_location: str) -> Bookmark:
         """Fast path create with minimal interactive review."""
         preview = await self.create_preview(payload, storage_location)
-        return await self.commit_preview(preview["preview_id"], {})
+        return await self.commit_preview(preview["preview_id"])
 
     def get_provider_status(self) -> list[dict]:
         return self.inference_service.get_provider_status()
@@ -162,47 +183,49 @@ class IngestionService:
         record = self.previews.get(preview_id)
         if record is None:
             raise IngestionError(f"Preview not found or expired: {preview_id}")
-        return [vars(a) for a in record.provider_trace]
+        return record.serialized_trace
 
     def _cleanup_expired_previews(self) -> None:
         now = datetime.now(timezone.utc)
-        expired_ids = [pid for pid, rec in self.previews.items() if rec.expires_at < now]
-        for pid in expired_ids:
-            self.previews.pop(pid, None)
+        while self.previews:
+            record = next(iter(self.previews.values()))
+            if record.expires_at >= now:
+                break
+            self.previews.popitem(last=False)
 
     def _merge_keywords(self, first: List[str], second: List[str]) -> List[str]:
-        merged: List[str] = []
+        # dict keys keep first-seen order with O(1) membership checks.
+        merged: Dict[str, None] = {}
         for source in [first or [], second or []]:
             for keyword in source:
                 kw = (keyword or "").strip().lower()
-                if kw and kw not in merged:
-                    merged.append(kw)
-        return merged[:4]
+                if kw:
+                    merged[kw] = None
+                    if len(merged) == 4:
+                        return list(merged)
+        return list(merged)
 
     def _normalize_list(self, values: Any, max_items: int) -> List[str]:
-        if not isinstance(values, list):
+        if not isinstance(values, list) or max_items <= 0:
             return []
-        cleaned: List[str] = []
+        cleaned: Dict[str, None] = {}
         for value in values:
             item = str(value).strip()
-            if item and item not in cleaned:
-                cleaned.append(item)
-        return cleaned[:max_items]
+            if item:
+                cleaned[item] = None
+                if len(cleaned) == max_items:
+                    break
+        return list(cleaned)
 
     def _find_dedupe_candidates(self, url: str, limit: int = 5) -> List[dict]:
-        all_items = self.storage_manager.get_bookmarks(include_deleted=False)
-        url_text = url.strip().rstrip("/")
-        matches = []
-        for item in all_items:
-            if str(item.url).rstrip("/") == url_text:
-                matches.append(
-                    {
-                        "id": item.id,
-                        "title": item.title,
-                        "url": str(item.url),
-                        "keywords": item.keywords,
-                        "last_accessed": item.last_accessed,
-                        "storage_location": item.storage_location,
-                    }
-                )
-        return matches[:limit]
+        return [
+            {
+                "id": item.id,
+                "title": item.title,
+                "url": str(item.url),
+                "keywords": item.keywords,
+                "last_accessed": item.last_accessed,
+                "storage_location": item.storage_location,
+            }
+            for item in self.storage_manager.get_bookmarks_by_url(url)[:limit]
+        ]
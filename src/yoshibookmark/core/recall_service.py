@@ -2,22 +2,156 @@
 
 from __future__ import annotations
 
+import array
 import asyncio
+import heapq
 import math
+import operator
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 from ..models.bookmark import Bookmark
 from ..models.config import AppConfig, EnvSettings
 from .storage_manager import StorageManager
 
+# NumPy (optional "speedups" extra) scores every bookmark with one
+# matrix-vector product; without it the same math runs in pure Python.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy not installed
+    np = None
+
+# pyahocorasick (optional "speedups" extra) finds all query tokens in one pass
+# over a field. Below AHO_CORASICK_MIN_TOKENS tokens, a C-level `in` check per
+# token is faster than walking the automaton, so it is only used for long queries.
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick not installed
+    ahocorasick = None
+
+AHO_CORASICK_MIN_TOKENS = 10
+
+# Maximal alphanumeric runs of lowercased field text. A query token only
+# contains [a-z0-9], so any occurrence of it lies inside one such run.
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Below this many bookmarks, scoring is faster inline than the thread hop.
+RECALL_THREAD_MIN_BOOKMARKS = 200
+
+# Query tokens whose matching vocabulary words are remembered between queries.
+TOKEN_MATCH_CACHE_SIZE = 256
+
+# Maximum number of inputs the embeddings API accepts per request.
+EMBEDDING_BATCH_SIZE = 2048
+
+# A unit-length embedding. Query vectors are float32 ndarrays (NumPy) or lists
+# of floats; cached bookmark vectors are stored compactly, see _stored_vector.
+Vector = Any
+
 
 @dataclass
 class _EmbeddingEntry:
-    stamp: str
-    vector: List[float]
+    stamp: Optional[datetime]
+    vector: Vector
+
+
+@dataclass(slots=True)
+class _LoweredFields:
+    """Lowercased searchable text of one bookmark version."""
+
+    stamp: Optional[datetime]
+    title: str
+    keywords: str
+    tags: str
+    description: str
+    url: str
+    words: FrozenSet[str]
+    # Bookmark object last seen with this version, to skip re-checking it.
+    source: Bookmark
+
+
+def _searchable_fields(bookmark: Bookmark) -> Tuple[Any, ...]:
+    """Raw values of the fields keyword search reads."""
+    return (
+        bookmark.title,
+        bookmark.keywords,
+        bookmark.tags,
+        bookmark.description,
+        bookmark.url,
+    )
+
+
+def _make_token_matcher(tokens: Sequence[str]) -> Callable[[str], Set[str]]:
+    """Return a function giving the tokens contained in a lowercased text."""
+    if ahocorasick is not None and len(tokens) >= AHO_CORASICK_MIN_TOKENS:
+        automaton = ahocorasick.Automaton()
+        for token in tokens:
+            automaton.add_word(token, token)
+        automaton.make_automaton()
+        return lambda text: {token for _, token in automaton.iter(text)}
+    return lambda text: {token for token in tokens if token in text}
+
+
+def _unit_vector(values: Sequence[float]) -> Vector:
+    """Scale an embedding to unit length so cosine similarity is a dot product."""
+    if np is not None:
+        vector = np.asarray(values, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+    norm = math.sqrt(math.fsum(v * v for v in values))
+    return [v / norm for v in values] if norm > 0 else list(values)
+
+
+def _stored_vector(values: Sequence[float]) -> Vector:
+    """Unit vector in the compact form kept in the embedding cache.
+
+    float16 with NumPy (2 bytes per dimension, ~3 KB for a 1536-dim model;
+    unit-vector components lose well under 1e-3, which does not change
+    rankings), else a float32 array.array instead of a list of boxed floats.
+    """
+    vector = _unit_vector(values)
+    if np is not None:
+        return vector.astype(np.float16)
+    return array.array("f", vector)
+
+
+def _similarities(query: Vector, vectors: Sequence[Vector]) -> Sequence[float]:
+    """Cosine similarity of each unit vector against the unit query vector.
+
+    Vectors whose dimension differs from the query (e.g. cached under an
+    older embedding model) score 0. Returns a float32 array when NumPy is
+    available, otherwise a list.
+    """
+    dim = len(query)
+    matching = [i for i, vector in enumerate(vectors) if len(vector) == dim and dim]
+    if np is not None:
+        scores = np.zeros(len(vectors), dtype=np.float32)
+        if matching:
+            # Cached vectors are float16; upcast once for the product.
+            scores[matching] = np.stack([vectors[i] for i in matching]).astype(np.float32) @ query
+        return scores
+    scores = [0.0] * len(vectors)
+    for i in matching:
+        scores[i] = math.fsum(map(operator.mul, vectors[i], query))
+    return scores
+
+
+def _normalize_scores(scores: Sequence[float]) -> List[float]:
+    """Min-max normalize scores to [0, 1]; all 0.5 when they are (nearly) equal."""
+    if np is not None:
+        values = np.asarray(scores, dtype=np.float32)
+        low, high = float(values.min()), float(values.max())
+        if math.isclose(high, low):
+            return [0.5] * len(values)
+        return ((values - low) / (high - low)).tolist()
+
+    low, high = min(scores), max(scores)
+    if math.isclose(high, low):
+        return [0.5] * len(scores)
+    return [(value - low) / (high - low) for value in scores]
 
 
 class RecallService:
@@ -33,7 +167,44 @@ class RecallService:
         self.storage_manager = storage_manager
         self.env_settings = env_settings
         self._embedding_cache: Dict[str, _EmbeddingEntry] = {}
+        self._lowered_cache: Dict[str, _LoweredFields] = {}
+        # Inverted index: field word -> ids of bookmarks containing it. Kept in
+        # step with _lowered_cache; guarded by a lock since ranking may run in
+        # worker threads.
+        self._word_postings: Dict[str, Set[str]] = {}
+        # Query token -> vocabulary words containing it, kept in step with
+        # _word_postings so a repeated token needs no vocabulary scan.
+        self._token_words: Dict[str, Set[str]] = {}
+        self._index_lock = threading.Lock()
         self._token_pattern = re.compile(r"[a-z0-9]{2,}")
+        self._embedding_client: Optional[Any] = None
+
+    def _get_embedding_client(self) -> Any:
+        """Return the shared OpenAI client used for embeddings, creating it on first use."""
+        if self._embedding_client is None:
+            # Imported lazily: the SDK is slow to import and only needed when
+            # semantic search is enabled.
+            from openai import AsyncOpenAI
+
+            client_kwargs = {
+                "api_key": self.env_settings.openai_api_key,
+                "timeout": max(0.1, self.config.recall_query_timeout_ms / 1000.0),
+            }
+            if self.env_settings.openai_api_base:
+                client_kwargs["base_url"] = self.env_settings.openai_api_base
+            self._embedding_client = AsyncOpenAI(**client_kwargs)
+        return self._embedding_client
+
+    async def prewarm(self) -> None:
+        """Import and build the embeddings client ahead of the first recall query."""
+        if self.config.enable_semantic_search and self.env_settings.openai_api_key:
+            await asyncio.to_thread(self._get_embedding_client)
+
+    async def aclose(self) -> None:
+        """Close the embeddings client's HTTP connections."""
+        if self._embedding_client is not None:
+            await self._embedding_client.close()
+            self._embedding_client = None
 
     async def query(
         self,
@@ -47,10 +218,7 @@ class RecallService:
         storage_name = current_storage if scope == "current" else None
         bookmarks = self.storage_manager.get_bookmarks(storage_name=storage_name, include_deleted=False)
 
-        keyword_scores: Dict[str, float] = {}
         query_tokens = self._tokenize(query_text)
-        for bookmark in bookmarks:
-            keyword_scores[bookmark.id] = self._keyword_score(query_tokens, bookmark)
 
         semantic_available = False
         fallback_reason = None
@@ -65,28 +233,18 @@ class RecallService:
         else:
             fallback_reason = "semantic_search_disabled"
 
-        w_semantic = self.config.recall_semantic_weight
-        w_keyword = self.config.recall_keyword_weight
-        if (w_semantic + w_keyword) <= 0:
-            w_semantic, w_keyword = 0.55, 0.45
-
-        scored: List[Tuple[float, Bookmark, float, float, str, List[str]]] = []
-        for bookmark in bookmarks:
-            k_score = keyword_scores.get(bookmark.id, 0.0)
-            s_score = semantic_scores.get(bookmark.id, 0.0) if semantic_available else 0.0
-            if semantic_available:
-                final_score = (w_keyword * k_score) + (w_semantic * s_score)
-            else:
-                final_score = k_score
-
-            if final_score <= 0:
-                continue
-
-            snippet, highlights = self._build_snippet(bookmark, query_tokens)
-            scored.append((final_score, bookmark, k_score, s_score, snippet, highlights))
-
-        scored.sort(key=lambda item: item[0], reverse=True)
-        top = scored[:effective_limit]
+        # Scoring is pure CPU work; for larger libraries run it in a worker
+        # thread so other requests are served meanwhile.
+        rank_args = (
+            bookmarks,
+            query_tokens,
+            semantic_scores if semantic_available else None,
+            effective_limit,
+        )
+        if len(bookmarks) >= RECALL_THREAD_MIN_BOOKMARKS:
+            top = await asyncio.to_thread(self._score_and_rank, *rank_args)
+        else:
+            top = self._score_and_rank(*rank_args)
 
         return {
             "query": query_text,
@@ -95,7 +253,7 @@ class RecallService:
             "fallback_reason": fallback_reason,
             "results": [
                 {
-                    "bookmark": item[1].model_dump(mode="json"),
+                    "bookmark": item[1],
                     "score": round(item[0], 6),
                     "score_breakdown": {
                         "keyword": round(item[2], 6),
@@ -110,6 +268,63 @@ class RecallService:
             "searched_storage_names": self._searched_storages(scope, current_storage),
         }
 
+    def _score_and_rank(
+        self,
+        bookmarks: List[Bookmark],
+        query_tokens: List[str],
+        semantic_scores: Optional[Dict[str, float]],
+        limit: int,
+    ) -> List[Tuple[float, Bookmark, float, float, str, List[str]]]:
+        """Score bookmarks and return the top `limit` with snippets, best first.
+
+        semantic_scores is None when semantic search is unavailable, in which
+        case ranking is keyword-only.
+        """
+        matcher = _make_token_matcher(query_tokens)
+        w_semantic = self.config.recall_semantic_weight
+        w_keyword = self.config.recall_keyword_weight
+        if (w_semantic + w_keyword) <= 0:
+            w_semantic, w_keyword = 0.55, 0.45
+
+        # Index new or changed bookmarks, then only score the ones the
+        # inverted index says contain a query token; the rest score 0.
+        # Bookmarks are replaced rather than mutated, so an object indexed
+        # before needs no further check.
+        lowered_cache = self._lowered_cache
+        for bookmark in bookmarks:
+            cached = lowered_cache.get(bookmark.id)
+            if cached is None or cached.source is not bookmark:
+                self._lowered_fields(bookmark)
+        if len(lowered_cache) > len(bookmarks):
+            self._prune_index(bookmarks)
+        candidates = self._keyword_candidates(query_tokens) if query_tokens else set()
+
+        scored: List[Tuple[float, Bookmark, float, float]] = []
+        for bookmark in bookmarks:
+            if bookmark.id in candidates:
+                k_score = self._keyword_score(query_tokens, bookmark, matcher)
+            else:
+                k_score = 0.0
+            if semantic_scores is not None:
+                s_score = semantic_scores.get(bookmark.id, 0.0)
+                final_score = (w_keyword * k_score) + (w_semantic * s_score)
+            else:
+                s_score = 0.0
+                final_score = k_score
+
+            if final_score <= 0:
+                continue
+
+            scored.append((final_score, bookmark, k_score, s_score))
+
+        # nlargest is a stable partial sort; snippets are built for the top only.
+        top = heapq.nlargest(limit, scored, key=operator.itemgetter(0))
+        return [
+            (final_score, bookmark, k_score, s_score)
+            + self._build_snippet(bookmark, query_tokens, matcher)
+            for final_score, bookmark, k_score, s_score in top
+        ]
+
     def _searched_storages(self, scope: str, current_storage: Optional[str]) -> List[str]:
         if scope == "current" and current_storage:
             return [current_storage]
@@ -119,49 +334,68 @@ class RecallService:
         lowered = text.lower()
         return list(dict.fromkeys(self._token_pattern.findall(lowered)))
 
-    def _keyword_score(self, query_tokens: List[str], bookmark: Bookmark) -> float:
+    def _keyword_score(
+        self,
+        query_tokens: List[str],
+        bookmark: Bookmark,
+        matcher: Optional[Callable[[str], Set[str]]] = None,
+    ) -> float:
         if not query_tokens:
             return 0.0
 
-        fields = {
-            "title": (bookmark.title or "", 4.0),
-            "keywords": (" ".join(bookmark.keywords or []), 3.0),
-            "tags": (" ".join(bookmark.tags or []), 2.0),
-            "description": (bookmark.description or "", 1.5),
-            "url": (str(bookmark.url), 1.0),
-        }
-        total_weight = sum(weight for _, weight in fields.values())
-        total_score = 0.0
+        matcher = matcher or _make_token_matcher(query_tokens)
+        lowered = self._lowered_fields(bookmark)
+        fields = (
+            (lowered.title, 4.0),
+            (lowered.keywords, 3.0),
+            (lowered.tags, 2.0),
+            (lowered.description, 1.5),
+            (lowered.url, 1.0),
+        )
+        total_weight = sum(weight for _, weight in fields)
+        token_scores = dict.fromkeys(query_tokens, 0.0)
 
-        for token in query_tokens:
-            token_score = 0.0
-            for field_text, weight in fields.values():
-                lowered = field_text.lower()
-                if token in lowered:
-                    token_score += weight
-            total_score += min(token_score / total_weight, 1.0)
+        for field_text, weight in fields:
+            for token in matcher(field_text):
+                token_scores[token] += weight
 
+        total_score = sum(min(score / total_weight, 1.0) for score in token_scores.values())
         return min(total_score / len(query_tokens), 1.0)
 
-    def _build_snippet(self, bookmark: Bookmark, query_tokens: List[str]) -> Tuple[str, List[str]]:
+    def _build_snippet(
+        self,
+        bookmark: Bookmark,
+        query_tokens: List[str],
+        matcher: Optional[Callable[[str], Set[str]]] = None,
+    ) -> Tuple[str, List[str]]:
+        lowered = self._lowered_fields(bookmark)
         candidates = [
-            ("title", bookmark.title or ""),
-            ("description", bookmark.description or ""),
-            ("keywords", ", ".join(bookmark.keywords or [])),
-            ("url", str(bookmark.url)),
+            ("title", lowered.title),
+            ("description", lowered.description),
+            ("keywords", lowered.keywords),
+            ("url", lowered.url),
         ]
 
-        best_text = bookmark.title
+        best_field = "title"
         best_matches = -1
         highlights: List[str] = []
-        for _, text in candidates:
-            lowered = text.lower()
-            matched = [token for token in query_tokens if token in lowered]
+        matcher = matcher or _make_token_matcher(query_tokens)
+        for field, text in candidates:
+            found = matcher(text)
+            matched = [token for token in query_tokens if token in found]
             if len(matched) > best_matches:
                 best_matches = len(matched)
-                best_text = text
+                best_field = field
                 highlights = matched
 
+        # Only the winning field's original text is needed for display.
+        if best_field == "keywords":
+            best_text = ", ".join(bookmark.keywords or [])
+        elif best_field == "url":
+            best_text = str(bookmark.url)
+        else:
+            best_text = getattr(bookmark, best_field)
+
         snippet = (best_text or "").strip()
         if len(snippet) > 180:
             snippet = snippet[:177] + "..."
@@ -172,41 +406,142 @@ class RecallService:
         query_text: str,
         bookmarks: List[Bookmark],
     ) -> Dict[str, float]:
-        query_vector = await self._embed_text(query_text)
-        raw_scores: Dict[str, float] = {}
-
-        for bookmark in bookmarks:
-            vector = await self._bookmark_vector(bookmark)
-            raw_scores[bookmark.id] = self._cosine_similarity(query_vector, vector)
-
-        if not raw_scores:
+        if not bookmarks:
             return {}
 
-        min_score = min(raw_scores.values())
-        max_score = max(raw_scores.values())
-        if math.isclose(max_score, min_score):
-            return {key: 0.5 for key in raw_scores.keys()}
-
-        return {
-            key: (value - min_score) / (max_score - min_score)
-            for key, value in raw_scores.items()
-        }
-
-    async def _bookmark_vector(self, bookmark: Bookmark) -> List[float]:
+        # Embed the query and every bookmark without a fresh cached vector in
+        # one batched request instead of a round trip per bookmark.
+        # Entries are collected locally: the shared cache may be pruned by a
+        # concurrent query while this one awaits the embeddings.
+        stamps = [self._bookmark_stamp(bookmark) for bookmark in bookmarks]
+        entries: Dict[str, _EmbeddingEntry] = {}
+        stale = []
+        for bookmark, stamp in zip(bookmarks, stamps, strict=True):
+            entry = self._embedding_cache.get(bookmark.id)
+            if entry is None or entry.stamp != stamp:
+                stale.append((bookmark, stamp))
+            else:
+                entries[bookmark.id] = entry
+        embeddings = await self._embed_texts(
+            [query_text] + [self._bookmark_text(bookmark) for bookmark, _ in stale]
+        )
+        query_vector = _unit_vector(embeddings[0])
+        # Pair every vector before caching any, so a short response caches nothing.
+        fresh = [
+            (bookmark.id, _EmbeddingEntry(stamp=stamp, vector=_stored_vector(embedding)))
+            for (bookmark, stamp), embedding in zip(stale, embeddings[1:], strict=True)
+        ]
+        entries.update(fresh)
+        self._embedding_cache.update(fresh)
+
+        vectors = [entries[bookmark.id].vector for bookmark in bookmarks]
+        scores = _normalize_scores(_similarities(query_vector, vectors))
+        return dict(zip((bookmark.id for bookmark in bookmarks), scores, strict=True))
+
+    def _lowered_fields(self, bookmark: Bookmark) -> _LoweredFields:
+        """Return the bookmark's lowercased search fields, cached per version."""
+        stamp = self._bookmark_stamp(bookmark)
+        cached = self._lowered_cache.get(bookmark.id)
+        # A reload can yield a new object with edited fields but the same stamp
+        # (e.g. a hand-edited file), so a new object's fields are compared too.
+        if (
+            cached is not None
+            and cached.stamp == stamp
+            and (
+                cached.source is bookmark
+                or _searchable_fields(cached.source) == _searchable_fields(bookmark)
+            )
+        ):
+            cached.source = bookmark
+            return cached
+
+        # Tokens never contain separators, so one join serves both scoring
+        # and snippet matching.
+        title = (bookmark.title or "").lower()
+        keywords = " ".join(bookmark.keywords or []).lower()
+        tags = " ".join(bookmark.tags or []).lower()
+        description = (bookmark.description or "").lower()
+        url = str(bookmark.url).lower()
+        words = frozenset(
+            _WORD_PATTERN.findall(" ".join((title, keywords, tags, description, url)))
+        )
+        fields = _LoweredFields(stamp, title, keywords, tags, description, url, words, bookmark)
+
+        with self._index_lock:
+            if cached is not None:
+                for word in cached.words - words:
+                    self._remove_posting(word, bookmark.id)
+            for word in words:
+                self._add_posting(word, bookmark.id)
+            self._lowered_cache[bookmark.id] = fields
+        return fields
+
+    def _prune_index(self, bookmarks: List[Bookmark]) -> None:
+        """Evict cached entries of bookmarks that no longer exist.
+
+        IDs absent from `bookmarks` are only evicted once the storage manager
+        no longer holds them, so a scoped query keeps other storages cached.
+        """
+        live_ids = {bookmark.id for bookmark in bookmarks}
+        with self._index_lock:
+            gone = [
+                bookmark_id
+                for bookmark_id in self._lowered_cache
+                if bookmark_id not in live_ids
+                and self.storage_manager.get_bookmark_by_id(bookmark_id) is None
+            ]
+            for bookmark_id in gone:
+                fields = self._lowered_cache.pop(bookmark_id)
+                for word in fields.words:
+                    self._remove_posting(word, bookmark_id)
+                self._embedding_cache.pop(bookmark_id, None)
+
+    def _add_posting(self, word: str, bookmark_id: str) -> None:
+        """Record that a bookmark contains word. Caller holds _index_lock."""
+        postings = self._word_postings.get(word)
+        if postings is None:
+            postings = self._word_postings[word] = set()
+            for token, token_words in self._token_words.items():
+                if token in word:
+                    token_words.add(word)
+        postings.add(bookmark_id)
+
+    def _remove_posting(self, word: str, bookmark_id: str) -> None:
+        """Drop a bookmark from word's postings. Caller holds _index_lock."""
+        postings = self._word_postings.get(word)
+        if postings is None:
+            return
+        postings.discard(bookmark_id)
+        if not postings:
+            del self._word_postings[word]
+            for token_words in self._token_words.values():
+                token_words.discard(word)
+
+    def _keyword_candidates(self, query_tokens: List[str]) -> Set[str]:
+        """Ids of indexed bookmarks with at least one query token in a field.
+
+        A token matches a word it is a substring of, as _keyword_score does.
+        The vocabulary is scanned only the first time a token is queried; its
+        matching words are then kept up to date as bookmarks are indexed, so
+        repeat queries just read the postings.
+        """
+        candidates: Set[str] = set()
+        with self._index_lock:
+            for token in query_tokens:
+                token_words = self._token_words.get(token)
+                if token_words is None:
+                    if len(self._token_words) >= TOKEN_MATCH_CACHE_SIZE:
+                        self._token_words.clear()
+                    token_words = {word for word in self._word_postings if token in word}
+                    self._token_words[token] = token_words
+                for word in token_words:
+                    candidates.update(self._word_postings[word])
+        return candidates
+
+    def _bookmark_stamp(self, bookmark: Bookmark) -> Optional[datetime]:
+        # Compared as-is; formatting a string per bookmark per query is wasted work.
         stamp_dt = bookmark.last_modified or bookmark.created_at
-        if isinstance(stamp_dt, datetime):
-            stamp = stamp_dt.isoformat()
-        else:
-            stamp = ""
-
-        cache = self._embedding_cache.get(bookmark.id)
-        if cache and cache.stamp == stamp:
-            return cache.vector
-
-        text = self._bookmark_text(bookmark)
-        vector = await self._embed_text(text)
-        self._embedding_cache[bookmark.id] = _EmbeddingEntry(stamp=stamp, vector=vector)
-        return vector
+        return stamp_dt if isinstance(stamp_dt, datetime) else None
 
     def _bookmark_text(self, bookmark: Bookmark) -> str:
         return "\n".join(
@@ -219,33 +554,18 @@ class RecallService:
             ]
         )
 
-    async def _embed_text(self, text: str) -> List[float]:
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in as few requests as the API's batch limit allows."""
         if not self.env_settings.openai_api_key:
             raise RuntimeError("missing_openai_api_key")
 
-        timeout_s = max(0.1, self.config.recall_query_timeout_ms / 1000.0)
-        model_name = self.config.embedding_model
-        api_key = self.env_settings.openai_api_key
-        base_url = self.env_settings.openai_api_base
-
-        def _embed() -> List[float]:
-            from openai import OpenAI
-
-            client_kwargs = {"api_key": api_key, "timeout": timeout_s}
-            if base_url:
-                client_kwargs["base_url"] = base_url
-            client = OpenAI(**client_kwargs)
-            response = client.embeddings.create(model=model_name, input=text)
-            return response.data[0].embedding
-
-        return await asyncio.to_thread(_embed)
-
-    def _cosine_similarity(self, v1: List[float], v2: List[float]) -> float:
-        if not v1 or not v2 or len(v1) != len(v2):
-            return 0.0
-        dot = sum(a * b for a, b in zip(v1, v2))
-        n1 = math.sqrt(sum(a * a for a in v1))
-        n2 = math.sqrt(sum(b * b for b in v2))
-        if n1 <= 0 or n2 <= 0:
-            return 0.0
-        return dot / (n1 * n2)
+        client = self._get_embedding_client()
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            response = await client.embeddings.create(
+                model=self.config.embedding_model,
+                input=texts[start : start + EMBEDDING_BATCH_SIZE],
+            )
+            data = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in data)
+        return embeddings
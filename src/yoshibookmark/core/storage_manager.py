@@ -1,10 +1,15 @@
 """Storage manager for file operations and in-memory indexing."""
 
 import asyncio
+import json
 import logging
+import math
+import os
+from collections import deque
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from ..models.bookmark import Bookmark
 from ..models.storage import StorageLocation
@@ -13,6 +18,24 @@ from ..utils.yaml_handler import YAMLError, load_bookmark_from_file, save_bookma
 
 logger = logging.getLogger(__name__)
 
+# Bookmark files are read in contiguous batches, one executor job per batch,
+# with up to one batch per CPU. Small storages load in a single batch.
+LOAD_BATCH_MIN_FILES = 64
+
+# Parse cache persisted per storage so a cold start only re-parses bookmark
+# files changed since the last load. JSON rather than pickle: storages are
+# often synced folders, and loading a pickle from one would execute code.
+INDEX_CACHE_PATH = Path(".metadata") / "index_cache.json"
+INDEX_CACHE_VERSION = 1
+
+# Conflict messages kept per storage; counts stay exact beyond this.
+CONFLICT_HISTORY_LIMIT = 500
+
+
+def _url_key(bookmark: Bookmark) -> str:
+    """URL index key: the bookmark URL without a trailing slash."""
+    return str(bookmark.url).rstrip("/")
+
 
 class StorageError(Exception):
     """Storage-related error."""
@@ -23,13 +46,44 @@ class StorageError(Exception):
 class StorageManager:
     """Manages file I/O, indexing, and multi-storage for bookmarks."""
 
-    def __init__(self):
-        """Initialize storage manager."""
+    def __init__(self, write_probe: bool = False):
+        """Initialize storage manager.
+
+        Args:
+            write_probe: Verify storage access by creating and deleting a probe
+                file instead of os.access (debugging aid; writes on every start)
+        """
+        self.write_probe = write_probe
         self.storage_locations: Dict[str, StorageLocation] = {}
         self.in_memory_index: Dict[str, Dict[str, Bookmark]] = {}
         self.load_errors: Dict[str, List[str]] = {}  # {storage_name: [error_messages]}
-        self.conflicts: Dict[str, List[str]] = {}  # {storage_name: [conflict_messages]}
+        # {storage_name: most recent conflict messages, capped}
+        self.conflicts: Dict[str, Deque[str]] = {}
         self.current_storage_name: Optional[str] = None
+        # Conflict counts per storage and in total, kept in step with
+        # self.conflicts so health checks do not re-sum every storage.
+        self._conflict_counts: Dict[str, int] = {}
+        self._conflict_total = 0
+        # Bookmarks keyed by URL without trailing slash, built on first lookup,
+        # kept current by save/patch/delete and dropped when a storage loads.
+        self._url_index: Optional[Dict[str, List[Bookmark]]] = None
+        # Parsed bookmarks per storage, keyed by file path and checked against
+        # the file's (st_mtime_ns, st_size) so reloads skip unchanged files.
+        self._parse_cache: Dict[str, Dict[Path, Tuple[int, int, Bookmark]]] = {}
+        # Filter indexes for get_bookmarks, kept in step with in_memory_index:
+        # non-deleted bookmarks per storage, and bookmarks per (storage, folder).
+        self._active_index: Dict[str, Dict[str, Bookmark]] = {}
+        self._folder_index: Dict[Tuple[str, str], Dict[str, Bookmark]] = {}
+        # Filter buckets a moved bookmark was re-appended to out of
+        # in_memory_index order, as (storage, folder); folder None is the
+        # storage's active bucket. They are re-ordered on next read.
+        self._unordered_buckets: Set[Tuple[str, Optional[str]]] = set()
+        # Bookmark ID -> storage holding it, for global get_bookmark_by_id.
+        # An ID present in several storages maps to the first of them in
+        # storage_locations order.
+        self._id_to_storage: Dict[str, str] = {}
+        # Storage roots whose directory structure this process already ensured.
+        self._structure_ok: Set[str] = set()
 
     async def initialize(self, storage_locations: List[StorageLocation]) -> None:
         """Initialize storage manager with storage locations.
@@ -40,17 +94,33 @@ class StorageManager:
         Raises:
             StorageError: If initialization fails
         """
+        # Invalidate the memoized current storage; it is re-resolved below.
+        self.current_storage_name = None
+
         for storage in storage_locations:
             try:
                 self._validate_storage_location(storage)
-                self.storage_locations[storage.name] = storage
-                await self.load_storage(storage.name)
             except StorageError as e:
-                logger.error(f"Failed to initialize storage {storage.name}: {e}")
+                logger.error("Failed to initialize storage %s: %s", storage.name, e)
                 raise
+            self.storage_locations[storage.name] = storage
+
+        # Storage directories are independent, so load them concurrently.
+        storage_names = list(dict.fromkeys(storage.name for storage in storage_locations))
+        await asyncio.gather(*(self._load_initial_storage(name) for name in storage_names))
+        # Loads finish in any order; settle duplicate-ID ownership by config order.
+        self._rebuild_id_map()
 
         self.current_storage_name = self._select_current_storage_name()
 
+    async def _load_initial_storage(self, storage_name: str) -> None:
+        """Load one storage during initialization, logging failures."""
+        try:
+            await self.load_storage(storage_name)
+        except StorageError as e:
+            logger.error("Failed to initialize storage %s: %s", storage_name, e)
+            raise
+
     def _validate_storage_location(self, storage: StorageLocation) -> None:
         """Validate storage location is accessible.
 
@@ -68,7 +138,13 @@ class StorageManager:
         if not path.is_dir():
             raise StorageError(f"Storage path is not a directory: {storage.path}")
 
-        # Check permissions
+        # Check permissions. os.access is a single syscall with no disk write,
+        # which matters on synced (e.g. OneDrive) folders.
+        if not self.write_probe:
+            if not os.access(path, os.W_OK | os.X_OK):
+                raise StorageError(f"Cannot access storage: Permission denied for {storage.path}")
+            return
+
         try:
             test_file = path / ".yoshibookmark_test"
             test_file.touch()
@@ -91,68 +167,242 @@ class StorageManager:
             raise StorageError(f"Storage not found: {storage_name}")
 
         storage = self.storage_locations[storage_name]
-        bookmarks_path = Path(storage.path) / "bookmarks"
+        storage_path = Path(storage.path)
+        bookmarks_path = storage_path / "bookmarks"
 
-        # Create directory structure if it doesn't exist
-        self._ensure_storage_structure(Path(storage.path))
+        # Create directory structure if it doesn't exist. Filesystem calls run
+        # off the event loop so a slow (e.g. synced cloud) drive cannot stall it.
+        await asyncio.to_thread(self._ensure_storage_structure, storage_path)
 
         # Initialize index for this storage
         self.in_memory_index[storage_name] = {}
+        stale_ids = [
+            bookmark_id
+            for bookmark_id, owner in self._id_to_storage.items()
+            if owner == storage_name
+        ]
+        for bookmark_id in stale_ids:
+            self._assign_id_owner(bookmark_id)
+        self._rebuild_filter_indexes(storage_name)
+        self._url_index = None
         self.load_errors[storage_name] = []
-        self.conflicts[storage_name] = []
-
-        if not bookmarks_path.exists():
-            logger.info(f"No bookmarks directory in {storage_name}, created empty")
+        self._conflict_total -= self._conflict_counts.get(storage_name, 0)
+        self._conflict_counts[storage_name] = 0
+        self.conflicts[storage_name] = deque(maxlen=CONFLICT_HISTORY_LIMIT)
+
+        yaml_files = await asyncio.to_thread(self._list_bookmark_files, bookmarks_path)
+        if yaml_files is None:
+            self._parse_cache.pop(storage_name, None)
+            logger.info("No bookmarks directory in %s, created empty", storage_name)
             return
 
-        # Load all YAML files
-        yaml_files = list(bookmarks_path.glob("*.yaml"))
-        logger.info(f"Loading {len(yaml_files)} bookmarks from {storage_name}")
-
-        bookmark_sources: Dict[str, Path] = {}
-        for yaml_file in yaml_files:
-            try:
-                bookmark = await asyncio.to_thread(load_bookmark_from_file, yaml_file)
-
-                # Check for duplicate ID
-                if bookmark.id in self.in_memory_index[storage_name]:
-                    existing = self.in_memory_index[storage_name][bookmark.id]
-                    existing_path = bookmark_sources.get(bookmark.id, yaml_file)
-                    conflict_msg = (
-                        f"Conflict for bookmark ID {bookmark.id}: "
-                        f"{existing_path.name} vs {yaml_file.name}"
-                    )
-                    winner = self._choose_winner(existing, existing_path, bookmark, yaml_file)
-                    self.in_memory_index[storage_name][bookmark.id] = winner
-                    bookmark_sources[bookmark.id] = (
-                        yaml_file if winner is bookmark else existing_path
-                    )
-                    self.conflicts[storage_name].append(conflict_msg)
-                    logger.warning(conflict_msg)
-                    continue
-
-                self.in_memory_index[storage_name][bookmark.id] = bookmark
-                bookmark_sources[bookmark.id] = yaml_file
-
-            except YAMLError as e:
+        logger.info("Loading %s bookmarks from %s", len(yaml_files), storage_name)
+
+        # Reuse bookmarks parsed by an earlier load (in this process, or
+        # persisted by a previous one) when the file is unchanged.
+        previous_cache = self._parse_cache.get(storage_name)
+        if previous_cache is None:
+            previous_cache = await asyncio.to_thread(self._load_index_cache, storage_path)
+        parse_cache: Dict[Path, Tuple[int, int, Bookmark]] = {}
+        outcomes: Dict[Path, Tuple[Optional[Bookmark], Optional[Exception]]] = {}
+        to_parse: List[Path] = []
+        for yaml_file, stat_result in yaml_files:
+            cached = previous_cache.get(yaml_file)
+            if (
+                cached is not None
+                and stat_result is not None
+                and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size)
+            ):
+                parse_cache[yaml_file] = cached
+                outcomes[yaml_file] = (cached[2], None)
+            else:
+                to_parse.append(yaml_file)
+
+        # Read and parse the rest in a few worker batches rather than a thread
+        # hop per file; conflicts are resolved below in (sorted) file order so
+        # tie-breaks stay reproducible.
+        loop = asyncio.get_running_loop()
+        batch_count = max(1, min(os.cpu_count() or 1, len(to_parse) // LOAD_BATCH_MIN_FILES))
+        batch_size = max(1, math.ceil(len(to_parse) / batch_count))
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    None, self._bulk_load_sync, to_parse[start : start + batch_size]
+                )
+                for start in range(0, len(to_parse), batch_size)
+            )
+        )
+        for batch in batches:
+            for yaml_file, bookmark, error in batch:
+                outcomes[yaml_file] = (bookmark, error)
+
+        # Source file and its listed mtime per bookmark ID, for conflicts.
+        bookmark_sources: Dict[str, Tuple[Path, Optional[float]]] = {}
+        for yaml_file, stat_result in yaml_files:
+            bookmark, error = outcomes[yaml_file]
+            mtime = stat_result.st_mtime if stat_result is not None else None
+            if isinstance(error, YAMLError):
                 # Log and skip corrupted files
-                error_msg = f"Corrupted YAML in {yaml_file.name}: {e}"
+                error_msg = f"Corrupted YAML in {yaml_file.name}: {error}"
                 logger.warning(error_msg)
                 self.load_errors[storage_name].append(error_msg)
                 continue
-            except Exception as e:
+            if error is not None:
                 # Log unexpected errors but continue
-                error_msg = f"Failed to load {yaml_file.name}: {e}"
+                error_msg = f"Failed to load {yaml_file.name}: {error}"
                 logger.error(error_msg)
                 self.load_errors[storage_name].append(error_msg)
                 continue
 
+            # Check for duplicate ID
+            if bookmark.id in self.in_memory_index[storage_name]:
+                existing = self.in_memory_index[storage_name][bookmark.id]
+                existing_path, existing_mtime = bookmark_sources.get(
+                    bookmark.id, (yaml_file, mtime)
+                )
+                conflict_msg = (
+                    f"Conflict for bookmark ID {bookmark.id}: "
+                    f"{existing_path.name} vs {yaml_file.name}"
+                )
+                winner = self._choose_winner(existing, existing_mtime, bookmark, mtime)
+                self.in_memory_index[storage_name][bookmark.id] = winner
+                if winner is bookmark:
+                    bookmark_sources[bookmark.id] = (yaml_file, mtime)
+                self.conflicts[storage_name].append(conflict_msg)
+                self._conflict_counts[storage_name] += 1
+                self._conflict_total += 1
+                logger.warning(conflict_msg)
+                continue
+
+            self.in_memory_index[storage_name][bookmark.id] = bookmark
+            bookmark_sources[bookmark.id] = (yaml_file, mtime)
+
+        # Lookups during the load may have indexed a partial storage.
+        self._rebuild_filter_indexes(storage_name)
+        for bookmark_id in self.in_memory_index[storage_name]:
+            self._assign_id_owner(bookmark_id)
+        self._url_index = None
+
+        # Only files listed by this load are kept, so deleted files drop out.
+        reused = len(parse_cache)
+        for yaml_file, stat_result in yaml_files:
+            bookmark = outcomes[yaml_file][0]
+            if bookmark is not None and stat_result is not None and yaml_file not in parse_cache:
+                parse_cache[yaml_file] = (stat_result.st_mtime_ns, stat_result.st_size, bookmark)
+        self._parse_cache[storage_name] = parse_cache
+        if len(parse_cache) != reused or reused != len(previous_cache):
+            await asyncio.to_thread(self._write_index_cache, storage_path, parse_cache)
+
         logger.info(
-            f"Loaded {len(self.in_memory_index[storage_name])} bookmarks from {storage_name} "
-            f"({len(self.load_errors[storage_name])} errors, "
-            f"{len(self.conflicts[storage_name])} conflicts)"
+            "Loaded %s bookmarks from %s (%s errors, %s conflicts)",
+            len(self.in_memory_index[storage_name]),
+            storage_name,
+            len(self.load_errors[storage_name]),
+            self._conflict_counts[storage_name],
         )
 
+    @staticmethod
+    def _bulk_load_sync(
+        yaml_files: List[Path],
+    ) -> List[Tuple[Path, Optional[Bookmark], Optional[Exception]]]:
+        """Load bookmark files in order (blocking), pairing each with any error."""
+        results: List[Tuple[Path, Optional[Bookmark], Optional[Exception]]] = []
+        for yaml_file in yaml_files:
+            try:
+                results.append((yaml_file, load_bookmark_from_file(yaml_file), None))
+            except Exception as e:
+                results.append((yaml_file, None, e))
+        return results
+
+    @staticmethod
+    def _load_index_cache(storage_path: Path) -> Dict[Path, Tuple[int, int, Bookmark]]:
+        """Read a storage's persisted parse cache (blocking).
+
+        A missing, unreadable or outdated cache yields an empty one; entries
+        that no longer validate are skipped.
+
+        Args:
+            storage_path: Path to storage root
+
+        Returns:
+            Bookmark file path -> (st_mtime_ns, st_size, Bookmark)
+        """
+        try:
+            data = json.loads((storage_path / INDEX_CACHE_PATH).read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable index cache in %s: %s", storage_path, e)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_CACHE_VERSION:
+            return {}
+
+        bookmarks_path = storage_path / "bookmarks"
+        cache: Dict[Path, Tuple[int, int, Bookmark]] = {}
+        for name, entry in (data.get("files") or {}).items():
+            try:
+                mtime_ns, size, fields = entry
+                cache[bookmarks_path / name] = (mtime_ns, size, Bookmark.model_validate(fields))
+            except (TypeError, ValueError):
+                continue
+        return cache
+
+    @staticmethod
+    def _write_index_cache(
+        storage_path: Path, cache: Dict[Path, Tuple[int, int, Bookmark]]
+    ) -> None:
+        """Persist a storage's parse cache atomically (blocking, best effort).
+
+        Args:
+            storage_path: Path to storage root
+            cache: Bookmark file path -> (st_mtime_ns, st_size, Bookmark)
+        """
+        payload = {
+            "version": INDEX_CACHE_VERSION,
+            "files": {
+                path.name: [mtime_ns, size, bookmark.model_dump(mode="json")]
+                for path, (mtime_ns, size, bookmark) in cache.items()
+            },
+        }
+        target = storage_path / INDEX_CACHE_PATH
+        temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(exist_ok=True)
+            temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(temp_path, target)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            logger.warning("Could not write index cache in %s: %s", storage_path, e)
+
+    @staticmethod
+    def _list_bookmark_files(
+        bookmarks_path: Path,
+    ) -> Optional[List[Tuple[Path, Optional[os.stat_result]]]]:
+        """Return (path, stat) of bookmark YAML files sorted by name.
+
+        scandir exposes the entry type without an extra stat per file, and its
+        stat() result is cached on the entry (free on Windows). The stat is
+        None if the file vanished before it could be read.
+
+        Returns:
+            Sorted (path, stat) pairs, or None if the directory is missing
+        """
+        files: List[Tuple[str, Optional[os.stat_result]]] = []
+        try:
+            with os.scandir(bookmarks_path) as entries:
+                for entry in entries:
+                    if not (entry.name.endswith(".yaml") and entry.is_file()):
+                        continue
+                    try:
+                        stat_result: Optional[os.stat_result] = entry.stat()
+                    except OSError:
+                        stat_result = None
+                    files.append((entry.name, stat_result))
+        except FileNotFoundError:
+            return None
+        files.sort(key=lambda item: item[0])
+        return [(bookmarks_path / name, stat_result) for name, stat_result in files]
+
     def _ensure_storage_structure(self, storage_path: Path) -> None:
         """Ensure storage directory structure exists.
 
@@ -162,12 +412,18 @@ class StorageManager:
         Raises:
             StorageError: If directory creation fails
         """
+        # Done once per storage root per process; the mkdir calls are round
+        # trips on synced (e.g. OneDrive) folders even when nothing is created.
+        key = str(storage_path)
+        if key in self._structure_ok:
+            return
         try:
             (storage_path / "bookmarks").mkdir(parents=True, exist_ok=True)
             (storage_path / "favicons").mkdir(parents=True, exist_ok=True)
             (storage_path / "screenshots").mkdir(parents=True, exist_ok=True)
         except Exception as e:
             raise StorageError(f"Failed to create storage structure: {e}") from e
+        self._structure_ok.add(key)
 
     async def save_bookmark(self, bookmark: Bookmark, storage_name: str) -> None:
         """Save bookmark to YAML file with file locking.
@@ -196,7 +452,12 @@ class StorageManager:
             if storage_name not in self.in_memory_index:
                 self.in_memory_index[storage_name] = {}
 
+            previous = self.in_memory_index[storage_name].get(bookmark.id)
             self.in_memory_index[storage_name][bookmark.id] = bookmark
+            self._index_add(storage_name, bookmark, previous)
+            if previous is None:
+                self._assign_id_owner(bookmark.id)
+            self._update_url_index(previous, bookmark)
 
         except FileLockError as e:
             raise StorageError(f"Could not acquire lock for {bookmark.id}: {e}") from e
@@ -205,6 +466,51 @@ class StorageManager:
         except Exception as e:
             raise StorageError(f"Unexpected error saving {bookmark.id}: {e}") from e
 
+    async def patch_bookmark(
+        self, bookmark_id: str, storage_name: str, fields: Dict[str, Any]
+    ) -> Optional[Bookmark]:
+        """Apply field updates to a stored bookmark under its file lock.
+
+        The current version is taken from the index while the lock is held, so
+        concurrent patches to one bookmark (e.g. an edit racing an access
+        timestamp) cannot overwrite each other's fields.
+
+        Args:
+            bookmark_id: Bookmark UUID
+            storage_name: Storage location name
+            fields: Field values to set
+
+        Returns:
+            Updated bookmark, or None if it is not in the storage
+
+        Raises:
+            StorageError: If storage doesn't exist or save fails
+        """
+        if storage_name not in self.storage_locations:
+            raise StorageError(f"Storage not found: {storage_name}")
+
+        storage = self.storage_locations[storage_name]
+        file_path = Path(storage.path) / "bookmarks" / f"{bookmark_id}.yaml"
+
+        try:
+            async with FileLocker(file_path):
+                current = self.in_memory_index.get(storage_name, {}).get(bookmark_id)
+                if current is None:
+                    return None
+                updated = current.model_copy(update=fields)
+                await asyncio.to_thread(save_bookmark_to_file, updated, file_path)
+                self.in_memory_index[storage_name][bookmark_id] = updated
+                self._index_add(storage_name, updated, current)
+                self._update_url_index(current, updated)
+        except FileLockError as e:
+            raise StorageError(f"Could not acquire lock for {bookmark_id}: {e}") from e
+        except YAMLError as e:
+            raise StorageError(f"Failed to save bookmark {bookmark_id}: {e}") from e
+        except Exception as e:
+            raise StorageError(f"Unexpected error saving {bookmark_id}: {e}") from e
+
+        return updated
+
     def get_bookmarks(
         self,
         storage_name: Optional[str] = None,
@@ -221,25 +527,51 @@ class StorageManager:
         Returns:
             List of bookmarks matching filters
         """
-        bookmarks = []
-
         if storage_name:
             # Single storage
-            if storage_name in self.in_memory_index:
-                bookmarks = list(self.in_memory_index[storage_name].values())
+            storage_names = [storage_name] if storage_name in self.in_memory_index else []
         else:
             # All storages (Global view)
-            for storage_bookmarks in self.in_memory_index.values():
-                bookmarks.extend(storage_bookmarks.values())
-
-        # Apply filters
-        if not include_deleted:
-            bookmarks = [b for b in bookmarks if not b.deleted]
+            storage_names = list(self.in_memory_index)
 
+        # Read from the filter indexes so only matching bookmarks are visited.
+        # Results follow in_memory_index order either way.
+        if self._unordered_buckets:
+            self._restore_bucket_order()
         if folder_path is not None:
-            bookmarks = [b for b in bookmarks if b.folder_path == folder_path]
+            buckets = [self._folder_index.get((name, folder_path), {}) for name in storage_names]
+            if include_deleted:
+                return [b for bucket in buckets for b in bucket.values()]
+            return [b for bucket in buckets for b in bucket.values() if not b.deleted]
+        if include_deleted:
+            return [b for name in storage_names for b in self.in_memory_index[name].values()]
+        return [b for name in storage_names for b in self._active_index.get(name, {}).values()]
+
+    def get_bookmarks_by_url(self, url: str, include_deleted: bool = False) -> List[Bookmark]:
+        """Get bookmarks across all storages whose URL matches.
+
+        URLs are compared without a trailing slash. The lookup index is built
+        on first use, updated in place by saves, patches and deletes, and
+        rebuilt after a storage load.
+
+        Args:
+            url: URL to look up
+            include_deleted: Include soft-deleted bookmarks
 
-        return bookmarks
+        Returns:
+            Matching bookmarks, oldest indexed first
+        """
+        if self._url_index is None:
+            url_index: Dict[str, List[Bookmark]] = {}
+            for storage_bookmarks in self.in_memory_index.values():
+                for bookmark in storage_bookmarks.values():
+                    url_index.setdefault(_url_key(bookmark), []).append(bookmark)
+            self._url_index = url_index
+
+        matches = self._url_index.get(url.strip().rstrip("/"), [])
+        if include_deleted:
+            return list(matches)
+        return [b for b in matches if not b.deleted]
 
     def get_bookmark_by_id(
         self, bookmark_id: str, storage_name: Optional[str] = None
@@ -253,15 +585,12 @@ class StorageManager:
         Returns:
             Bookmark if found, None otherwise
         """
-        if storage_name:
-            # Search specific storage
-            return self.in_memory_index.get(storage_name, {}).get(bookmark_id)
-        else:
+        if not storage_name:
             # Search all storages
-            for storage_bookmarks in self.in_memory_index.values():
-                if bookmark_id in storage_bookmarks:
-                    return storage_bookmarks[bookmark_id]
-            return None
+            storage_name = self._id_to_storage.get(bookmark_id)
+            if storage_name is None:
+                return None
+        return self.in_memory_index.get(storage_name, {}).get(bookmark_id)
 
     async def delete_bookmark_file(self, bookmark_id: str, storage_name: str) -> None:
         """Permanently delete bookmark file (hard delete).
@@ -280,12 +609,15 @@ class StorageManager:
         file_path = Path(storage.path) / "bookmarks" / f"{bookmark_id}.yaml"
 
         try:
-            if file_path.exists():
-                await asyncio.to_thread(file_path.unlink)
+            await asyncio.to_thread(file_path.unlink, missing_ok=True)
 
             # Remove from in-memory index
             if storage_name in self.in_memory_index:
-                self.in_memory_index[storage_name].pop(bookmark_id, None)
+                removed = self.in_memory_index[storage_name].pop(bookmark_id, None)
+                if removed is not None:
+                    self._index_remove(storage_name, removed)
+                    self._assign_id_owner(bookmark_id)
+                    self._update_url_index(removed, None)
 
         except Exception as e:
             raise StorageError(f"Failed to delete bookmark file {bookmark_id}: {e}") from e
@@ -316,7 +648,7 @@ class StorageManager:
             "active": active,
             "deleted": deleted,
             "errors": len(self.load_errors.get(storage_name, [])),
-            "conflicts": len(self.conflicts.get(storage_name, [])),
+            "conflicts": self._conflict_counts.get(storage_name, 0),
         }
 
     def get_all_storage_names(self) -> List[str]:
@@ -328,19 +660,143 @@ class StorageManager:
         return list(self.storage_locations.keys())
 
     def get_current_storage_name(self) -> Optional[str]:
-        """Get the currently active storage name."""
-        if self.current_storage_name and self.current_storage_name in self.storage_locations:
-            return self.current_storage_name
-        self.current_storage_name = self._select_current_storage_name()
+        """Get the currently active storage name.
+
+        The name is resolved by initialize() and memoized, so request handlers
+        read a single attribute instead of re-validating it on every call.
+        """
+        if self.current_storage_name is None:
+            self.current_storage_name = self._select_current_storage_name()
         return self.current_storage_name
 
+    def get_storage_count(self) -> int:
+        """Return the number of registered storage locations."""
+        return len(self.storage_locations)
+
+    def get_conflict_count(self) -> int:
+        """Return the total number of load conflicts across all storages."""
+        return self._conflict_total
+
     def get_recent_conflicts(self, limit: int = 20) -> List[str]:
-        """Return recent conflict warnings across all storages."""
-        merged: List[str] = []
-        for storage_name, messages in self.conflicts.items():
-            for message in messages:
-                merged.append(f"[{storage_name}] {message}")
-        return merged[-limit:]
+        """Return recent conflict warnings across all storages, oldest first.
+
+        Walks back from the newest message, so only `limit` messages are visited.
+        """
+        if limit <= 0:
+            return []
+        newest_first = islice(
+            (
+                (storage_name, message)
+                for storage_name, messages in reversed(self.conflicts.items())
+                for message in reversed(messages)
+            ),
+            limit,
+        )
+        return [f"[{name}] {message}" for name, message in reversed(list(newest_first))]
+
+    def _update_url_index(
+        self, previous: Optional[Bookmark], bookmark: Optional[Bookmark]
+    ) -> None:
+        """Replace previous with bookmark in the URL index (either may be None).
+
+        A version whose URL is unchanged keeps its position.
+        """
+        if self._url_index is None:
+            return
+        if previous is not None:
+            key = _url_key(previous)
+            bucket = self._url_index.get(key, [])
+            for position, indexed in enumerate(bucket):
+                if indexed is previous:
+                    if bookmark is not None and _url_key(bookmark) == key:
+                        bucket[position] = bookmark
+                        return
+                    del bucket[position]
+                    if not bucket:
+                        del self._url_index[key]
+                    break
+        if bookmark is not None:
+            self._url_index.setdefault(_url_key(bookmark), []).append(bookmark)
+
+    def _index_add(
+        self, storage_name: str, bookmark: Bookmark, previous: Optional[Bookmark] = None
+    ) -> None:
+        """Add a bookmark to the filter indexes, replacing its previous version.
+
+        A version that stays in the same buckets is replaced in place. One that
+        moves between buckets is appended to its new ones, which are flagged
+        for re-ordering unless it is also last in in_memory_index.
+        """
+        moved = previous is not None and (
+            previous.deleted != bookmark.deleted or previous.folder_path != bookmark.folder_path
+        )
+        if moved:
+            self._index_remove(storage_name, previous)
+            moved = next(reversed(self.in_memory_index[storage_name])) != bookmark.id
+        if not bookmark.deleted:
+            bucket = self._active_index.setdefault(storage_name, {})
+            if moved and bookmark.id not in bucket:
+                self._unordered_buckets.add((storage_name, None))
+            bucket[bookmark.id] = bookmark
+        if bookmark.folder_path is not None:
+            key = (storage_name, bookmark.folder_path)
+            bucket = self._folder_index.setdefault(key, {})
+            if moved and bookmark.id not in bucket:
+                self._unordered_buckets.add(key)
+            bucket[bookmark.id] = bookmark
+
+    def _index_remove(self, storage_name: str, bookmark: Bookmark) -> None:
+        """Remove a bookmark from the filter indexes."""
+        self._active_index.get(storage_name, {}).pop(bookmark.id, None)
+        if bookmark.folder_path is not None:
+            key = (storage_name, bookmark.folder_path)
+            bucket = self._folder_index.get(key)
+            if bucket is not None:
+                bucket.pop(bookmark.id, None)
+                if not bucket:
+                    del self._folder_index[key]
+                    self._unordered_buckets.discard(key)
+
+    def _restore_bucket_order(self) -> None:
+        """Re-order flagged filter buckets to follow in_memory_index."""
+        for storage_name, folder_path in self._unordered_buckets:
+            bookmarks = self.in_memory_index.get(storage_name, {}).items()
+            if folder_path is None:
+                self._active_index[storage_name] = {
+                    bookmark_id: b for bookmark_id, b in bookmarks if not b.deleted
+                }
+            else:
+                self._folder_index[(storage_name, folder_path)] = {
+                    bookmark_id: b for bookmark_id, b in bookmarks if b.folder_path == folder_path
+                }
+        self._unordered_buckets.clear()
+
+    def _assign_id_owner(self, bookmark_id: str) -> None:
+        """Map an ID to the first storage (in config order) holding it, if any."""
+        for name in self.storage_locations:
+            if bookmark_id in self.in_memory_index.get(name, ()):
+                self._id_to_storage[bookmark_id] = name
+                return
+        self._id_to_storage.pop(bookmark_id, None)
+
+    def _rebuild_id_map(self) -> None:
+        """Rebuild the ID -> storage map from in_memory_index in config order."""
+        id_to_storage: Dict[str, str] = {}
+        for name in self.storage_locations:
+            for bookmark_id in self.in_memory_index.get(name, ()):
+                id_to_storage.setdefault(bookmark_id, name)
+        self._id_to_storage = id_to_storage
+
+    def _rebuild_filter_indexes(self, storage_name: str) -> None:
+        """Rebuild a storage's filter indexes from in_memory_index."""
+        for key in [key for key in self._folder_index if key[0] == storage_name]:
+            del self._folder_index[key]
+        self._unordered_buckets = {
+            key for key in self._unordered_buckets if key[0] != storage_name
+        }
+        self._active_index[storage_name] = {}
+        for bookmark in self.in_memory_index.get(storage_name, {}).values():
+            self._index_add(storage_name, bookmark)
 
     def _select_current_storage_name(self) -> Optional[str]:
         """Resolve current storage from configured storage metadata."""
@@ -354,23 +810,25 @@ class StorageManager:
     def _choose_winner(
         self,
         existing: Bookmark,
-        existing_path: Path,
+        existing_mtime: Optional[float],
         candidate: Bookmark,
-        candidate_path: Path,
+        candidate_mtime: Optional[float],
     ) -> Bookmark:
         """Resolve duplicate bookmark conflicts using last-writer-wins semantics."""
-        existing_ts = self._bookmark_timestamp(existing, existing_path)
-        candidate_ts = self._bookmark_timestamp(candidate, candidate_path)
+        existing_ts = self._bookmark_timestamp(existing, existing_mtime)
+        candidate_ts = self._bookmark_timestamp(candidate, candidate_mtime)
         return candidate if candidate_ts >= existing_ts else existing
 
-    def _bookmark_timestamp(self, bookmark: Bookmark, source_path: Path) -> datetime:
-        """Pick best available timestamp for conflict resolution."""
+    def _bookmark_timestamp(self, bookmark: Bookmark, mtime: Optional[float]) -> datetime:
+        """Pick best available timestamp for conflict resolution.
+
+        mtime is the source file's modification time as listed at load, so
+        no file is re-statted here.
+        """
         if bookmark.last_modified:
             return bookmark.last_modified.astimezone(timezone.utc)
         if bookmark.created_at:
             return bookmark.created_at.astimezone(timezone.utc)
-        try:
-            mtime = source_path.stat().st_mtime
+        if mtime is not None:
             return datetime.fromtimestamp(mtime, tz=timezone.utc)
-        except Exception:
-            return datetime.min.replace(tzinfo=timezone.utc)
+        return datetime.min.replace(tzinfo=timezone.utc)
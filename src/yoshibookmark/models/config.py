@@ -1,12 +1,22 @@
 """Configuration models."""
 
-from typing import List, Literal, Optional
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .storage import StorageLocation
 
+DEFAULT_AGENT_PROVIDERS = ("openai", "azureopenai", "anthropic", "gemini")
+
+
+@lru_cache(maxsize=16)
+def _resolve_provider_order(configured: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Normalize a configured provider list and append the missing defaults."""
+    normalized = [p.strip().lower() for p in configured if p.strip()]
+    return tuple(dict.fromkeys(normalized + list(DEFAULT_AGENT_PROVIDERS)))
+
 
 class EnvSettings(BaseSettings):
     """Settings loaded from .env file (secrets and credentials)."""
@@ -115,10 +125,15 @@ class AppConfig(BaseModel):
         le=86400,
         description="TTL for preview sessions before commit",
     )
+    ingest_preview_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum pending previews kept; the oldest are evicted first",
+    )
 
     # Agent provider chain config
     agent_providers: List[str] = Field(
-        default_factory=lambda: ["openai", "azureopenai", "anthropic", "gemini"],
+        default_factory=lambda: list(DEFAULT_AGENT_PROVIDERS),
         description="Ordered provider IDs for AI inference failover",
     )
     agent_default_model: str = Field(
@@ -127,6 +142,26 @@ class AppConfig(BaseModel):
     )
     agent_timeout_seconds: int = Field(default=20, ge=5, le=120)
     agent_confidence_threshold: float = Field(default=0.65, ge=0.0, le=1.0)
+    agent_response_cache_size: int = Field(
+        default=512,
+        ge=0,
+        description="Parsed provider suggestions kept for identical captures (0 disables)",
+    )
+    agent_response_cache_ttl_seconds: int = Field(default=86400, ge=60, le=604800)
+    agent_race_keys: bool = Field(
+        default=False,
+        description="Send to all of a provider's API keys at once and keep the first success",
+    )
+    agent_prewarm_connections: bool = Field(
+        default=True,
+        description="Open connections to configured provider endpoints at startup",
+    )
+    agent_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Concurrent provider calls for batch metadata generation",
+    )
 
     openai_enabled: bool = Field(default=True)
     openai_endpoint: str = Field(default="https://api.openai.com/v1/chat/completions")
@@ -150,6 +185,16 @@ class AppConfig(BaseModel):
     gemini_model: str = Field(default="gemini-2.0-flash")
     gemini_api_keys: List[str] = Field(default_factory=list)
 
+    @property
+    def ordered_providers(self) -> Tuple[str, ...]:
+        """Deduplicated provider failover order, defaults appended.
+
+        The result is memoized per distinct ``agent_providers`` value rather
+        than stored on the instance, so copies made with ``model_copy`` never
+        see a stale order.
+        """
+        return _resolve_provider_order(tuple(self.agent_providers))
+
     model_config = ConfigDict(json_schema_extra={
         "example": {
             "host": "127.0.0.1",
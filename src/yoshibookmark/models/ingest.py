@@ -0,0 +1,57 @@
+"""Ingestion request models for browser-extension capture workflows."""
+
+from typing import List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+
+
+class IngestPreviewRequest(BaseModel):
+    """Request payload for ingestion preview."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Full HttpUrl validation, not a scheme-prefix check on str: pydantic-core
+    # parses a URL in about a microsecond, and a prefix check lets host-less
+    # or malformed URLs through.
+    url: HttpUrl
+    page_title: Optional[str] = None
+    page_excerpt: Optional[str] = None
+    selected_text: Optional[str] = None
+    user_note: Optional[str] = None
+    storage_location: Optional[str] = None
+    tags: Optional[List[str]] = None
+    folder_path: Optional[str] = None
+    source_app: Optional[str] = None
+    source_project: Optional[str] = None
+
+
+class IngestCommitRequest(BaseModel):
+    """Commit payload from a previously generated preview."""
+
+    model_config = ConfigDict(frozen=True)
+
+    preview_id: str
+    title: Optional[str] = None
+    description: Optional[str] = None
+    keywords: Optional[List[str]] = Field(None, max_length=4)
+    tags: Optional[List[str]] = None
+    folder_path: Optional[str] = None
+
+
+class IngestQuickSaveRequest(BaseModel):
+    """Quick-save request payload."""
+
+    model_config = ConfigDict(frozen=True)
+
+    url: HttpUrl
+    page_title: Optional[str] = None
+    page_excerpt: Optional[str] = None
+    selected_text: Optional[str] = None
+    user_note: Optional[str] = None
+    storage_location: Optional[str] = None
+    source_app: Optional[str] = None
+    source_project: Optional[str] = None
+
+
+# Capture payloads accepted by IngestionService.create_preview().
+IngestCapture = Union[IngestPreviewRequest, IngestQuickSaveRequest]
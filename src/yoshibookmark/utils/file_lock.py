@@ -1,6 +1,7 @@
 """File locking utilities for concurrent access."""
 
 import asyncio
+import os
 import time
 from pathlib import Path
 from typing import Optional
@@ -48,44 +49,51 @@ class FileLocker:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Release lock."""
-        self._release_lock()
+        await asyncio.to_thread(self._release_lock)
         return False
 
+    def _try_create_lock(self) -> bool:
+        """Create the lock file atomically; return False if it is held.
+
+        O_CREAT | O_EXCL makes check-and-create a single filesystem operation,
+        so two waiters can never both see the lock as free.
+        """
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # Check if lock is stale (older than timeout)
+            try:
+                if time.time() - self.lock_path.stat().st_mtime > self.timeout * 2:
+                    # Remove stale lock; the next attempt re-creates it
+                    self.lock_path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            return False
+        os.close(fd)
+        return True
+
     def _acquire_lock(self) -> None:
         """Acquire lock with timeout (synchronous)."""
         start_time = time.time()
 
         while True:
             try:
-                # Attempt to create lock file exclusively
-                self.lock_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # On Windows, we need a different approach
-                if self.lock_path.exists():
-                    # Check if lock is stale (older than timeout)
-                    if time.time() - self.lock_path.stat().st_mtime > self.timeout * 2:
-                        # Remove stale lock
-                        self.lock_path.unlink(missing_ok=True)
-                    else:
-                        # Lock exists and is fresh
-                        if time.time() - start_time > self.timeout:
-                            raise FileLockError(
-                                f"Could not acquire lock on {self.file_path} after {self.timeout}s"
-                            )
-                        time.sleep(0.1)
-                        continue
-
-                # Create lock file
-                self.lock_path.touch()
-                self.acquired = True
-                return
-
+                if self._try_create_lock():
+                    self.acquired = True
+                    return
             except Exception as e:
                 if time.time() - start_time > self.timeout:
                     raise FileLockError(
                         f"Could not acquire lock on {self.file_path}: {e}"
                     ) from e
-                time.sleep(0.1)
+            else:
+                # Lock exists and is fresh
+                if time.time() - start_time > self.timeout:
+                    raise FileLockError(
+                        f"Could not acquire lock on {self.file_path} after {self.timeout}s"
+                    )
+            time.sleep(0.1)
 
     async def _acquire_lock_async(self) -> None:
         """Acquire lock with timeout (async)."""
@@ -93,35 +101,21 @@ class FileLocker:
 
         while True:
             try:
-                # Attempt to create lock file exclusively
-                await asyncio.to_thread(self.lock_path.parent.mkdir, parents=True, exist_ok=True)
-
-                if self.lock_path.exists():
-                    # Check if lock is stale
-                    stat = await asyncio.to_thread(self.lock_path.stat)
-                    if time.time() - stat.st_mtime > self.timeout * 2:
-                        # Remove stale lock
-                        await asyncio.to_thread(self.lock_path.unlink, missing_ok=True)
-                    else:
-                        # Lock exists and is fresh
-                        if time.time() - start_time > self.timeout:
-                            raise FileLockError(
-                                f"Could not acquire lock on {self.file_path} after {self.timeout}s"
-                            )
-                        await asyncio.sleep(0.1)
-                        continue
-
-                # Create lock file
-                await asyncio.to_thread(self.lock_path.touch)
-                self.acquired = True
-                return
-
+                if await asyncio.to_thread(self._try_create_lock):
+                    self.acquired = True
+                    return
             except Exception as e:
                 if time.time() - start_time > self.timeout:
                     raise FileLockError(
                         f"Could not acquire lock on {self.file_path}: {e}"
                     ) from e
-                await asyncio.sleep(0.1)
+            else:
+                # Lock exists and is fresh
+                if time.time() - start_time > self.timeout:
+                    raise FileLockError(
+                        f"Could not acquire lock on {self.file_path} after {self.timeout}s"
+                    )
+            await asyncio.sleep(0.1)
 
     def _release_lock(self) -> None:
         """Release the lock."""
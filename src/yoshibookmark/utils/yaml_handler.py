@@ -1,12 +1,20 @@
 """YAML serialization and deserialization utilities for bookmarks."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Union
 
 import yaml
 
 from ..models.bookmark import Bookmark
 
+# Prefer the libyaml C bindings; fall back to the pure-Python safe classes.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 class YAMLError(Exception):
     """YAML processing error."""
@@ -14,6 +22,25 @@ class YAMLError(Exception):
     pass
 
 
+def _dump_bookmark(bookmark: Bookmark, encoding: Optional[str] = None):
+    """Dump a Bookmark as YAML text, or as bytes when an encoding is given."""
+    try:
+        # JSON mode already renders HttpUrl/datetime as plain strings for YAML.
+        data = bookmark.model_dump(mode='json')
+
+        return yaml.dump(
+            data,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+            encoding=encoding,
+        )
+
+    except Exception as e:
+        raise YAMLError(f"Failed to serialize bookmark: {e}") from e
+
+
 def serialize_bookmark(bookmark: Bookmark) -> str:
     """Serialize a Bookmark to YAML string.
 
@@ -26,33 +53,29 @@ def serialize_bookmark(bookmark: Bookmark) -> str:
     Raises:
         YAMLError: If serialization fails
     """
-    try:
-        # Convert Pydantic model to dict
-        data = bookmark.model_dump(mode='json')
+    return _dump_bookmark(bookmark)
 
-        # Convert HttpUrl to string for YAML
-        if 'url' in data and hasattr(data['url'], '__str__'):
-            data['url'] = str(data['url'])
 
-        # Serialize to YAML
-        yaml_str = yaml.safe_dump(
-            data,
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-        )
+def serialize_bookmark_bytes(bookmark: Bookmark) -> bytes:
+    """Serialize a Bookmark to UTF-8 encoded YAML.
 
-        return yaml_str
+    Args:
+        bookmark: Bookmark instance to serialize
 
-    except Exception as e:
-        raise YAMLError(f"Failed to serialize bookmark: {e}") from e
+    Returns:
+        UTF-8 YAML bytes, ready to be written to disk
 
+    Raises:
+        YAMLError: If serialization fails
+    """
+    return _dump_bookmark(bookmark, encoding='utf-8')
 
-def deserialize_bookmark(yaml_str: str) -> Bookmark:
+
+def deserialize_bookmark(yaml_str: Union[str, bytes]) -> Bookmark:
     """Deserialize a Bookmark from YAML string.
 
     Args:
-        yaml_str: YAML string to deserialize
+        yaml_str: YAML string (or UTF-8 bytes) to deserialize
 
     Returns:
         Bookmark instance
@@ -62,13 +85,13 @@ def deserialize_bookmark(yaml_str: str) -> Bookmark:
     """
     try:
         # Parse YAML
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_str, Loader=_YamlLoader)
 
         if data is None:
             raise YAMLError("YAML content is empty")
 
-        # Create Bookmark from dict
-        bookmark = Bookmark(**data)
+        # Validate the parsed mapping directly (no kwargs re-packing)
+        bookmark = Bookmark.model_validate(data)
 
         return bookmark
 
@@ -91,17 +114,15 @@ def load_bookmark_from_file(file_path: Path) -> Bookmark:
         YAMLError: If file reading or parsing fails
     """
     try:
-        if not file_path.exists():
-            raise YAMLError(f"File not found: {file_path}")
-
-        yaml_str = file_path.read_text(encoding='utf-8')
-        return deserialize_bookmark(yaml_str)
-
-    except YAMLError:
-        raise
+        # libyaml decodes the UTF-8 bytes itself; no intermediate str.
+        yaml_bytes = file_path.read_bytes()
+    except FileNotFoundError as e:
+        raise YAMLError(f"File not found: {file_path}") from e
     except Exception as e:
         raise YAMLError(f"Failed to load bookmark from {file_path}: {e}") from e
 
+    return deserialize_bookmark(yaml_bytes)
+
 
 def save_bookmark_to_file(bookmark: Bookmark, file_path: Path) -> None:
     """Save a Bookmark to YAML file.
@@ -117,8 +138,7 @@ def save_bookmark_to_file(bookmark: Bookmark, file_path: Path) -> None:
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        yaml_str = serialize_bookmark(bookmark)
-        file_path.write_text(yaml_str, encoding='utf-8')
+        file_path.write_bytes(serialize_bookmark_bytes(bookmark))
 
     except YAMLError:
         raise
@@ -1,8 +1,16 @@
 """Unit tests for AI inference provider handling and parsing."""
 
+import json
+
+import httpx
 import pytest
 
-from yoshibookmark.core.ai_inference import MultiProviderInferenceService
+from yoshibookmark.core.ai_inference import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    AIProviderError,
+    MultiProviderInferenceService,
+    StructuredMetadata,
+)
 from yoshibookmark.models.config import AppConfig
 
 
@@ -11,6 +19,7 @@ class _FakeResponse:
         self.status_code = 200
         self._payload = payload
         self.text = ""
+        self.content = json.dumps(payload).encode("utf-8")
 
     def json(self):
         return self._payload
@@ -26,8 +35,8 @@ class _FakeAsyncClient:
     async def __aexit__(self, exc_type, exc, tb):
         return False
 
-    async def post(self, endpoint, headers=None, json=None):
-        self.calls.append({"endpoint": endpoint, "headers": headers, "json": json})
+    async def post(self, endpoint, headers=None, content=None):
+        self.calls.append({"endpoint": endpoint, "headers": headers, "json": json.loads(content)})
         return _FakeResponse(
             {"choices": [{"message": {"content": "{\"title\":\"ok\",\"keywords\":[]}"}}]}
         )
@@ -56,13 +65,167 @@ class TestAiInference:
 
         monkeypatch.setattr(
             "yoshibookmark.core.ai_inference.httpx.AsyncClient",
-            lambda timeout: _FakeAsyncClient(calls),
+            lambda **kwargs: _FakeAsyncClient(calls),
         )
 
         await service._generate_text("openai", "test prompt")
         assert len(calls) == 1
         assert "temperature" not in calls[0]["json"]
 
+    @pytest.mark.asyncio
+    async def test_identical_capture_is_served_from_response_cache(self, monkeypatch):
+        service = _service_for_openai()
+        calls = []
+
+        monkeypatch.setattr(
+            "yoshibookmark.core.ai_inference.httpx.AsyncClient",
+            lambda **kwargs: _FakeAsyncClient(calls),
+        )
+
+        capture = {
+            "url": "https://example.com",
+            "page_title": "Example",
+            "page_excerpt": "",
+            "selected_text": "",
+            "user_note": "",
+        }
+        first, _ = await service.generate_structured_metadata(**capture)
+        second, attempts = await service.generate_structured_metadata(**capture)
+        await service.generate_structured_metadata(**{**capture, "user_note": "changed"})
+
+        assert second == first == StructuredMetadata(title="ok", keywords=[])
+        assert second is not first
+        assert attempts[0].attempted is False and attempts[0].succeeded is True
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_prewarm_connects_to_usable_provider_endpoints(self, monkeypatch):
+        service = _service_for_openai()
+        heads = []
+
+        class _HeadClient(_FakeAsyncClient):
+            async def head(self, endpoint, timeout=None):
+                heads.append(endpoint)
+                raise httpx.ConnectError("offline")
+
+        monkeypatch.setattr(
+            "yoshibookmark.core.ai_inference.httpx.AsyncClient",
+            lambda **kwargs: _HeadClient([]),
+        )
+
+        await service.prewarm()
+        assert heads == ["https://api.openai.com/v1/chat/completions"]
+
+        service.config.agent_prewarm_connections = False
+        service._client = None
+        await service.prewarm()
+        assert len(heads) == 1
+
+    @pytest.mark.parametrize(
+        "status_code,failure_type",
+        [
+            (401, "authentication"),
+            (403, "authentication"),
+            (429, "ratelimit"),
+            (503, "server_error"),
+            (404, "invalid_request"),
+        ],
+    )
+    def test_raise_for_status_classifies_failures(self, status_code, failure_type):
+        service = _service_for_openai()
+        response = httpx.Response(status_code, text="nope")
+        with pytest.raises(AIProviderError) as exc_info:
+            service._raise_for_status("openai", response)
+        assert exc_info.value.failure_type == failure_type
+        service._raise_for_status("openai", httpx.Response(204))
+
+    def test_structured_metadata_ignores_unknown_keys(self):
+        metadata = StructuredMetadata.from_payload(
+            {"title": "t", "tags": ["a"], "confidence": 0.4, "extra": True}
+        )
+        assert metadata == StructuredMetadata(title="t", tags=["a"], confidence=0.4)
+        assert not hasattr(metadata, "__dict__")
+        with pytest.raises(ValueError):
+            StructuredMetadata.from_payload(["not", "an", "object"])
+
+    @pytest.mark.asyncio
+    async def test_batch_generation_preserves_order(self, monkeypatch):
+        service = _service_for_openai()
+        calls = []
+
+        monkeypatch.setattr(
+            "yoshibookmark.core.ai_inference.httpx.AsyncClient",
+            lambda **kwargs: _FakeAsyncClient(calls),
+        )
+
+        captures = [
+            {
+                "url": f"https://example.com/{i}",
+                "page_title": f"Page {i}",
+                "page_excerpt": "",
+                "selected_text": "",
+                "user_note": "",
+            }
+            for i in range(3)
+        ]
+        results = await service.generate_structured_metadata_batch(captures)
+
+        assert [parsed for parsed, _ in results] == [StructuredMetadata(title="ok", keywords=[])] * 3
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_repeated_transient_failures(self, monkeypatch):
+        service = _service_for_openai()
+        calls = []
+
+        class _FailingClient(_FakeAsyncClient):
+            async def post(self, endpoint, headers=None, content=None):
+                self.calls.append(endpoint)
+                raise httpx.ConnectError("connection refused")
+
+        monkeypatch.setattr(
+            "yoshibookmark.core.ai_inference.httpx.AsyncClient",
+            lambda **kwargs: _FailingClient(calls),
+        )
+
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD + 2):
+            with pytest.raises(AIProviderError) as exc_info:
+                await service._generate_text("openai", "test prompt")
+            assert exc_info.value.is_transient
+
+        assert len(calls) == CIRCUIT_FAILURE_THRESHOLD
+        assert "circuit open" in exc_info.value.message
+
+    @pytest.mark.asyncio
+    async def test_race_keys_returns_first_success(self, monkeypatch):
+        import asyncio
+
+        service = _service_for_openai()
+        service.config.openai_api_keys = ["slow-key", "fast-key"]
+        service.config.agent_race_keys = True
+        service = MultiProviderInferenceService(service.config)
+        cancelled = []
+
+        class _RacingClient(_FakeAsyncClient):
+            async def post(self, endpoint, headers=None, content=None):
+                if headers["Authorization"] == "Bearer slow-key":
+                    try:
+                        await asyncio.sleep(10)
+                    except asyncio.CancelledError:
+                        cancelled.append(True)
+                        raise
+                return await super().post(endpoint, headers=headers, content=content)
+
+        monkeypatch.setattr(
+            "yoshibookmark.core.ai_inference.httpx.AsyncClient",
+            lambda **kwargs: _RacingClient([]),
+        )
+
+        text = await asyncio.wait_for(service._generate_text("openai", "test prompt"), 2)
+
+        assert text == "{\"title\":\"ok\",\"keywords\":[]}"
+        assert cancelled == [True]
+
     def test_parse_json_payload_with_wrapped_text(self):
         service = _service_for_openai()
         text = (
@@ -74,6 +237,12 @@ class TestAiInference:
         assert parsed["title"] == "cmdai"
         assert parsed["confidence"] == 0.8
 
+    def test_parse_json_payload_skips_false_starts(self):
+        service = _service_for_openai()
+        text = 'Output uses {placeholders} and [1, 2]: {"title":"real","keywords":[]} done'
+        parsed = service._parse_json_payload(text)
+        assert parsed == {"title": "real", "keywords": []}
+
     def test_parse_json_payload_with_codeblock_and_trailing_text(self):
         service = _service_for_openai()
         text = (
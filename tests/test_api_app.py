@@ -0,0 +1,118 @@
+"""Tests for app-level routes served outside the versioned API routers."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from yoshibookmark import api as api_module
+from yoshibookmark.api import app
+from yoshibookmark.core.ai_inference import MultiProviderInferenceService
+from yoshibookmark.core.content_analyzer import ContentAnalyzer
+from yoshibookmark.core.recall_service import RecallService
+from yoshibookmark.core.storage_manager import StorageManager
+from yoshibookmark.models.config import AppConfig, EnvSettings
+
+
+def test_root_returns_service_links():
+    """Test root endpoint payload."""
+    client = TestClient(app)
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.json()["health"] == "/api/v1/health"
+
+
+def test_web_app_shell_supports_conditional_requests():
+    """Test /app serves cached HTML with an ETag and honors If-None-Match."""
+    client = TestClient(app)
+    response = client.get("/app")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    etag = response.headers["etag"]
+
+    cached = client.get("/app", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_cached_static_files_serve_preloaded_assets(tmp_path):
+    """Test small assets are served from memory after preload."""
+    from fastapi import FastAPI
+
+    from yoshibookmark.api.static_files import CachedStaticFiles
+
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "app.js").write_text("console.log('hi');")
+    (tmp_path / "big.bin").write_bytes(b"x" * 64)
+
+    static_files = CachedStaticFiles(directory=tmp_path, max_cached_file_size=32)
+    assert static_files.preload() == 1
+
+    test_app = FastAPI()
+    test_app.mount("/static", static_files, name="static")
+    client = TestClient(test_app)
+
+    # Served from memory even after the file is gone from disk.
+    (tmp_path / "js" / "app.js").unlink()
+    response = client.get("/static/js/app.js")
+    assert response.status_code == 200
+    assert response.text == "console.log('hi');"
+    assert "javascript" in response.headers["content-type"]
+
+    cached = client.get("/static/js/app.js", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+    # Files above the size limit fall through to StaticFiles.
+    assert client.get("/static/big.bin").content == b"x" * 64
+
+
+def test_cached_static_files_preload_respects_follow_symlink(tmp_path):
+    """Test symlinked files are only preloaded when follow_symlink is set."""
+    from yoshibookmark.api.static_files import CachedStaticFiles
+
+    outside = tmp_path / "secret.txt"
+    outside.write_text("secret")
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    (static_dir / "app.js").write_text("console.log('hi');")
+    (static_dir / "link.txt").symlink_to(outside)
+
+    assert CachedStaticFiles(directory=static_dir).preload() == 1
+    assert CachedStaticFiles(directory=static_dir, follow_symlink=True).preload() == 2
+
+
+def test_failed_storage_startup_closes_prewarmed_clients(monkeypatch):
+    """Test clients are closed when storage initialization fails at startup."""
+    closed = []
+
+    class _ConfigManager:
+        def load_app_config(self):
+            return AppConfig(storage_locations=[])
+
+        def load_env_settings(self):
+            return EnvSettings(_env_file=None, openai_api_key="test-key")
+
+    async def failing_initialize(self, storage_locations):
+        raise RuntimeError("storage unavailable")
+
+    async def prewarm(self):
+        pass
+
+    def recording_aclose(name):
+        async def aclose(self):
+            closed.append(name)
+
+        return aclose
+
+    monkeypatch.setattr(api_module, "get_config_manager", _ConfigManager)
+    monkeypatch.setattr(StorageManager, "initialize", failing_initialize)
+    for service in (ContentAnalyzer, MultiProviderInferenceService, RecallService):
+        monkeypatch.setattr(service, "prewarm", prewarm)
+        monkeypatch.setattr(service, "aclose", recording_aclose(service.__name__))
+
+    with pytest.raises(RuntimeError, match="storage unavailable"):
+        with TestClient(app):
+            pass
+
+    assert sorted(closed) == ["ContentAnalyzer", "MultiProviderInferenceService", "RecallService"]
@@ -1,6 +1,7 @@
 """Integration tests for bookmark API endpoints."""
 
 import asyncio
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -54,9 +55,9 @@ def client(test_config_dir):
     from fastapi import FastAPI
     from fastapi.middleware.cors import CORSMiddleware
 
-    from yoshibookmark import api
     from yoshibookmark.api.bookmarks import router as bookmarks_router
     from yoshibookmark.api.health import router as health_router
+    from yoshibookmark.api.state import state
     from yoshibookmark.core.bookmark_manager import BookmarkManager
     from yoshibookmark.core.content_analyzer import ContentAnalyzer
     from yoshibookmark.core.storage_manager import StorageManager
@@ -67,18 +68,18 @@ def client(test_config_dir):
     env_settings = real_cm.load_env_settings()
 
     # Initialize managers directly
-    api.config_manager = real_cm
-    api.runtime_config = app_config
-    api.storage_manager = StorageManager()
+    state.config_manager = real_cm
+    state.runtime_config = app_config
+    state.storage_manager = StorageManager()
 
     # Run async initialization
     async def init_storage():
-        await api.storage_manager.initialize(app_config.storage_locations)
+        await state.storage_manager.initialize(app_config.storage_locations)
 
     asyncio.run(init_storage())
 
-    api.bookmark_manager = BookmarkManager(api.storage_manager)
-    api.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
+    state.bookmark_manager = BookmarkManager(state.storage_manager)
+    state.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
 
     # Create test app without lifespan handler
     test_app = FastAPI(
@@ -146,7 +147,7 @@ class TestBookmarkEndpoints:
     def test_create_bookmark_with_auto_analysis(self, client):
         """Test creating bookmark with automatic title/keyword analysis."""
         # Mock content analyzer
-        from yoshibookmark import api
+        from yoshibookmark.api.state import state
 
         mock_analysis = {
             "title": "Example Domain",
@@ -154,7 +155,7 @@ class TestBookmarkEndpoints:
             "error": None,
         }
 
-        with patch.object(api.content_analyzer, 'analyze_url', new_callable=AsyncMock) as mock_analyze:
+        with patch.object(state.content_analyzer, 'analyze_url', new_callable=AsyncMock) as mock_analyze:
             mock_analyze.return_value = mock_analysis
 
             response = client.post(
@@ -228,6 +229,25 @@ class TestBookmarkEndpoints:
         assert len(data["bookmarks"]) == 1
         assert data["bookmarks"][0]["title"] == "Test Bookmark"
 
+    def test_list_bookmarks_ndjson_stream(self, client):
+        """Test listing bookmarks as newline-delimited JSON."""
+        for index in range(2):
+            client.post(
+                "/api/v1/bookmarks",
+                json={
+                    "url": f"https://example{index}.com",
+                    "title": f"Bookmark {index}",
+                    "keywords": ["test"],
+                },
+            )
+
+        response = client.get("/api/v1/bookmarks", params={"stream": "ndjson"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(item["title"] for item in lines) == ["Bookmark 0", "Bookmark 1"]
+
     def test_get_bookmark_by_id(self, client):
         """Test getting a specific bookmark."""
         # Create bookmark
@@ -461,9 +481,9 @@ class TestBookmarkEndpoints:
         from fastapi.middleware.cors import CORSMiddleware
         from fastapi.testclient import TestClient
 
-        from yoshibookmark import api
         from yoshibookmark.api.bookmarks import router as bookmarks_router
         from yoshibookmark.api.health import router as health_router
+        from yoshibookmark.api.state import state
         from yoshibookmark.core.bookmark_manager import BookmarkManager
         from yoshibookmark.core.content_analyzer import ContentAnalyzer
         from yoshibookmark.core.storage_manager import StorageManager
@@ -477,16 +497,16 @@ class TestBookmarkEndpoints:
             }
         )
 
-        api.config_manager = cm
-        api.runtime_config = app_config
-        api.storage_manager = StorageManager()
+        state.config_manager = cm
+        state.runtime_config = app_config
+        state.storage_manager = StorageManager()
 
         async def init_storage():
-            await api.storage_manager.initialize(app_config.storage_locations)
+            await state.storage_manager.initialize(app_config.storage_locations)
 
         asyncio.run(init_storage())
-        api.bookmark_manager = BookmarkManager(api.storage_manager)
-        api.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
+        state.bookmark_manager = BookmarkManager(state.storage_manager)
+        state.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
 
         test_app = FastAPI(version="0.1.0")
         test_app.add_middleware(
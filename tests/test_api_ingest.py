@@ -61,7 +61,12 @@ def ingest_client():
         from yoshibookmark.api.bookmarks import router as bookmarks_router
         from yoshibookmark.api.health import router as health_router
         from yoshibookmark.api.ingest import router as ingest_router
-        from yoshibookmark.core.ai_inference import MultiProviderInferenceService
+        from yoshibookmark.api.middleware import ExtensionAuthMiddleware
+        from yoshibookmark.api.state import state
+        from yoshibookmark.core.ai_inference import (
+            MultiProviderInferenceService,
+            StructuredMetadata,
+        )
         from yoshibookmark.core.bookmark_manager import BookmarkManager
         from yoshibookmark.core.content_analyzer import ContentAnalyzer
         from yoshibookmark.core.ingestion_service import IngestionService
@@ -71,42 +76,46 @@ def ingest_client():
         app_config = cm.load_app_config()
         env_settings = cm.load_env_settings()
 
-        api.config_manager = cm
-        api.runtime_config = app_config
-        api.runtime_env_settings = env_settings
-        api.storage_manager = StorageManager()
+        state.config_manager = cm
+        state.runtime_config = app_config
+        state.runtime_env_settings = env_settings
+        state.storage_manager = StorageManager()
 
         async def init_storage():
-            await api.storage_manager.initialize(app_config.storage_locations)
+            await state.storage_manager.initialize(app_config.storage_locations)
 
         asyncio.run(init_storage())
 
-        api.bookmark_manager = BookmarkManager(api.storage_manager)
-        api.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
+        state.bookmark_manager = BookmarkManager(state.storage_manager)
+        state.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
         inference = MultiProviderInferenceService(app_config)
-        api.ingestion_service = IngestionService(
+        state.ingestion_service = IngestionService(
             config=app_config,
-            bookmark_manager=api.bookmark_manager,
-            storage_manager=api.storage_manager,
-            content_analyzer=api.content_analyzer,
+            bookmark_manager=state.bookmark_manager,
+            storage_manager=state.storage_manager,
+            content_analyzer=state.content_analyzer,
             inference_service=inference,
         )
 
         # Avoid external calls in tests.
-        api.ingestion_service.inference_service.generate_structured_metadata = AsyncMock(
+        state.ingestion_service.inference_service.generate_structured_metadata = AsyncMock(
             return_value=(
-                {
-                    "title": "Suggested Title",
-                    "keywords": ["alpha", "beta"],
-                    "tags": ["project-x"],
-                    "summary": "Suggested summary",
-                    "confidence": 0.92,
-                },
+                StructuredMetadata(
+                    title="Suggested Title",
+                    keywords=["alpha", "beta"],
+                    tags=["project-x"],
+                    summary="Suggested summary",
+                    confidence=0.92,
+                ),
                 [],
             )
         )
 
         test_app = FastAPI(version="0.1.0")
+        test_app.add_middleware(
+            ExtensionAuthMiddleware,
+            settings_getter=api.ingest_auth_settings,
+        )
         test_app.add_middleware(
             CORSMiddleware,
             allow_origins=["http://localhost:*", "http://127.0.0.1:*"],
@@ -130,6 +139,80 @@ class TestIngestEndpoints:
         )
         assert response.status_code == 401
 
+    def test_preview_rejects_wrong_token(self, ingest_client):
+        response = ingest_client.post(
+            "/api/v1/ingest/preview",
+            headers={"X-Extension-Token": "wrong-token"},
+            json={"url": "https://example.com", "page_title": "Example"},
+        )
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Invalid ingestion token"
+
+    async def test_prebuilt_rejection_is_not_mutated_by_outer_middleware(self):
+        from yoshibookmark.api.middleware import ExtensionAuthMiddleware
+
+        async def downstream(scope, receive, send):
+            raise AssertionError("request should have been rejected")
+
+        middleware = ExtensionAuthMiddleware(downstream, lambda: (True, b"test-token"))
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/v1/ingest/preview",
+            "headers": [],
+        }
+
+        for _ in range(2):
+            sent = []
+
+            async def send(message, sent=sent):
+                # Mimic CORSMiddleware, which appends headers in place.
+                if message["type"] == "http.response.start":
+                    message["headers"].append((b"access-control-allow-origin", b"*"))
+                sent.append(message)
+
+            await middleware(scope, None, send)
+            assert sent[0]["status"] == 401
+            assert len(sent[0]["headers"]) == 3
+
+    def test_fast_cors_origin_matching(self):
+        from yoshibookmark.api.middleware import FastCORSMiddleware
+
+        middleware = FastCORSMiddleware(
+            None,
+            allow_origins=["chrome-extension://abc"],
+            allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
+        )
+        assert middleware.is_allowed_origin("chrome-extension://abc")
+        assert middleware.is_allowed_origin("http://localhost:8000")
+        assert not middleware.is_allowed_origin("https://evil.example")
+
+    def test_preview_rejects_non_http_url(self, ingest_client):
+        response = ingest_client.post(
+            "/api/v1/ingest/preview",
+            headers={"X-Extension-Token": "test-token"},
+            json={"url": "ftp://example.com/file", "page_title": "Example"},
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("endpoint", ["preview", "quick-save"])
+    @pytest.mark.parametrize("url", ["http://", "https://exa mple.com/x", "http://[bad"])
+    def test_capture_rejects_malformed_url(self, ingest_client, endpoint, url):
+        response = ingest_client.post(
+            f"/api/v1/ingest/{endpoint}",
+            headers={"X-Extension-Token": "test-token"},
+            json={"url": url, "page_title": "Example"},
+        )
+        assert response.status_code == 422
+
+    def test_preview_accepts_extension_token_header(self, ingest_client):
+        response = ingest_client.post(
+            "/api/v1/ingest/preview",
+            headers={"X-Extension-Token": "test-token"},
+            json={"url": "https://example.com", "page_title": "Example"},
+        )
+        assert response.status_code == 200
+
     def test_preview_and_commit_flow(self, ingest_client):
         preview_response = ingest_client.post(
             "/api/v1/ingest/preview",
@@ -182,3 +265,61 @@ class TestIngestEndpoints:
         assert response.status_code == 200
         body = response.json()
         assert "providers" in body
+
+    def test_keyword_and_tag_dedupe_keeps_first_seen_order(self, ingest_client):
+        from yoshibookmark.api.state import state
+
+        service = state.ingestion_service
+        assert service._merge_keywords(
+            ["Alpha", "beta", "ALPHA", ""], ["gamma", "beta", "delta", "epsilon"]
+        ) == ["alpha", "beta", "gamma", "delta"]
+        assert service._normalize_list([" x ", "y", "x", "", "z"], 2) == ["x", "y"]
+        assert service._normalize_list("not-a-list", 6) == []
+
+    def test_preview_trace_is_serialized_once(self, ingest_client):
+        from yoshibookmark.api.state import state
+        from yoshibookmark.core.ai_inference import ProviderAttemptDiagnostics
+
+        service = state.ingestion_service
+        attempt = ProviderAttemptDiagnostics(
+            provider_id="openai",
+            model_name="gpt-4o-mini",
+            attempted=True,
+            succeeded=False,
+            failure_type="timeout",
+        )
+        service.inference_service.generate_structured_metadata.return_value = (None, [attempt])
+
+        preview = ingest_client.post(
+            "/api/v1/ingest/preview",
+            headers={"Authorization": "Bearer test-token"},
+            json={"url": "https://example.com", "page_title": "Example"},
+        ).json()
+
+        assert preview["provider_trace"][0]["failure_type"] == "timeout"
+        record = service.previews[preview["preview_id"]]
+        assert service.get_preview_trace(preview["preview_id"]) is record.serialized_trace
+        assert record.serialized_trace == preview["provider_trace"]
+
+    def test_preview_store_expires_from_front_and_is_bounded(self, ingest_client):
+        from datetime import timedelta
+
+        from yoshibookmark.api.state import state
+
+        service = state.ingestion_service
+        service.config.ingest_preview_max_entries = 2
+
+        def preview():
+            return ingest_client.post(
+                "/api/v1/ingest/preview",
+                headers={"Authorization": "Bearer test-token"},
+                json={"url": "https://example.com", "page_title": "Example"},
+            ).json()["preview_id"]
+
+        first, second, third = preview(), preview(), preview()
+        assert first not in service.previews
+        assert list(service.previews) == [second, third]
+
+        service.previews[second].expires_at -= timedelta(days=1)
+        service._cleanup_expired_previews()
+        assert list(service.previews) == [third]
@@ -41,9 +41,9 @@ def recall_client():
         from fastapi import FastAPI
         from fastapi.middleware.cors import CORSMiddleware
 
-        from yoshibookmark import api
         from yoshibookmark.api.bookmarks import router as bookmarks_router
         from yoshibookmark.api.recall import router as recall_router
+        from yoshibookmark.api.state import state
         from yoshibookmark.core.bookmark_manager import BookmarkManager
         from yoshibookmark.core.content_analyzer import ContentAnalyzer
         from yoshibookmark.core.recall_service import RecallService
@@ -53,25 +53,25 @@ def recall_client():
         app_config = real_cm.load_app_config()
         env_settings = real_cm.load_env_settings()
 
-        api.config_manager = real_cm
-        api.runtime_config = app_config
-        api.runtime_env_settings = env_settings
-        api.storage_manager = StorageManager()
+        state.config_manager = real_cm
+        state.runtime_config = app_config
+        state.runtime_env_settings = env_settings
+        state.storage_manager = StorageManager()
 
         async def init_storage():
-            await api.storage_manager.initialize(app_config.storage_locations)
+            await state.storage_manager.initialize(app_config.storage_locations)
 
         asyncio.run(init_storage())
-        api.bookmark_manager = BookmarkManager(api.storage_manager)
-        api.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
-        api.recall_service = RecallService(
+        state.bookmark_manager = BookmarkManager(state.storage_manager)
+        state.content_analyzer = ContentAnalyzer(timeout=app_config.screenshot_timeout)
+        state.recall_service = RecallService(
             config=app_config,
-            storage_manager=api.storage_manager,
+            storage_manager=state.storage_manager,
             env_settings=env_settings,
         )
 
         async def seed():
-            await api.bookmark_manager.create_bookmark(
+            await state.bookmark_manager.create_bookmark(
                 url="https://github.com/yoshiwatanabe/cmdai",
                 title="cmdai repository",
                 storage_location="test",
@@ -79,7 +79,7 @@ def recall_client():
                 description="source for cmdai project",
                 tags=["tool", "ai"],
             )
-            await api.bookmark_manager.create_bookmark(
+            await state.bookmark_manager.create_bookmark(
                 url="https://example.com/python-style",
                 title="Python style guide",
                 storage_location="test",
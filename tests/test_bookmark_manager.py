@@ -11,7 +11,7 @@ from yoshibookmark.core.bookmark_manager import (
     BookmarkManager,
     BookmarkNotFoundError,
 )
-from yoshibookmark.core.storage_manager import StorageManager
+from yoshibookmark.core.storage_manager import StorageError, StorageManager
 from yoshibookmark.models.storage import StorageLocation
 
 
@@ -60,6 +60,36 @@ class TestBookmarkManager:
                 storage_location="test",
             )
 
+    @pytest.mark.asyncio
+    async def test_create_bookmarks_bulk(self, manager):
+        """Test bulk creation shares a timestamp and saves every bookmark."""
+        bookmarks = await manager.create_bookmarks_bulk(
+            [
+                {"url": "https://example.com/a", "title": "A", "tags": ["x"]},
+                {"url": "https://example.com/b", "title": "B"},
+            ],
+            "test",
+        )
+
+        assert [b.title for b in bookmarks] == ["A", "B"]
+        assert bookmarks[0].created_at == bookmarks[1].created_at
+        for bookmark in bookmarks:
+            assert (await manager.get_bookmark(bookmark.id, "test")).url == bookmark.url
+
+    @pytest.mark.asyncio
+    async def test_create_bookmarks_bulk_validates_before_saving(self, manager):
+        """Test an invalid item aborts the bulk create before any write."""
+        with pytest.raises(ValidationError):
+            await manager.create_bookmarks_bulk(
+                [
+                    {"url": "https://example.com/a", "title": "A"},
+                    {"url": "not-a-url", "title": "B"},
+                ],
+                "test",
+            )
+
+        assert manager.list_bookmarks() == []
+
     @pytest.mark.asyncio
     async def test_get_existing_bookmark(self, manager):
         """Test getting an existing bookmark."""
@@ -239,6 +269,51 @@ class TestBookmarkManager:
 
         assert accessed.last_accessed is not None
 
+    @pytest.mark.asyncio
+    async def test_failed_save_leaves_indexed_bookmark_unchanged(self, manager, monkeypatch):
+        """Test timestamp updates do not leak into the index when the save fails."""
+        bookmark = await manager.create_bookmark(
+            url="https://example.com",
+            title="Test",
+            storage_location="test",
+        )
+
+        def fail_save(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(
+            "yoshibookmark.core.storage_manager.save_bookmark_to_file", fail_save
+        )
+
+        with pytest.raises(StorageError):
+            await manager.track_access(bookmark.id, "test")
+        with pytest.raises(StorageError):
+            await manager.delete_bookmark(bookmark.id, "test")
+
+        current = await manager.get_bookmark(bookmark.id, "test")
+        assert current.last_accessed is None
+        assert current.deleted is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_do_not_lose_fields(self, manager):
+        """Test racing mutations each apply to the latest saved version."""
+        import asyncio
+
+        bookmark = await manager.create_bookmark(
+            url="https://example.com",
+            title="Test",
+            storage_location="test",
+        )
+
+        await asyncio.gather(
+            manager.update_bookmark(bookmark.id, "test", title="Renamed"),
+            manager.track_access(bookmark.id, "test"),
+        )
+
+        current = await manager.get_bookmark(bookmark.id, "test")
+        assert current.title == "Renamed"
+        assert current.last_accessed is not None
+
     @pytest.mark.asyncio
     async def test_list_bookmarks_excludes_deleted(self, manager):
         """Test list_bookmarks excludes deleted by default."""
@@ -293,6 +293,22 @@ url: https://example.com
             assert str(loaded.url) == str(bookmark.url)
             assert loaded.title == bookmark.title
 
+    def test_non_ascii_bookmark_is_written_as_utf8(self):
+        """Test non-ASCII text is stored as UTF-8 and round-trips."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "bookmark.yaml"
+
+            bookmark = Bookmark(
+                url="https://example.com",
+                title="ブックマーク",
+                storage_location="default",
+            )
+
+            save_bookmark_to_file(bookmark, file_path)
+            assert "ブックマーク".encode("utf-8") in file_path.read_bytes()
+            assert file_path.read_text(encoding="utf-8") == serialize_bookmark(bookmark)
+            assert load_bookmark_from_file(file_path).title == "ブックマーク"
+
     def test_save_bookmark_creates_parent_directory(self):
         """Test saving bookmark creates parent directories."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -1,5 +1,7 @@
 """Tests for CLI commands."""
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -43,6 +45,20 @@ def _write_valid_setup(config_dir: Path) -> None:
     )
 
 
+def test_cli_import_skips_heavy_dependencies():
+    """Test importing the CLI (e.g. for --help) defers server/config imports."""
+    code = (
+        "import sys\n"
+        "from yoshibookmark.cli import cli\n"
+        "heavy = ('uvicorn', 'httpx', 'fastapi', 'pydantic', 'yaml', 'openai')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
 class TestCliDoctor:
     """Test yoshibookmark doctor command."""
 
@@ -106,3 +122,58 @@ class TestCliDoctor:
 
             assert result.exit_code == 1
             assert "OPENAI_API_KEY appears unset or placeholder" in result.output
+
+    def test_doctor_reports_unreachable_server(self, monkeypatch):
+        self._clear_env(monkeypatch)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_dir = Path(temp_dir) / ".yoshibookmark"
+            _write_valid_setup(config_dir)
+            runner = CliRunner()
+
+            result = runner.invoke(
+                cli,
+                ["doctor", "--config-dir", str(config_dir), "--api-url", "http://127.0.0.1:9"],
+            )
+
+            assert result.exit_code == 1
+            assert "[PASS] config.yaml parsed successfully" in result.output
+            assert "Server is not reachable at http://127.0.0.1:9/api/v1/health" in result.output
+
+
+class TestCliMigrateToOneDrive:
+    """Test yoshibookmark migrate-to-onedrive command."""
+
+    def test_migrate_skips_identical_and_reports_conflicts(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            config_dir = root / ".yoshibookmark"
+            ConfigManager(config_dir).save_app_config(AppConfig(storage_locations=[]))
+
+            source = root / "legacy"
+            target = root / "onedrive"
+            (source / "bookmarks").mkdir(parents=True)
+            (target / "bookmarks").mkdir(parents=True)
+            (source / "bookmarks" / "new.yaml").write_text("url: a")
+            (source / "bookmarks" / "same.yaml").write_bytes(b"x" * 70000)
+            (target / "bookmarks" / "same.yaml").write_bytes(b"x" * 70000)
+            (source / "bookmarks" / "differs.yaml").write_bytes(b"x" * 70000 + b"a")
+            (target / "bookmarks" / "differs.yaml").write_bytes(b"x" * 70000 + b"b")
+
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "migrate-to-onedrive",
+                    "--source-path",
+                    str(source),
+                    "--onedrive-path",
+                    str(target),
+                    "--config-dir",
+                    str(config_dir),
+                ],
+            )
+
+            assert result.exit_code == 0, result.output
+            assert "Files copied: 1" in result.output
+            assert "Files skipped (identical): 1" in result.output
+            assert "Conflicts not copied: 1" in result.output
+            assert (target / "bookmarks" / "new.yaml").read_text() == "url: a"
@@ -63,6 +63,16 @@ class TestAppConfig:
         assert config.storage_locations[0].name == "default"
         assert config.primary_storage_path is None
 
+    def test_ordered_providers_dedupes_and_appends_defaults(self):
+        """Test provider order normalization and memoization."""
+        config = AppConfig(storage_locations=[], agent_providers=[" Gemini", "gemini", ""])
+        assert config.ordered_providers == ("gemini", "openai", "azureopenai", "anthropic")
+        assert config.ordered_providers is config.ordered_providers
+
+        copied = config.model_copy(update={"agent_providers": ["anthropic"]})
+        assert copied.ordered_providers[0] == "anthropic"
+
+
 
 class TestConfigManager:
     """Test ConfigManager functionality."""
@@ -112,6 +122,17 @@ class TestConfigManager:
         assert "OPENAI_API_KEY=sk-test123" in content
         assert "EXTENSION_API_TOKEN=replace-with-random-local-token" in content
 
+    def test_load_env_settings_does_not_touch_environ(self, monkeypatch):
+        """Test .env values are read without being exported to os.environ."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("EXTENSION_API_TOKEN", raising=False)
+        self.config_manager.create_env_file(api_key="sk-test123")
+
+        settings = self.config_manager.load_env_settings()
+
+        assert settings.openai_api_key == "sk-test123"
+        assert "OPENAI_API_KEY" not in os.environ
+
     def test_create_azure_env_file(self):
         """Test creating Azure .env file."""
         self.config_manager.create_env_file(
@@ -147,6 +168,49 @@ class TestConfigManager:
         assert loaded.enable_semantic_search is False
         assert loaded.primary_storage_path == str(Path(self.temp_dir) / "storage")
 
+    def test_load_config_is_memoized_until_save(self):
+        """Test config.yaml is parsed once, copied per caller, and re-read after a save."""
+        storage = StorageLocation(
+            name="test",
+            path=str(Path(self.temp_dir) / "storage"),
+            is_current=True,
+        )
+        self.config_manager.save_app_config(AppConfig(storage_locations=[storage]))
+
+        first = self.config_manager.load_app_config()
+        # Callers get independent copies of the cached config.
+        first.openai_api_keys = ["sk-secret"]
+        second = self.config_manager.load_app_config()
+        assert second is not first
+        assert second.openai_api_keys == []
+        assert self.config_manager._app_config_cache[1].openai_api_keys == []
+
+        self.config_manager.save_app_config(
+            second.model_copy(update={"enable_semantic_search": False})
+        )
+        reloaded = self.config_manager.load_app_config()
+        assert reloaded.enable_semantic_search is False
+
+    def test_load_config_picks_up_external_edits(self):
+        """Test the config cache is keyed on the file's mtime and size."""
+        storage = StorageLocation(
+            name="test",
+            path=str(Path(self.temp_dir) / "storage"),
+            is_current=True,
+        )
+        self.config_manager.save_app_config(AppConfig(storage_locations=[storage]))
+        first = self.config_manager.load_app_config()
+
+        data = yaml.safe_load(self.config_manager.config_file.read_text())
+        data["enable_semantic_search"] = False
+        self.config_manager.config_file.write_text(yaml.safe_dump(data))
+        stat = self.config_manager.config_file.stat()
+        os.utime(self.config_manager.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        reloaded = self.config_manager.load_app_config()
+        assert reloaded is not first
+        assert reloaded.enable_semantic_search is False
+
     def test_onedrive_only_normalizes_to_single_storage(self):
         """Test onedrive_only config normalizes storage to primary path."""
         target_path = str(Path(self.temp_dir) / "onedrive")
@@ -166,6 +230,36 @@ class TestConfigManager:
         assert loaded.storage_locations[0].path == target_path
         assert loaded.storage_locations[0].is_current is True
 
+    def test_normalized_config_is_not_copied(self):
+        """Test normalization is a no-op for already-normalized configs."""
+        config = AppConfig(
+            storage_locations=[],
+            storage_mode="onedrive_only",
+            primary_storage_provider="onedrive_local",
+            primary_storage_path=str(Path(self.temp_dir) / "onedrive"),
+        )
+
+        normalized = self.config_manager._normalize_storage_config(config)
+        assert normalized is not config
+        assert self.config_manager._normalize_storage_config(normalized) is normalized
+
+    def test_onedrive_normalization_reuses_matching_storage(self):
+        """Test onedrive_only keeps an already-valid storage entry as-is."""
+        target_path = str(Path(self.temp_dir) / "onedrive")
+        storage = StorageLocation(
+            name="onedrive", path=target_path, is_current=True, is_default=True
+        )
+        config = AppConfig(
+            storage_locations=[storage],
+            storage_mode="onedrive_only",
+            primary_storage_provider="onedrive_local",
+        )
+
+        normalized = self.config_manager._normalize_storage_config(config)
+
+        assert normalized.primary_storage_path == target_path
+        assert normalized.storage_locations[0] is storage
+
     def test_invalid_yaml_raises_error(self):
         """Test invalid YAML raises ConfigError."""
         self.config_manager.config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -21,6 +21,13 @@ from yoshibookmark.utils.url_utils import (
 )
 
 
+def _use_transport(analyzer, handler):
+    """Route the analyzer's pooled client through an httpx mock transport."""
+    analyzer._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), follow_redirects=True
+    )
+
+
 class TestURLUtils:
     """Test URL utility functions."""
 
@@ -128,6 +135,40 @@ class TestContentAnalyzer:
 
             assert result["title"] == "Open Graph Title"
 
+    @pytest.mark.asyncio
+    async def test_analyze_page_with_nested_h1_only(self):
+        """Test the first <h1> is found even when nested in body markup."""
+        html_content = """
+        <html>
+            <body>
+                <div><section><p>Intro</p><h1> Heading Title </h1></section></div>
+                <h1>Second</h1>
+            </body>
+        </html>
+        """
+
+        analyzer = ContentAnalyzer()
+
+        with patch.object(analyzer, 'fetch_url', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = html_content
+
+            result = await analyzer.analyze_url("https://example.com")
+
+            assert result["title"] == "Heading Title"
+
+    def test_xpath_title_extraction(self):
+        """Test the lxml XPath title path keeps priority order and fallbacks."""
+        pytest.importorskip("lxml")
+        analyzer = ContentAnalyzer()
+
+        xml_declared = '<?xml version="1.0" encoding="iso-8859-1"?><title>Café</title>'
+        assert analyzer._extract_title_xpath(xml_declared, "https://example.com") == "Café"
+
+        og_before_h1 = '<h1>Heading</h1><meta property="og:title" content=" OG ">'
+        assert analyzer._extract_title_xpath(og_before_h1, "https://example.com") == "OG"
+
+        assert analyzer._extract_title_xpath("", "https://example.com") == "Example"
+
     @pytest.mark.asyncio
     async def test_extract_keywords_from_url(self):
         """Test keyword extraction from URL paths."""
@@ -143,64 +184,50 @@ class TestContentAnalyzer:
         """Test handling of request timeout."""
         analyzer = ContentAnalyzer(timeout=1)
 
-        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
-            mock_get.side_effect = httpx.TimeoutException("Timeout")
+        def handler(request):
+            raise httpx.TimeoutException("Timeout", request=request)
 
-            result = await analyzer.analyze_url("https://slow-site.com")
+        _use_transport(analyzer, handler)
+        result = await analyzer.analyze_url("https://slow-site.com")
 
-            assert "Timeout" in result["error"] or "timed out" in result["error"].lower()
-            assert result["title"] == "Slow-site"  # Fallback to domain
+        assert "Timeout" in result["error"] or "timed out" in result["error"].lower()
+        assert result["title"] == "Slow-site"  # Fallback to domain
 
     @pytest.mark.asyncio
     async def test_http_404_error(self):
         """Test handling of HTTP 404 error."""
         analyzer = ContentAnalyzer()
+        _use_transport(analyzer, lambda request: httpx.Response(404))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "404", request=MagicMock(), response=mock_response
-        )
-
-        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        result = await analyzer.analyze_url("https://example.com/notfound")
 
-            result = await analyzer.analyze_url("https://example.com/notfound")
-
-            assert result["error"] is not None
-            assert "404" in result["error"]
+        assert result["error"] is not None
+        assert "404" in result["error"]
 
     @pytest.mark.asyncio
     async def test_http_500_error(self):
         """Test handling of HTTP 500 error."""
         analyzer = ContentAnalyzer()
+        _use_transport(analyzer, lambda request: httpx.Response(500))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "500", request=MagicMock(), response=mock_response
-        )
-
-        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
-
-            result = await analyzer.analyze_url("https://example.com")
+        result = await analyzer.analyze_url("https://example.com")
 
-            assert result["error"] is not None
-            assert "500" in result["error"]
+        assert result["error"] is not None
+        assert "500" in result["error"]
 
     @pytest.mark.asyncio
     async def test_network_error_handling(self):
         """Test handling of network connection error."""
         analyzer = ContentAnalyzer()
 
-        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
-            mock_get.side_effect = httpx.NetworkError("Connection failed")
+        def handler(request):
+            raise httpx.NetworkError("Connection failed", request=request)
 
-            result = await analyzer.analyze_url("https://unreachable.com")
+        _use_transport(analyzer, handler)
+        result = await analyzer.analyze_url("https://unreachable.com")
 
-            assert result["error"] is not None
-            assert "Network" in result["error"] or "Connection" in result["error"]
+        assert result["error"] is not None
+        assert "Network" in result["error"] or "Connection" in result["error"]
 
     @pytest.mark.asyncio
     async def test_malformed_html_parsing(self):
@@ -234,40 +261,84 @@ class TestContentAnalyzer:
         analyzer = ContentAnalyzer()
         analyzer.max_response_size = 100  # Set low limit for testing
 
-        large_content = "x" * 1000
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = large_content.encode()
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.text = large_content
+        large_content = b"x" * 1000
+        _use_transport(
+            analyzer,
+            lambda request: httpx.Response(
+                200, headers={"content-type": "text/html"}, content=large_content
+            ),
+        )
 
-        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        result = await analyzer.analyze_url("https://example.com")
 
-            result = await analyzer.analyze_url("https://example.com")
+        assert result["error"] is not None
+        assert "too large" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_too_large_response_without_content_length(self):
+        """Test the size cap is enforced while streaming an unsized body."""
+        analyzer = ContentAnalyzer()
+        analyzer.max_response_size = 100
+        chunks_sent = []
+
+        class _Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for _ in range(5):
+                    chunks_sent.append(1)
+                    yield b"x" * 100_000
+
+        _use_transport(
+            analyzer,
+            lambda request: httpx.Response(
+                200, headers={"content-type": "text/html"}, stream=_Body()
+            ),
+        )
+
+        result = await analyzer.analyze_url("https://example.com")
 
-            assert result["error"] is not None
-            assert "too large" in result["error"].lower()
+        assert "too large" in result["error"].lower()
+        assert len(chunks_sent) == 1
 
     @pytest.mark.asyncio
     async def test_non_html_content_type(self):
         """Test handling of non-HTML content type."""
         analyzer = ContentAnalyzer()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "application/json"}
-        mock_response.content = b'{"test": "data"}'
-        mock_response.text = '{"test": "data"}'
+        _use_transport(
+            analyzer,
+            lambda request: httpx.Response(
+                200, headers={"content-type": "application/json"}, content=b'{"test": "data"}'
+            ),
+        )
+
+        # Should still process but may warn
+        result = await analyzer.analyze_url("https://api.example.com")
+
+        # Should return domain as title since no HTML structure
+        assert result["title"] is not None
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_pooled_client(self):
+        """Test page and favicon fetches reuse the same client until aclose()."""
+        analyzer = ContentAnalyzer()
+        clients = []
+        real_send = httpx.AsyncClient.send
+
+        async def recording_send(client, request, **kwargs):
+            clients.append(client)
+            return await real_send(client, request, **kwargs)
 
-        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        _use_transport(analyzer, lambda request: httpx.Response(404))
+        with patch('httpx.AsyncClient.send', new=recording_send):
+            await analyzer.analyze_url("https://example.com")
+            with tempfile.TemporaryDirectory() as temp_dir:
+                await analyzer.download_favicon("https://example.com", Path(temp_dir))
 
-            # Should still process but may warn
-            result = await analyzer.analyze_url("https://api.example.com")
+        assert len(clients) == 4
+        assert all(client is clients[0] for client in clients)
 
-            # Should return domain as title since no HTML structure
-            assert result["title"] is not None
+        await analyzer.aclose()
+        assert analyzer._client is None
 
     @pytest.mark.asyncio
     async def test_download_favicon_success(self):
@@ -294,6 +365,38 @@ class TestContentAnalyzer:
                 favicon_path = storage_path / result
                 assert favicon_path.exists()
 
+    @pytest.mark.asyncio
+    async def test_download_favicon_fetches_candidates_concurrently(self):
+        """Test candidates overlap but the earliest usable one still wins."""
+        import asyncio
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = Path(temp_dir)
+            analyzer = ContentAnalyzer()
+            cancelled = []
+
+            async def fake_get(client, url, **kwargs):
+                request = httpx.Request("GET", url)
+                if url.endswith("favicon.ico"):
+                    await asyncio.sleep(0.05)
+                    return httpx.Response(200, content=b"ico", request=request)
+                if url.endswith("favicon.png"):
+                    return httpx.Response(200, content=b"png", request=request)
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(url)
+                    raise
+
+            with patch('httpx.AsyncClient.get', new=fake_get):
+                result = await asyncio.wait_for(
+                    analyzer.download_favicon("https://example.com", storage_path), 2
+                )
+                await asyncio.sleep(0)
+
+            assert (storage_path / result).read_bytes() == b"ico"
+            assert cancelled == ["https://example.com/apple-touch-icon.png"]
+
     @pytest.mark.asyncio
     async def test_download_favicon_not_found(self):
         """Test favicon download when not found."""
@@ -0,0 +1,296 @@
+"""Tests for RecallService scoring."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from yoshibookmark.core import recall_service as recall_module
+from yoshibookmark.core.recall_service import RecallService
+from yoshibookmark.models.bookmark import Bookmark
+from yoshibookmark.models.config import AppConfig, EnvSettings
+
+_EMBEDDINGS = {
+    "python": [1.0, 0.0, 0.0],
+    "Python style guide": [3.0, 0.0, 4.0],
+    "Rust book": [0.0, 2.0, 0.0],
+    "Zero": [0.0, 0.0, 0.0],
+}
+
+
+class _FakeStorageManager:
+    def __init__(self, bookmarks):
+        self.bookmarks = bookmarks
+
+    def get_bookmarks(self, storage_name=None, include_deleted=False):
+        return list(self.bookmarks)
+
+    def get_all_storage_names(self):
+        return ["test"]
+
+    def get_bookmark_by_id(self, bookmark_id, storage_name=None):
+        return next((b for b in self.bookmarks if b.id == bookmark_id), None)
+
+
+def _bookmark(title):
+    return Bookmark(url="https://example.com", title=title, storage_location="test")
+
+
+def _service(bookmarks, monkeypatch):
+    service = RecallService(
+        config=AppConfig(storage_locations=[]),
+        storage_manager=_FakeStorageManager(bookmarks),
+        env_settings=EnvSettings(_env_file=None, openai_api_key="test-key"),
+    )
+
+    async def fake_embed(texts):
+        service.embed_calls.append(len(texts))
+        return [_EMBEDDINGS[text.split("\n")[0]] for text in texts]
+
+    service.embed_calls = []
+    monkeypatch.setattr(service, "_embed_texts", fake_embed)
+    return service
+
+
+class _FakeEmbeddingsClient:
+    def __init__(self):
+        self.batches = []
+        self.embeddings = self
+
+    async def create(self, model, input):
+        self.batches.append(len(input))
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+class TestSemanticScores:
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    async def test_scores_are_min_max_normalized_cosines(self, monkeypatch, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(recall_module, "np", None)
+
+        bookmarks = [_bookmark("Python style guide"), _bookmark("Rust book"), _bookmark("Zero")]
+        service = _service(bookmarks, monkeypatch)
+
+        scores = await service._semantic_scores("python", bookmarks)
+
+        # Raw cosines are 0.6, 0.0 and 0.0 (zero vector).
+        assert scores[bookmarks[0].id] == pytest.approx(1.0)
+        assert scores[bookmarks[1].id] == pytest.approx(0.0)
+        assert scores[bookmarks[2].id] == pytest.approx(0.0)
+
+        # Query plus all three bookmarks in one batch; cached vectors are reused.
+        await service._semantic_scores("python", bookmarks)
+        assert service.embed_calls == [4, 1]
+
+    async def test_mismatched_dimensions_score_zero(self, monkeypatch):
+        bookmarks = [_bookmark("Python style guide"), _bookmark("Rust book")]
+        service = _service(bookmarks, monkeypatch)
+        await service._semantic_scores("python", bookmarks)
+
+        service._embedding_cache[bookmarks[0].id].vector = recall_module._stored_vector([1.0, 0.0])
+        scores = await service._semantic_scores("python", bookmarks)
+
+        assert scores == {bookmarks[0].id: 0.5, bookmarks[1].id: 0.5}
+
+    async def test_short_embedding_response_is_rejected(self, monkeypatch):
+        bookmarks = [_bookmark("Python style guide"), _bookmark("Rust book")]
+        service = _service(bookmarks, monkeypatch)
+
+        async def short_embed(texts):
+            return [_EMBEDDINGS["python"]] * (len(texts) - 1)
+
+        monkeypatch.setattr(service, "_embed_texts", short_embed)
+        with pytest.raises(ValueError):
+            await service._semantic_scores("python", bookmarks)
+        assert service._embedding_cache == {}
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_cached_vectors_are_compact(self, monkeypatch, use_numpy):
+        if use_numpy:
+            np = pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(recall_module, "np", None)
+
+        vector = recall_module._stored_vector([3.0, 0.0, 4.0])
+
+        if use_numpy:
+            assert vector.dtype == np.float16
+        else:
+            assert vector.typecode == "f"
+        assert list(vector) == pytest.approx([0.6, 0.0, 0.8], abs=1e-3)
+
+    async def test_embed_texts_chunks_requests_and_keeps_order(self, monkeypatch):
+        monkeypatch.setattr(recall_module, "EMBEDDING_BATCH_SIZE", 2)
+        service = RecallService(
+            config=AppConfig(storage_locations=[]),
+            storage_manager=_FakeStorageManager([]),
+            env_settings=EnvSettings(_env_file=None, openai_api_key="test-key"),
+        )
+        client = _FakeEmbeddingsClient()
+        service._embedding_client = client
+
+        embeddings = await service._embed_texts(["a", "bb", "ccc"])
+
+        assert embeddings == [[1.0], [2.0], [3.0]]
+        assert client.batches == [2, 1]
+
+    async def test_embedding_client_is_async_and_reused(self):
+        service = RecallService(
+            config=AppConfig(storage_locations=[]),
+            storage_manager=_FakeStorageManager([]),
+            env_settings=EnvSettings(_env_file=None, openai_api_key="test-key"),
+        )
+
+        await service.prewarm()
+        client = service._get_embedding_client()
+        assert client is service._get_embedding_client()
+        assert type(client).__name__ == "AsyncOpenAI"
+
+        await service.aclose()
+        assert service._embedding_client is None
+
+
+class TestKeywordScores:
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_keyword_score_matches_substrings_per_field(self, monkeypatch, use_automaton):
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+            monkeypatch.setattr(recall_module, "AHO_CORASICK_MIN_TOKENS", 1)
+        else:
+            monkeypatch.setattr(recall_module, "ahocorasick", None)
+
+        bookmark = Bookmark(
+            url="https://example.com/python-style",
+            title="Python Style Guide",
+            keywords=["python", "guide"],
+            storage_location="test",
+        )
+        service = _service([bookmark], monkeypatch)
+        tokens = service._tokenize("python pyth rust")
+
+        score = service._keyword_score(tokens, bookmark)
+
+        # "python"/"pyth" hit title (4), keywords (3) and url (1); "rust" misses.
+        assert score == pytest.approx((8.0 / 11.5) * 2 / 3)
+        snippet, highlights = service._build_snippet(bookmark, tokens)
+        assert snippet == "Python Style Guide"
+        assert highlights == ["python", "pyth"]
+
+    def test_lowered_fields_are_cached_per_version(self, monkeypatch):
+        bookmark = _bookmark("Python Style Guide")
+        service = _service([bookmark], monkeypatch)
+
+        first = service._lowered_fields(bookmark)
+        assert first.title == "python style guide"
+        assert service._lowered_fields(bookmark) is first
+
+        edited = bookmark.model_copy(
+            update={"title": "Rust Book", "last_modified": bookmark.created_at.replace(year=2099)}
+        )
+        assert service._lowered_fields(edited).title == "rust book"
+
+
+class TestQuery:
+    async def test_query_ranks_identically_inline_and_in_thread(self, monkeypatch):
+        bookmarks = [
+            _bookmark("Python Style Guide"),
+            _bookmark("Python packaging"),
+            _bookmark("Rust book"),
+        ]
+        service = _service(bookmarks, monkeypatch)
+        service.config.enable_semantic_search = False
+
+        inline = await service.query("python guide", limit=5)
+        monkeypatch.setattr(recall_module, "RECALL_THREAD_MIN_BOOKMARKS", 0)
+        threaded = await service.query("python guide", limit=5)
+
+        assert threaded == inline
+        assert [r["bookmark"].title for r in inline["results"]] == [
+            "Python Style Guide",
+            "Python packaging",
+        ]
+        assert inline["results"][0]["highlights"] == ["python", "guide"]
+        assert (await service.query("python guide", limit=1))["total_returned"] == 1
+
+    async def test_inverted_index_follows_bookmark_edits(self, monkeypatch):
+        bookmark = _bookmark("Python Style Guide")
+        service = _service([bookmark], monkeypatch)
+        service.config.enable_semantic_search = False
+
+        assert service._keyword_candidates(["pyth"]) == set()
+        assert (await service.query("pyth"))["total_returned"] == 1
+        assert service._keyword_candidates(["pyth"]) == {bookmark.id}
+
+        edited = bookmark.model_copy(
+            update={"title": "Rust Book", "last_modified": bookmark.created_at.replace(year=2099)}
+        )
+        service.storage_manager.bookmarks = [edited]
+
+        assert (await service.query("rust"))["total_returned"] == 1
+        assert service._keyword_candidates(["style"]) == set()
+        # Still found through the URL field.
+        assert service._keyword_candidates(["example"]) == {bookmark.id}
+
+    async def test_index_follows_edits_that_keep_the_stamp(self, monkeypatch):
+        bookmark = _bookmark("Python Style Guide")
+        service = _service([bookmark], monkeypatch)
+        service.config.enable_semantic_search = False
+        assert (await service.query("style"))["total_returned"] == 1
+
+        # e.g. a hand-edited file reloaded with its last_modified untouched
+        service.storage_manager.bookmarks = [bookmark.model_copy(update={"title": "Rust Book"})]
+
+        assert (await service.query("style"))["total_returned"] == 0
+        assert (await service.query("rust"))["total_returned"] == 1
+        assert service._keyword_candidates(["style"]) == set()
+
+    async def test_index_drops_removed_bookmarks(self, monkeypatch):
+        kept = _bookmark("Python packaging")
+        removed = _bookmark("Python Style Guide")
+        service = _service([kept, removed], monkeypatch)
+        service.config.enable_semantic_search = False
+
+        assert (await service.query("pyth"))["total_returned"] == 2
+        assert service._keyword_candidates(["styl"]) == {removed.id}
+
+        service.storage_manager.bookmarks = [kept]
+        assert (await service.query("pyth"))["total_returned"] == 1
+        assert set(service._lowered_cache) == {kept.id}
+        assert "style" not in service._word_postings
+        # The remembered matches for "styl" follow the vocabulary.
+        assert service._keyword_candidates(["styl"]) == set()
+
+    async def test_pruning_during_pending_embedding_keeps_semantic_scores(self, monkeypatch):
+        kept = _bookmark("Python style guide")
+        removed = _bookmark("Rust book")
+        service = _service([kept, removed], monkeypatch)
+        await service.query("python")  # caches both embeddings
+
+        embed = service._embed_texts
+        waiting = asyncio.Event()
+        release = asyncio.Event()
+
+        async def gated_embed(texts):
+            if not waiting.is_set():
+                waiting.set()
+                await release.wait()
+            return await embed(texts)
+
+        monkeypatch.setattr(service, "_embed_texts", gated_embed)
+        pending = asyncio.create_task(service.query("python"))
+        await waiting.wait()
+
+        # A second query prunes the hard-deleted bookmark while the first awaits.
+        service.storage_manager.bookmarks = [kept]
+        await service.query("python")
+        assert removed.id not in service._embedding_cache
+
+        release.set()
+        result = await pending
+        assert result["mode"] == "hybrid"
+        assert result["fallback_reason"] is None
@@ -5,6 +5,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from pydantic import HttpUrl
 
 from yoshibookmark.core.storage_manager import StorageError, StorageManager
 from yoshibookmark.models.bookmark import Bookmark
@@ -105,6 +106,11 @@ class TestStorageManager:
             assert (Path(temp_dir) / "favicons").exists()
             assert (Path(temp_dir) / "screenshots").exists()
 
+            # Reloads do not recreate the structure.
+            (Path(temp_dir) / "screenshots").rmdir()
+            await manager.load_storage("test")
+            assert not (Path(temp_dir) / "screenshots").exists()
+
     @pytest.mark.asyncio
     async def test_save_and_load_bookmark(self):
         """Test saving and loading a bookmark."""
@@ -179,6 +185,67 @@ class TestStorageManager:
             folder1_bookmarks = manager.get_bookmarks("test", folder_path="folder1")
             assert len(folder1_bookmarks) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_bookmarks_filters_track_mutations(self):
+        """Test folder and deleted filters follow patches, deletes and reloads."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = StorageManager()
+            await manager.initialize([StorageLocation(name="test", path=temp_dir)])
+
+            bookmark = Bookmark(
+                url="https://example.com",
+                title="Moving",
+                folder_path="inbox",
+                storage_location="test",
+            )
+            await manager.save_bookmark(bookmark, "test")
+
+            await manager.patch_bookmark(bookmark.id, "test", {"folder_path": "archive"})
+            assert manager.get_bookmarks("test", folder_path="inbox") == []
+            assert [b.title for b in manager.get_bookmarks(folder_path="archive")] == ["Moving"]
+
+            await manager.patch_bookmark(bookmark.id, "test", {"deleted": True})
+            assert manager.get_bookmarks("test") == []
+            assert manager.get_bookmarks("test", folder_path="archive") == []
+            assert len(manager.get_bookmarks("test", True, folder_path="archive")) == 1
+
+            await manager.load_storage("test")
+            assert manager.get_bookmarks("test") == []
+            assert len(manager.get_bookmarks("test", True, folder_path="archive")) == 1
+
+            await manager.delete_bookmark_file(bookmark.id, "test")
+            assert manager.get_bookmarks("test", True, folder_path="archive") == []
+
+    @pytest.mark.asyncio
+    async def test_get_bookmarks_order_survives_moves(self):
+        """Test delete/restore and folder moves keep get_bookmarks order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = StorageManager()
+            await manager.initialize([StorageLocation(name="test", path=temp_dir)])
+
+            bookmarks = [
+                Bookmark(
+                    url=f"https://example.com/{title}",
+                    title=title,
+                    folder_path="inbox",
+                    storage_location="test",
+                )
+                for title in ("first", "second", "third")
+            ]
+            for bookmark in bookmarks:
+                await manager.save_bookmark(bookmark, "test")
+            first = bookmarks[0]
+            expected = ["first", "second", "third"]
+
+            await manager.patch_bookmark(first.id, "test", {"deleted": True})
+            await manager.patch_bookmark(first.id, "test", {"deleted": False})
+            assert [b.title for b in manager.get_bookmarks("test")] == expected
+
+            await manager.patch_bookmark(first.id, "test", {"folder_path": "archive"})
+            await manager.patch_bookmark(first.id, "test", {"folder_path": "inbox"})
+            assert [b.title for b in manager.get_bookmarks("test", folder_path="inbox")] == expected
+            assert [b.title for b in manager.get_bookmarks("test")] == expected
+
     @pytest.mark.asyncio
     async def test_delete_bookmark_file(self):
         """Test hard deleting a bookmark file."""
@@ -256,6 +323,100 @@ deleted: false
             assert len(manager.in_memory_index["test"]) == 1
             assert len(manager.conflicts["test"]) == 1
             assert "Conflict for bookmark ID" in manager.conflicts["test"][0]
+            assert manager.get_conflict_count() == 1
+
+            # Reloading replaces the storage's conflicts instead of adding to them
+            await manager.load_storage("test")
+            assert manager.get_conflict_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_load_resolves_ties_in_file_name_order(self, monkeypatch):
+        """Test batched loading keeps conflict resolution deterministic."""
+        from yoshibookmark.core import storage_manager as storage_module
+
+        monkeypatch.setattr(storage_module, "LOAD_BATCH_MIN_FILES", 1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bookmarks_dir = Path(temp_dir) / "bookmarks"
+            bookmarks_dir.mkdir(parents=True)
+
+            # Equal timestamps: the later file name wins the tie.
+            for name in ["c", "a", "b"]:
+                (bookmarks_dir / f"{name}.yaml").write_text(
+                    "id: same-id\n"
+                    "url: https://example.com\n"
+                    f"title: Title {name}\n"
+                    "storage_location: test\n"
+                    "created_at: '2026-02-04T10:00:00Z'\n"
+                )
+            (bookmarks_dir / "broken.yaml").write_text("invalid: yaml: content:")
+
+            manager = StorageManager()
+            await manager.initialize([StorageLocation(name="test", path=temp_dir)])
+
+            assert manager.get_bookmark_by_id("same-id", "test").title == "Title c"
+            assert list(manager.conflicts["test"]) == [
+                "Conflict for bookmark ID same-id: a.yaml vs b.yaml",
+                "Conflict for bookmark ID same-id: b.yaml vs c.yaml",
+            ]
+            assert len(manager.load_errors["test"]) == 1
+            assert manager.get_recent_conflicts(limit=1) == [
+                "[test] Conflict for bookmark ID same-id: b.yaml vs c.yaml"
+            ]
+
+    @pytest.mark.asyncio
+    async def test_reload_reuses_unchanged_bookmarks(self):
+        """Test reloads only re-parse files whose mtime or size changed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = StorageManager()
+            await manager.initialize([StorageLocation(name="test", path=temp_dir)])
+
+            kept = Bookmark(url="https://kept.example", title="Kept", storage_location="test")
+            edited = Bookmark(url="https://edit.example", title="Old", storage_location="test")
+            await manager.save_bookmark(kept, "test")
+            await manager.save_bookmark(edited, "test")
+            await manager.load_storage("test")
+            first_kept = manager.get_bookmark_by_id(kept.id, "test")
+
+            edited_file = Path(temp_dir) / "bookmarks" / f"{edited.id}.yaml"
+            edited_file.write_text(edited_file.read_text().replace("title: Old", "title: Edited"))
+            await manager.load_storage("test")
+
+            assert manager.get_bookmark_by_id(kept.id, "test") is first_kept
+            assert manager.get_bookmark_by_id(edited.id, "test").title == "Edited"
+
+            edited_file.unlink()
+            await manager.load_storage("test")
+            assert set(manager._parse_cache["test"]) == {
+                Path(temp_dir) / "bookmarks" / f"{kept.id}.yaml"
+            }
+
+    @pytest.mark.asyncio
+    async def test_cold_start_uses_persisted_index_cache(self, monkeypatch):
+        """Test a new manager reuses the index cache written by an earlier load."""
+        from yoshibookmark.core import storage_manager as storage_module
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = StorageLocation(name="test", path=temp_dir)
+            manager = StorageManager()
+            await manager.initialize([storage])
+            bookmark = Bookmark(url="https://example.com", title="Cached", storage_location="test")
+            await manager.save_bookmark(bookmark, "test")
+            await manager.load_storage("test")
+            assert (Path(temp_dir) / storage_module.INDEX_CACHE_PATH).exists()
+
+            parsed = []
+            original = storage_module.load_bookmark_from_file
+
+            def counting_load(path):
+                parsed.append(path.name)
+                return original(path)
+
+            monkeypatch.setattr(storage_module, "load_bookmark_from_file", counting_load)
+            restarted = StorageManager()
+            await restarted.initialize([storage])
+
+            assert parsed == []
+            assert restarted.get_bookmark_by_id(bookmark.id, "test") == bookmark
 
     @pytest.mark.asyncio
     async def test_nonexistent_storage_error(self):
@@ -310,6 +471,28 @@ deleted: false
                 # Restore permissions for cleanup
                 os.chmod(temp_dir, 0o755)
 
+    @pytest.mark.asyncio
+    async def test_access_check_uses_os_access(self, monkeypatch):
+        """Test storage access is checked without writing a probe file."""
+        from yoshibookmark.core import storage_manager as storage_module
+
+        checked = []
+
+        def fake_access(path, mode):
+            checked.append(mode)
+            return False
+
+        monkeypatch.setattr(storage_module.os, "access", fake_access)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = StorageLocation(name="test", path=temp_dir)
+
+            with pytest.raises(StorageError, match="Permission denied"):
+                await StorageManager().initialize([storage])
+            assert checked == [storage_module.os.W_OK | storage_module.os.X_OK]
+
+            # The write probe stays available as an opt-in check.
+            await StorageManager(write_probe=True).initialize([storage])
+
     @pytest.mark.asyncio
     async def test_get_storage_stats(self):
         """Test getting storage statistics."""
@@ -377,6 +560,103 @@ deleted: false
                 assert found2 is not None
                 assert found2.title == "In Storage 2"
 
+    @pytest.mark.asyncio
+    async def test_global_lookup_falls_back_when_id_is_removed(self):
+        """Test the ID -> storage map moves to another storage holding the ID."""
+        with tempfile.TemporaryDirectory() as temp_dir1:
+            with tempfile.TemporaryDirectory() as temp_dir2:
+                manager = StorageManager()
+                await manager.initialize(
+                    [
+                        StorageLocation(name="storage1", path=temp_dir1),
+                        StorageLocation(name="storage2", path=temp_dir2),
+                    ]
+                )
+
+                original = Bookmark(
+                    url="https://example.com", title="Original", storage_location="storage1"
+                )
+                copy = original.model_copy(update={"title": "Copy", "storage_location": "storage2"})
+                await manager.save_bookmark(original, "storage1")
+                await manager.save_bookmark(copy, "storage2")
+                assert manager.get_bookmark_by_id(original.id).title == "Original"
+
+                await manager.delete_bookmark_file(original.id, "storage1")
+                assert manager.get_bookmark_by_id(original.id).title == "Copy"
+
+                await manager.delete_bookmark_file(original.id, "storage2")
+                assert manager.get_bookmark_by_id(original.id) is None
+
+    @pytest.mark.asyncio
+    async def test_global_lookup_follows_reloads_and_config_order(self, monkeypatch):
+        """Test duplicate IDs resolve by storage order and survive external deletes."""
+        with tempfile.TemporaryDirectory() as temp_dir1:
+            with tempfile.TemporaryDirectory() as temp_dir2:
+                storages = [
+                    StorageLocation(name="storage1", path=temp_dir1),
+                    StorageLocation(name="storage2", path=temp_dir2),
+                ]
+                seed = StorageManager()
+                await seed.initialize(storages)
+                original = Bookmark(
+                    url="https://example.com", title="Original", storage_location="storage1"
+                )
+                copy = original.model_copy(update={"title": "Copy", "storage_location": "storage2"})
+                await seed.save_bookmark(original, "storage1")
+                await seed.save_bookmark(copy, "storage2")
+
+                # storage1 finishes loading last, yet still owns the ID.
+                load_storage = StorageManager.load_storage
+
+                async def slow_first(self, storage_name):
+                    if storage_name == "storage1":
+                        await asyncio.sleep(0.05)
+                    await load_storage(self, storage_name)
+
+                monkeypatch.setattr(StorageManager, "load_storage", slow_first)
+                manager = StorageManager()
+                await manager.initialize(storages)
+                assert manager.get_bookmark_by_id(original.id).title == "Original"
+
+                (Path(temp_dir1) / "bookmarks" / f"{original.id}.yaml").unlink()
+                await manager.load_storage("storage1")
+                assert manager.get_bookmark_by_id(original.id).title == "Copy"
+
+    @pytest.mark.asyncio
+    async def test_get_bookmarks_by_url_tracks_mutations(self):
+        """Test URL lookups see saves, patches and deletes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = StorageLocation(name="test", path=temp_dir)
+
+            manager = StorageManager()
+            await manager.initialize([storage])
+
+            bookmark = Bookmark(
+                url="https://example.com/page",
+                title="Page",
+                storage_location="test",
+            )
+            assert manager.get_bookmarks_by_url("https://example.com/page") == []
+
+            await manager.save_bookmark(bookmark, "test")
+            found = manager.get_bookmarks_by_url("https://example.com/page/")
+            assert [b.id for b in found] == [bookmark.id]
+
+            url_index = manager._url_index
+            moved = {"url": HttpUrl("https://example.com/new")}
+            await manager.patch_bookmark(bookmark.id, "test", moved)
+            assert manager._url_index is url_index
+            assert manager.get_bookmarks_by_url("https://example.com/page") == []
+            restored = {"url": HttpUrl("https://example.com/page")}
+            await manager.patch_bookmark(bookmark.id, "test", restored)
+
+            await manager.patch_bookmark(bookmark.id, "test", {"deleted": True})
+            assert manager.get_bookmarks_by_url("https://example.com/page") == []
+            assert len(manager.get_bookmarks_by_url("https://example.com/page", True)) == 1
+
+            await manager.delete_bookmark_file(bookmark.id, "test")
+            assert manager.get_bookmarks_by_url("https://example.com/page", True) == []
+
     @pytest.mark.asyncio
     async def test_concurrent_saves(self):
         """Test concurrent bookmark saves with file locking."""